@@ -7,7 +7,8 @@ import asyncio
 import sys
 
 
-def main(argv: list[str] | None = None) -> None:
+def _make_parser() -> argparse.ArgumentParser:
+    """Build the ``docfold`` argument parser and its subcommands."""
     import docfold
 
     parser = argparse.ArgumentParser(
@@ -98,6 +99,11 @@ def main(argv: list[str] | None = None) -> None:
     )
     update_p.add_argument("--json", action="store_true", help="Emit JSON (with --check).")
 
+    return parser
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = _make_parser()
     args = parser.parse_args(argv)
 
     if args.command is None:
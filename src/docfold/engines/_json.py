@@ -0,0 +1,42 @@
+"""JSON serialization shared by engine output and evaluation paths.
+
+Uses ``orjson`` when installed (``pip install docfold[speedups]``) and falls
+back to the stdlib ``json`` module otherwise.  Output is always a ``str``
+with non-ASCII characters left unescaped.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps_json(obj: Any, *, indent: int | None = None) -> str:
+    """Serialize *obj* to a JSON string (``ensure_ascii=False`` semantics).
+
+    NumPy arrays are serialized natively when orjson is available.  Objects
+    orjson rejects (e.g. non-``str`` dict keys, >64-bit ints) fall back to the
+    stdlib encoder so the result never depends on which backend is installed.
+    orjson only indents by two spaces; other *indent* values use the stdlib.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=indent, ensure_ascii=False)
+
+
+def loads_json(data: bytes | str) -> Any:
+    """Parse JSON from UTF-8 *data*, straight from ``bytes`` when possible."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,54 @@
+"""Cached dependency probes for ``DocumentEngine.is_available``.
+
+The router calls ``is_available()`` on every ``process()`` call.  For an engine
+whose backend is not installed, each call used to repeat a failed import
+that walks ``sys.path`` again.  Probe outcomes are now cached per module name.
+
+``sys.modules`` is consulted first, so a module imported later in the process,
+or blocked with ``sys.modules[name] = None``, is reflected immediately.  Use
+:func:`clear` after installing a backend into a running process.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import importlib.util
+import sys
+
+
+def can_import(name: str) -> bool:
+    """Return whether ``import name`` succeeds; any exception counts as failure."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    return _import_succeeds(name)
+
+
+def has_spec(name: str) -> bool:
+    """Return whether *name* can be found without importing it."""
+    if name in sys.modules:
+        return sys.modules[name] is not None
+    return _spec_found(name)
+
+
+def clear() -> None:
+    """Forget all cached probe results."""
+    _import_succeeds.cache_clear()
+    _spec_found.cache_clear()
+
+
+@functools.cache
+def _import_succeeds(name: str) -> bool:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        return False
+    return True
+
+
+@functools.cache
+def _spec_found(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
@@ -12,17 +12,13 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp",
-    "docx", "xlsx", "pptx", "html",
-}
-
 
 class AzureDocIntEngine(DocumentEngine):
     """Adapter for Azure Document Intelligence (formerly Form Recognizer).
@@ -35,6 +31,11 @@ class AzureDocIntEngine(DocumentEngine):
     See https://learn.microsoft.com/en-us/azure/ai-services/document-intelligence/
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp",
+        "docx", "xlsx", "pptx", "html",
+    })
+
     def __init__(
         self,
         endpoint: str | None = None,
@@ -50,8 +51,8 @@ class AzureDocIntEngine(DocumentEngine):
         return "azure_docint"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -61,12 +62,7 @@ class AzureDocIntEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import azure.ai.documentintelligence  # noqa: F401
-
-            return bool(self._endpoint and self._key)
-        except ImportError:
-            return False
+        return bool(self._endpoint and self._key) and can_import("azure.ai.documentintelligence")
 
     async def process(
         self,
@@ -89,7 +89,7 @@ class BoundingBox:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class EngineResult:
     """Unified result returned by all structuring engines.
 
@@ -145,8 +145,12 @@ class DocumentEngine(ABC):
 
     @property
     @abstractmethod
-    def supported_extensions(self) -> set[str]:
-        """File extensions this engine can handle, without dots (e.g. ``{'pdf', 'docx'}``)."""
+    def supported_extensions(self) -> set[str] | frozenset[str]:
+        """File extensions this engine can handle, without dots (e.g. ``{'pdf', 'docx'}``).
+
+        Built-in engines return their ``SUPPORTED_EXTENSIONS`` class attribute,
+        a shared ``frozenset`` that callers can read without an instance.
+        """
         ...
 
     @abstractmethod
@@ -18,14 +18,14 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp"}
-
 
 class ChandraEngine(DocumentEngine):
     """Adapter for Datalab Chandra OCR 2 (document → Markdown/HTML/JSON).
@@ -36,6 +36,10 @@ class ChandraEngine(DocumentEngine):
     See https://github.com/datalab-to/chandra
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp",
+    })
+
     def __init__(
         self,
         method: str = "vllm",
@@ -58,8 +62,8 @@ class ChandraEngine(DocumentEngine):
         return "chandra"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -70,14 +74,9 @@ class ChandraEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import chandra  # noqa: F401
-            if self._method == "hf":
-                import torch  # noqa: F401
-                import transformers  # noqa: F401
-            return True
-        except Exception:
+        if not can_import("chandra"):
             return False
+        return self._method != "hf" or (can_import("torch") and can_import("transformers"))
 
     async def process(
         self,
@@ -108,13 +107,12 @@ class ChandraEngine(DocumentEngine):
     def _do_process(
         self, file_path: str, output_format: OutputFormat,
     ) -> tuple[str, int]:
-        from pathlib import Path
 
         from chandra.model.schema import BatchInputItem
         from chandra.output import parse_markdown
         from PIL import Image
 
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
 
         # Convert input to list of PIL images (one per page)
         images: list[Image.Image] = []
@@ -7,18 +7,13 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "pptx", "xlsx", "html",
-    "png", "jpg", "jpeg", "tiff", "tif",
-    "wav", "mp3", "vtt",
-}
-
 
 class DoclingEngine(DocumentEngine):
     """Adapter for the Docling document conversion framework.
@@ -26,6 +21,12 @@ class DoclingEngine(DocumentEngine):
     See https://github.com/docling-project/docling
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "pptx", "xlsx", "html",
+        "png", "jpg", "jpeg", "tiff", "tif",
+        "wav", "mp3", "vtt",
+    })
+
     def __init__(self, pipeline: str = "standard", ocr_enabled: bool = True) -> None:
         self._pipeline = pipeline  # "standard" or "vlm"
         self._ocr_enabled = ocr_enabled
@@ -36,8 +37,8 @@ class DoclingEngine(DocumentEngine):
         return "docling"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -47,11 +48,7 @@ class DoclingEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import docling  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return can_import("docling")
 
     def _get_converter(self):  # noqa: ANN202
         """Lazy-init the Docling DocumentConverter."""
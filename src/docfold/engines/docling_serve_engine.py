@@ -18,17 +18,13 @@ import mimetypes
 import os
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "pptx", "xlsx", "html",
-    "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp",
-}
-
 
 class DoclingServeEngine(DocumentEngine):
     """Adapter for a remote docling-serve instance.
@@ -39,6 +35,11 @@ class DoclingServeEngine(DocumentEngine):
         result = await engine.process("scan.pdf", output_format=OutputFormat.HTML)
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "pptx", "xlsx", "html",
+        "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp",
+    })
+
     def __init__(
         self,
         base_url: str | None = None,
@@ -59,8 +60,8 @@ class DoclingServeEngine(DocumentEngine):
         return "docling_serve"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -73,11 +74,7 @@ class DoclingServeEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import requests  # noqa: F401
-            return bool(self._base_url)
-        except ImportError:
-            return False
+        return bool(self._base_url) and can_import("requests")
 
     async def process(
         self,
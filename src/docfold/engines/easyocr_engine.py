@@ -9,15 +9,14 @@ import logging
 import os
 import tempfile
 import time
-from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp", "pdf"}
-
 
 class EasyOCREngine(DocumentEngine):
     """OCR-based extraction using EasyOCR.
@@ -26,6 +25,10 @@ class EasyOCREngine(DocumentEngine):
     recognition. For PDFs, pages are rendered to images first.
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp", "pdf",
+    })
+
     def __init__(self, lang: list[str] | None = None, gpu: bool = True) -> None:
         self._lang = lang or ["en"]
         self._gpu = gpu
@@ -35,20 +38,15 @@ class EasyOCREngine(DocumentEngine):
         return "easyocr"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(confidence=True)
 
     def is_available(self) -> bool:
-        try:
-            import easyocr  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return can_import("easyocr")
 
     async def process(
         self,
@@ -75,7 +73,7 @@ class EasyOCREngine(DocumentEngine):
         )
 
     def _run_ocr(self, file_path: str) -> tuple[str, float | None]:
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
 
         if ext == "pdf":
             return self._ocr_pdf(file_path)
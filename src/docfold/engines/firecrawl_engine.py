@@ -21,15 +21,13 @@ import logging
 import os
 import time
 import urllib.request
-from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "docx", "png", "jpg", "jpeg", "tiff", "html", "htm", "xml"}
-
 _TEXT_EXTENSIONS = {"html", "htm", "xml"}
 
 
@@ -45,6 +43,10 @@ class FirecrawlEngine(DocumentEngine):
         result = await engine.process("report.pdf")
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "png", "jpg", "jpeg", "tiff", "html", "htm", "xml",
+    })
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -65,8 +67,8 @@ class FirecrawlEngine(DocumentEngine):
         return "firecrawl"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -110,7 +112,7 @@ class FirecrawlEngine(DocumentEngine):
         file_path: str,
         output_format: OutputFormat,
     ) -> tuple[str, dict[str, Any]]:
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
 
         fmt_map = {
             OutputFormat.MARKDOWN: "markdown",
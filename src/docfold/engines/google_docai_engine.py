@@ -13,26 +13,14 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import MIME_MAP, extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif", "gif", "bmp", "webp"}
-
-_MIME_MAP = {
-    "pdf": "application/pdf",
-    "png": "image/png",
-    "jpg": "image/jpeg",
-    "jpeg": "image/jpeg",
-    "tiff": "image/tiff",
-    "tif": "image/tiff",
-    "gif": "image/gif",
-    "bmp": "image/bmp",
-    "webp": "image/webp",
-}
-
 
 class GoogleDocAIEngine(DocumentEngine):
     """Adapter for Google Document AI.
@@ -43,6 +31,10 @@ class GoogleDocAIEngine(DocumentEngine):
     See https://cloud.google.com/document-ai
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "gif", "bmp", "webp",
+    })
+
     def __init__(
         self,
         project_id: str | None = None,
@@ -58,8 +50,8 @@ class GoogleDocAIEngine(DocumentEngine):
         return "google_docai"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -69,12 +61,9 @@ class GoogleDocAIEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            from google.cloud import documentai  # noqa: F401
-
-            return bool(self._project_id and self._processor_id)
-        except ImportError:
+        if not (self._project_id and self._processor_id):
             return False
+        return can_import("google.cloud.documentai")
 
     async def process(
         self,
@@ -117,8 +106,8 @@ class GoogleDocAIEngine(DocumentEngine):
             self._project_id, self._location, self._processor_id
         )
 
-        ext = os.path.splitext(file_path)[1].lstrip(".").lower()
-        mime_type = _MIME_MAP.get(ext, "application/octet-stream")
+        ext = extension_of(file_path)
+        mime_type = MIME_MAP.get(ext, "application/octet-stream")
 
         with open(file_path, "rb") as f:
             raw_document = documentai.RawDocument(content=f.read(), mime_type=mime_type)
@@ -16,7 +16,7 @@ import json
 import logging
 import shutil
 import time
-from typing import Any
+from typing import Any, ClassVar
 
 from docfold.engines.base import (
     BoundingBox,
@@ -28,12 +28,6 @@ from docfold.engines.base import (
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
-    "odt", "rtf", "odp", "csv", "tsv",
-    "png", "jpg", "jpeg", "gif", "bmp", "tiff", "tif", "webp",
-}
-
 
 class LiteParseEngine(DocumentEngine):
     """Adapter for LiteParse (run-llama/liteparse).
@@ -42,6 +36,12 @@ class LiteParseEngine(DocumentEngine):
     JSON output.  Supports bounding boxes and confidence scores out of the box.
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
+        "odt", "rtf", "odp", "csv", "tsv",
+        "png", "jpg", "jpeg", "gif", "bmp", "tiff", "tif", "webp",
+    })
+
     def __init__(
         self,
         cli_path: str = "lit",
@@ -63,8 +63,8 @@ class LiteParseEngine(DocumentEngine):
         return "liteparse"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
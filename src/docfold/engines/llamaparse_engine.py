@@ -11,17 +11,13 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
-    "html", "htm", "png", "jpg", "jpeg", "csv", "epub",
-}
-
 
 class LlamaParseEngine(DocumentEngine):
     """Adapter for LlamaParse (LlamaIndex Cloud).
@@ -32,6 +28,11 @@ class LlamaParseEngine(DocumentEngine):
     See https://docs.llamaindex.ai/en/stable/llama_cloud/llama_parse/
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
+        "html", "htm", "png", "jpg", "jpeg", "csv", "epub",
+    })
+
     def __init__(self, api_key: str | None = None, result_type: str = "markdown") -> None:
         self._api_key = api_key or os.getenv("LLAMA_CLOUD_API_KEY")
         self._result_type = result_type
@@ -41,20 +42,15 @@ class LlamaParseEngine(DocumentEngine):
         return "llamaparse"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(table_structure=True, heading_detection=True)
 
     def is_available(self) -> bool:
-        try:
-            import llama_parse  # noqa: F401
-
-            return bool(self._api_key)
-        except ImportError:
-            return False
+        return bool(self._api_key) and can_import("llama_parse")
 
     async def process(
         self,
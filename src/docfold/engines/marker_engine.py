@@ -23,8 +23,9 @@ import logging
 import os
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import (
     BoundingBox,
     DocumentEngine,
@@ -35,12 +36,6 @@ from docfold.engines.base import (
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
-    "odt", "odp", "ods", "html", "epub",
-    "png", "jpg", "jpeg", "webp", "gif", "tiff",
-}
-
 _API_BASE = "https://www.datalab.to/api/v1/marker"
 _DEFAULT_POLL_INTERVAL = 2
 _DEFAULT_MAX_POLLS = 300
@@ -87,6 +82,12 @@ class MarkerEngine(DocumentEngine):
     See https://documentation.datalab.to/
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
+        "odt", "odp", "ods", "html", "epub",
+        "png", "jpg", "jpeg", "webp", "gif", "tiff",
+    })
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -115,8 +116,8 @@ class MarkerEngine(DocumentEngine):
         return "marker"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -126,11 +127,7 @@ class MarkerEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import requests  # noqa: F401
-            return bool(self._api_key)
-        except ImportError:
-            return False
+        return bool(self._api_key) and can_import("requests")
 
     async def process(
         self,
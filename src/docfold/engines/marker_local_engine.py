@@ -10,17 +10,13 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "pptx", "xlsx", "html", "epub",
-    "png", "jpg", "jpeg", "webp", "gif", "tiff",
-}
-
 # Lazy-loaded; patchable in tests.
 PdfConverter: Any = None
 create_model_dict: Any = None
@@ -49,6 +45,11 @@ class MarkerLocalEngine(DocumentEngine):
     See https://github.com/VikParuchuri/marker
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "pptx", "xlsx", "html", "epub",
+        "png", "jpg", "jpeg", "webp", "gif", "tiff",
+    })
+
     def __init__(
         self,
         *,
@@ -64,8 +65,8 @@ class MarkerLocalEngine(DocumentEngine):
         return "marker_local"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -75,11 +76,7 @@ class MarkerLocalEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import marker  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return can_import("marker")
 
     def _get_converter(self) -> Any:
         """Lazy-init the converter (loads models on first call)."""
@@ -13,8 +13,9 @@ import asyncio
 import json
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import (
     DocumentEngine,
     EngineCapabilities,
@@ -24,23 +25,6 @@ from docfold.engines.base import (
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    # Office
-    "docx", "pptx", "xlsx", "xls",
-    # PDFs
-    "pdf",
-    # Web / markup
-    "html", "htm", "xml",
-    # Tabular / structured data
-    "csv", "tsv", "json",
-    # Images (markitdown runs OCR/LLM captioning when configured)
-    "png", "jpg", "jpeg", "gif", "bmp", "tiff", "tif", "webp",
-    # Audio (transcription)
-    "mp3", "wav", "m4a",
-    # eBooks / archives / misc
-    "epub", "zip", "txt", "md",
-}
-
 
 class MarkItDownEngine(DocumentEngine):
     """Adapter for Microsoft's ``markitdown`` library.
@@ -50,6 +34,23 @@ class MarkItDownEngine(DocumentEngine):
     block the event loop.
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        # Office
+        "docx", "pptx", "xlsx", "xls",
+        # PDFs
+        "pdf",
+        # Web / markup
+        "html", "htm", "xml",
+        # Tabular / structured data
+        "csv", "tsv", "json",
+        # Images (markitdown runs OCR/LLM captioning when configured)
+        "png", "jpg", "jpeg", "gif", "bmp", "tiff", "tif", "webp",
+        # Audio (transcription)
+        "mp3", "wav", "m4a",
+        # eBooks / archives / misc
+        "epub", "zip", "txt", "md",
+    })
+
     def __init__(self, enable_plugins: bool = False) -> None:
         self._enable_plugins = enable_plugins
         self._converter: Any = None
@@ -59,8 +60,8 @@ class MarkItDownEngine(DocumentEngine):
         return "markitdown"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -73,11 +74,7 @@ class MarkItDownEngine(DocumentEngine):
         # raise non-ImportError exceptions (e.g. a broken PyO3 binding).
         # Treat any import failure as "unavailable" so a broken env cannot
         # knock out the whole router / benchmark harness.
-        try:
-            import markitdown  # noqa: F401
-            return True
-        except Exception:  # noqa: BLE001
-            return False
+        return can_import("markitdown")
 
     def _get_converter(self) -> Any:
         if self._converter is None:
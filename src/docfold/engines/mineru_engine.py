@@ -16,14 +16,13 @@ import logging
 import os
 import tempfile
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf"}
-
 # Lazy-loaded at first use; patchable in tests.
 do_parse: Any = None
 read_fn: Any = None
@@ -47,6 +46,8 @@ class MinerUEngine(DocumentEngine):
     See https://github.com/opendatalab/MinerU
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({"pdf"})
+
     def __init__(
         self,
         config_path: str | None = None,
@@ -64,8 +65,8 @@ class MinerUEngine(DocumentEngine):
         return "mineru"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -74,11 +75,7 @@ class MinerUEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import mineru  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return can_import("mineru")
 
     async def process(
         self,
@@ -11,14 +11,13 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp"}
-
 
 class MistralOCREngine(DocumentEngine):
     """Adapter for Mistral's OCR API.
@@ -30,6 +29,10 @@ class MistralOCREngine(DocumentEngine):
     See https://docs.mistral.ai/capabilities/document/
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp",
+    })
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -43,20 +46,15 @@ class MistralOCREngine(DocumentEngine):
         return "mistral_ocr"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(table_structure=True, heading_detection=True)
 
     def is_available(self) -> bool:
-        try:
-            import mistralai  # noqa: F401
-
-            return bool(self._api_key)
-        except ImportError:
-            return False
+        return bool(self._api_key) and can_import("mistralai")
 
     async def process(
         self,
@@ -13,14 +13,13 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf"}
-
 
 class NougatEngine(DocumentEngine):
     """Adapter for Meta Nougat (academic PDF → Markdown).
@@ -31,6 +30,8 @@ class NougatEngine(DocumentEngine):
     See https://github.com/facebookresearch/nougat
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({"pdf"})
+
     def __init__(
         self,
         model: str = "facebook/nougat-small",
@@ -46,8 +47,8 @@ class NougatEngine(DocumentEngine):
         return "nougat"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -58,11 +59,7 @@ class NougatEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import nougat  # noqa: F401
-            return True
-        except Exception:
-            return False
+        return can_import("nougat")
 
     async def process(
         self,
@@ -17,8 +17,9 @@ import os
 import shutil
 import tempfile
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import (
     BoundingBox,
     DocumentEngine,
@@ -29,9 +30,6 @@ from docfold.engines.base import (
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf"}
-
-
 # Upstream block type -> docfold canonical type.
 _TYPE_MAP: dict[str, str] = {
     "heading": "SectionHeader",
@@ -117,6 +115,8 @@ def _find_output_file(output_dir: str, suffixes: tuple[str, ...]) -> str | None:
 class OpenDataLoaderEngine(DocumentEngine):
     """Adapter for ``opendataloader-pdf`` (Java CLI via Python wrapper)."""
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({"pdf"})
+
     def __init__(
         self,
         *,
@@ -145,8 +145,8 @@ class OpenDataLoaderEngine(DocumentEngine):
         return "opendataloader"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -158,13 +158,7 @@ class OpenDataLoaderEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        if shutil.which("java") is None:
-            return False
-        try:
-            import opendataloader_pdf  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return shutil.which("java") is not None and can_import("opendataloader_pdf")
 
     # ------------------------------------------------------------------
     # Processing
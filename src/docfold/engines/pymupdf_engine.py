@@ -7,8 +7,9 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import (
     BoundingBox,
     DocumentEngine,
@@ -19,33 +20,29 @@ from docfold.engines.base import (
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf"}
-
 
 class PyMuPDFEngine(DocumentEngine):
-    """Lightweight adapter for PyMuPDF (fitz) text extraction.
+    """Lightweight adapter for PyMuPDF text extraction.
 
     Best for digital (non-scanned) PDFs where layout analysis is not critical.
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({"pdf"})
+
     @property
     def name(self) -> str:
         return "pymupdf"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(bounding_boxes=True)
 
     def is_available(self) -> bool:
-        try:
-            import fitz  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return can_import("pymupdf")
 
     async def process(
         self,
@@ -77,52 +74,53 @@ class PyMuPDFEngine(DocumentEngine):
     def _extract(
         self, file_path: str, output_format: OutputFormat,
     ) -> tuple[str, int, list[dict[str, Any]]]:
-        import fitz
-
-        doc = fitz.open(file_path)
-        pages_text: list[str] = []
-        bboxes: list[dict[str, Any]] = []
-
-        for page_idx, page in enumerate(doc):
-            pages_text.append(page.get_text())
-            page_num = page_idx + 1
-
-            # Extract block-level bounding boxes via get_text("dict")
-            try:
-                rect = page.rect
-                pw = float(rect.width)
-                ph = float(rect.height)
-                page_dict = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)
-                for block_idx, block in enumerate(page_dict.get("blocks", [])):
-                    bbox_raw = block.get("bbox")
-                    if not bbox_raw:
-                        continue
-                    # type 0 = text block, type 1 = image block
-                    block_type = "Image" if block.get("type") == 1 else "Text"
-                    # Collect text from spans within lines
-                    text = ""
-                    if block_type == "Text":
-                        lines = block.get("lines", [])
-                        spans_text: list[str] = []
-                        for line in lines:
-                            for span in line.get("spans", []):
-                                spans_text.append(span.get("text", ""))
-                        text = " ".join(spans_text)
-                    bboxes.append(BoundingBox(
-                        type=block_type,
-                        bbox=list(bbox_raw),
-                        page=page_num,
-                        text=text,
-                        id=f"p{page_num}-b{block_idx}",
-                        page_width=pw,
-                        page_height=ph,
-                    ).to_dict())
-            except Exception as exc:
-                logger.debug("Failed to extract bboxes from page %d: %s", page_num, exc)
+        import pymupdf
+
+        from docfold.utils._pdf_cache import borrow_pdf
+
+        with borrow_pdf(file_path) as doc:
+            pages_text: list[str] = []
+            bboxes: list[dict[str, Any]] = []
+
+            for page_idx, page in enumerate(doc):
+                pages_text.append(page.get_text())
+                page_num = page_idx + 1
+
+                # Extract block-level bounding boxes via get_text("dict")
+                try:
+                    rect = page.rect
+                    pw = float(rect.width)
+                    ph = float(rect.height)
+                    page_dict = page.get_text("dict", flags=pymupdf.TEXT_PRESERVE_WHITESPACE)
+                    for block_idx, block in enumerate(page_dict.get("blocks", [])):
+                        bbox_raw = block.get("bbox")
+                        if not bbox_raw:
+                            continue
+                        # type 0 = text block, type 1 = image block
+                        block_type = "Image" if block.get("type") == 1 else "Text"
+                        # Collect text from spans within lines
+                        text = ""
+                        if block_type == "Text":
+                            lines = block.get("lines", [])
+                            spans_text: list[str] = []
+                            for line in lines:
+                                for span in line.get("spans", []):
+                                    spans_text.append(span.get("text", ""))
+                            text = " ".join(spans_text)
+                        bboxes.append(BoundingBox(
+                            type=block_type,
+                            bbox=list(bbox_raw),
+                            page=page_num,
+                            text=text,
+                            id=f"p{page_num}-b{block_idx}",
+                            page_width=pw,
+                            page_height=ph,
+                        ).to_dict())
+                except Exception as exc:
+                    logger.debug("Failed to extract bboxes from page %d: %s", page_num, exc)
 
         page_count = len(pages_text)
         full_text = "\n\n".join(pages_text)
-        doc.close()
 
         if output_format == OutputFormat.JSON:
             import json
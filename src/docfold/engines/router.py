@@ -7,11 +7,11 @@ import logging
 import os
 import time
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from pathlib import Path
+from dataclasses import asdict, dataclass, field
 from typing import Any, Protocol
 
 from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
@@ -163,6 +163,8 @@ class EngineRouter:
         allowed_engines: set[str] | None = None,
     ) -> None:
         self._engines: dict[str, DocumentEngine] = {}
+        # name -> (sorted extensions, capabilities dict), fixed at registration
+        self._static_info: dict[str, tuple[list[str], dict[str, bool]]] = {}
         self._fallback_order = fallback_order
         self._allowed_engines = allowed_engines
         for engine in engines or []:
@@ -173,8 +175,16 @@ class EngineRouter:
     # ------------------------------------------------------------------
 
     def register(self, engine: DocumentEngine) -> None:
-        """Add an engine to the registry."""
+        """Add an engine to the registry.
+
+        Its extensions and capabilities are read once here; only
+        availability is re-checked by :meth:`list_engines`.
+        """
         self._engines[engine.name] = engine
+        self._static_info[engine.name] = (
+            sorted(engine.supported_extensions),
+            asdict(engine.capabilities),
+        )
         logger.info("Registered engine: %s (available=%s)", engine.name, engine.is_available())
 
     def get(self, name: str) -> DocumentEngine | None:
@@ -210,7 +220,7 @@ class EngineRouter:
 
         Raises ``ValueError`` if no suitable engine is found.
         """
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
 
         # 1. Explicit hint
         if engine_hint:
@@ -277,7 +287,7 @@ class EngineRouter:
             return await engine.process(file_path, output_format=output_format, **kwargs)
 
         # Build ordered candidate list
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
         candidates: list[DocumentEngine] = []
         seen: set[str] = set()
         for name in self._get_priority(ext):
@@ -421,14 +431,18 @@ class EngineRouter:
         file_path: str,
         output_format: OutputFormat = OutputFormat.MARKDOWN,
         engines: list[str] | None = None,
+        concurrency: int = 1,
         **kwargs: Any,
     ) -> dict[str, EngineResult]:
         """Run the same document through multiple engines and return all results.
 
         If *engines* is ``None``, all available engines that support the
-        file extension are used.
+        file extension are used.  Engines run one after another by default,
+        so each reported processing time is isolated; pass *concurrency* > 1
+        to run that many at once, at the cost of timings that include
+        contention between them.  Results keep engine order.
         """
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
         targets: list[DocumentEngine] = []
 
         if engines:
@@ -443,15 +457,22 @@ class EngineRouter:
                 if e.is_available() and (not ext or ext in e.supported_extensions)
             ]
 
-        results: dict[str, EngineResult] = {}
-        for engine in targets:
-            try:
-                result = await engine.process(file_path, output_format=output_format, **kwargs)
-                results[engine.name] = result
-            except Exception:
-                logger.exception("Engine '%s' failed on '%s'", engine.name, file_path)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        return results
+        async def _process_one(engine: DocumentEngine) -> EngineResult | None:
+            async with semaphore:
+                try:
+                    return await engine.process(file_path, output_format=output_format, **kwargs)
+                except Exception:
+                    logger.exception("Engine '%s' failed on '%s'", engine.name, file_path)
+                    return None
+
+        outcomes = await asyncio.gather(*(_process_one(e) for e in targets))
+        return {
+            engine.name: result
+            for engine, result in zip(targets, outcomes)
+            if result is not None
+        }
 
     # ------------------------------------------------------------------
     # Introspection
@@ -459,19 +480,14 @@ class EngineRouter:
 
     def list_engines(self) -> list[dict[str, Any]]:
         """Return metadata about all registered engines."""
-        return [
-            {
-                "name": e.name,
+        engines = []
+        for name, e in self._engines.items():
+            extensions, capabilities = self._static_info[name]
+            engines.append({
+                "name": name,
                 "available": e.is_available(),
-                "extensions": sorted(e.supported_extensions),
-                "capabilities": {
-                    "bounding_boxes": e.capabilities.bounding_boxes,
-                    "confidence": e.capabilities.confidence,
-                    "images": e.capabilities.images,
-                    "table_structure": e.capabilities.table_structure,
-                    "heading_detection": e.capabilities.heading_detection,
-                    "reading_order": e.capabilities.reading_order,
-                },
-            }
-            for e in self._engines.values()
-        ]
+                # Copies, so callers cannot alter the cached metadata.
+                "extensions": list(extensions),
+                "capabilities": dict(capabilities),
+            })
+        return engines
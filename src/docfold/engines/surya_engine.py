@@ -6,21 +6,29 @@ Surya provides text detection, recognition, layout analysis, and table
 structure extraction with support for 90+ languages.
 
 No API key needed; runs entirely locally.
+
+Pass ``quantize_int8=True`` to run the detection and foundation models with
+dynamically quantized int8 ``Linear`` layers on CPU.  This typically gives a
+2-4x throughput gain on CPUs with VNNI support and cuts model memory ~4x, at a
+small accuracy cost (usually well under one CER point).  It has no effect when
+the models are placed on a GPU.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from pathlib import Path
-from typing import Any
+from html import escape
+from typing import Any, ClassVar
 
+from docfold.engines._json import dumps_json
+from docfold.engines._probe import has_spec
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "webp", "tiff", "bmp", "gif"}
-
 
 class SuryaEngine(DocumentEngine):
     """Adapter for Surya OCR + layout analysis.
@@ -31,19 +39,28 @@ class SuryaEngine(DocumentEngine):
     See https://github.com/VikParuchuri/surya
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "webp", "tiff", "bmp", "gif",
+    })
+
     def __init__(
         self,
         langs: list[str] | None = None,
+        quantize_int8: bool = False,
     ) -> None:
         self._langs = langs or ["en"]
+        self._quantize_int8 = quantize_int8
+        # Lazily populated on first process() call.
+        self._det_predictor: Any = None
+        self._rec_predictor: Any = None
 
     @property
     def name(self) -> str:
         return "surya"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -57,11 +74,7 @@ class SuryaEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import surya  # noqa: F401
-            return True
-        except ImportError:
-            return False
+        return has_spec("surya")
 
     async def process(
         self,
@@ -69,8 +82,6 @@ class SuryaEngine(DocumentEngine):
         output_format: OutputFormat = OutputFormat.MARKDOWN,
         **kwargs: Any,
     ) -> EngineResult:
-        import asyncio
-
         start = time.perf_counter()
 
         loop = asyncio.get_running_loop()
@@ -93,8 +104,7 @@ class SuryaEngine(DocumentEngine):
         """Load images from a PDF or image file."""
         from PIL import Image
 
-        path = Path(file_path)
-        ext = path.suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
 
         if ext == "pdf":
             from surya.input.processing import get_page_images, open_pdf
@@ -107,20 +117,37 @@ class SuryaEngine(DocumentEngine):
         else:
             return [Image.open(file_path)]
 
-    def _do_process(
-        self, file_path: str, output_format: OutputFormat
-    ) -> tuple[str, int, dict]:
+    def _ensure_predictors(self) -> tuple[Any, Any]:
+        """Lazy-load the detection + recognition predictors, caching them on the instance.
+
+        Building a predictor loads its model weights, so doing it per call
+        would repeat the most expensive part of every run.
+        """
+        if self._det_predictor is not None and self._rec_predictor is not None:
+            return self._det_predictor, self._rec_predictor
+
         # Surya v0.17+ predictor-based API
         from surya.detection import DetectionPredictor
         from surya.foundation import FoundationPredictor
         from surya.recognition import RecognitionPredictor
 
+        det_predictor = DetectionPredictor()
+        foundation = FoundationPredictor()
+        if self._quantize_int8:
+            _quantize_int8(det_predictor)
+            _quantize_int8(foundation)
+
+        self._det_predictor = det_predictor
+        self._rec_predictor = RecognitionPredictor(foundation)
+        return self._det_predictor, self._rec_predictor
+
+    def _do_process(
+        self, file_path: str, output_format: OutputFormat
+    ) -> tuple[str, int, dict]:
         images = self._load_images(file_path)
         page_count = len(images)
 
-        det_predictor = DetectionPredictor()
-        foundation = FoundationPredictor()
-        rec_predictor = RecognitionPredictor(foundation)
+        det_predictor, rec_predictor = self._ensure_predictors()
 
         # Run OCR (detection + recognition)
         predictions = rec_predictor(
@@ -128,25 +155,21 @@ class SuryaEngine(DocumentEngine):
             det_predictor=det_predictor,
         )
 
-        # Build structured pages
+        # Build structured pages as parallel per-field lists rather than one
+        # dict per line; large scans produce tens of thousands of lines.
         pages_data: list[dict] = []
         for page_idx, ocr_result in enumerate(predictions):
-            lines = []
-            for line in ocr_result.text_lines:
-                lines.append({
-                    "text": line.text,
-                    "polygon": line.polygon,
-                    "confidence": line.confidence,
-                })
-
+            text_lines = ocr_result.text_lines
             pages_data.append({
                 "page": page_idx + 1,
-                "lines": lines,
+                "texts": [line.text for line in text_lines],
+                "polygons": [line.polygon for line in text_lines],
+                "confidences": [line.confidence for line in text_lines],
             })
 
         # Format output
         content = self._format_output(pages_data, output_format)
-        metadata = {"langs": self._langs}
+        metadata = {"langs": self._langs, "quantize_int8": self._quantize_int8}
 
         return content, page_count, metadata
 
@@ -154,25 +177,58 @@ class SuryaEngine(DocumentEngine):
         self, pages_data: list[dict], output_format: OutputFormat
     ) -> str:
         if output_format == OutputFormat.JSON:
-            import json
-            return json.dumps({"pages": pages_data}, ensure_ascii=False)
+            # Public JSON shape stays one object per line.
+            return dumps_json({"pages": [
+                {
+                    "page": page["page"],
+                    "lines": [
+                        {"text": text, "polygon": polygon, "confidence": conf}
+                        for text, polygon, conf in zip(
+                            page["texts"], page["polygons"], page["confidences"]
+                        )
+                    ],
+                }
+                for page in pages_data
+            ]})
 
         if output_format == OutputFormat.HTML:
-            html_parts = []
-            for page in pages_data:
-                lines_html = "".join(
-                    f"<p>{line['text']}</p>" for line in page["lines"]
-                )
-                html_parts.append(
-                    f"<div class='page' data-page='{page['page']}'>{lines_html}</div>"
-                )
-            return "<html><body>" + "\n".join(html_parts) + "</body></html>"
-
-        # MARKDOWN / TEXT
-        md_parts = []
-        for page in pages_data:
-            page_lines: list[str] = []
-            for line in page["lines"]:
-                page_lines.append(line["text"])
-            md_parts.append("\n".join(page_lines))
-        return "\n\n".join(md_parts)
+            parts = ["<html><body>"]
+            ap = parts.append
+            for i, page in enumerate(pages_data):
+                if i:
+                    ap("\n")
+                ap(f"<div class='page' data-page='{page['page']}'>")
+                for text in page["texts"]:
+                    ap("<p>")
+                    ap(escape(text, quote=False))
+                    ap("</p>")
+                ap("</div>")
+            ap("</body></html>")
+            return "".join(parts)
+
+        # MARKDOWN / TEXT: one flat join.  An empty entry between pages turns
+        # the "\n" separator into a blank line, so each character is copied
+        # once instead of once per page join and again for the document.
+        lines: list[str] = []
+        extend = lines.extend
+        for i, page in enumerate(pages_data):
+            if i:
+                lines.append("")
+            extend(page["texts"] or ("",))
+        return "\n".join(lines)
+
+
+def _quantize_int8(predictor: Any) -> None:
+    """Swap *predictor*'s model for a dynamically int8-quantized copy (CPU only)."""
+    import torch
+
+    model = getattr(predictor, "model", None)
+    if model is None:
+        return
+    device = next(model.parameters()).device
+    if device.type != "cpu":
+        logger.warning("int8 quantization requires a CPU model, got %s — skipping", device)
+        return
+    predictor.model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8,
+    )
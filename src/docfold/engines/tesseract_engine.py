@@ -10,18 +10,50 @@ Requires Tesseract binary installed on the system:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-import tempfile
 import time
-from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import has_spec
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp", "pdf"}
+# Rendering resolution for PDF pages before OCR.
+_PDF_DPI = 200
+
+# Lazy-loaded at first use; patchable in tests.
+pytesseract: Any = None
+Image: Any = None
+convert_from_path: Any = None
+
+
+def _ensure_imports() -> None:
+    """Import ``pytesseract`` and Pillow on first use."""
+    global pytesseract, Image
+    if pytesseract is not None:
+        return
+    import pytesseract as _pytesseract
+    from PIL import Image as _Image
+
+    pytesseract = _pytesseract
+    Image = _Image
+
+
+def _ensure_pdf2image() -> None:
+    """Import ``pdf2image`` on first PDF, with an actionable error if missing."""
+    global convert_from_path
+    if convert_from_path is not None:
+        return
+    try:
+        from pdf2image import convert_from_path as _convert_from_path
+    except ImportError:
+        raise ImportError("pdf2image is required for OCR on PDFs: pip install pdf2image")
+
+    convert_from_path = _convert_from_path
 
 
 class TesseractEngine(DocumentEngine):
@@ -31,6 +63,10 @@ class TesseractEngine(DocumentEngine):
     on the system in addition to the ``pytesseract`` Python wrapper.
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp", "pdf",
+    })
+
     def __init__(self, lang: str = "eng") -> None:
         self._lang = lang
 
@@ -39,20 +75,15 @@ class TesseractEngine(DocumentEngine):
         return "tesseract"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(confidence=True)
 
     def is_available(self) -> bool:
-        try:
-            import pytesseract  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return has_spec("pytesseract")
 
     async def process(
         self,
@@ -60,8 +91,6 @@ class TesseractEngine(DocumentEngine):
         output_format: OutputFormat = OutputFormat.MARKDOWN,
         **kwargs: Any,
     ) -> EngineResult:
-        import asyncio
-
         start = time.perf_counter()
 
         loop = asyncio.get_running_loop()
@@ -79,17 +108,18 @@ class TesseractEngine(DocumentEngine):
         )
 
     def _run_ocr(self, file_path: str) -> tuple[str, float | None]:
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        _ensure_imports()
+        ext = extension_of(file_path)
 
         if ext == "pdf":
             return self._ocr_pdf(file_path)
         return self._ocr_image(file_path)
 
     def _ocr_image(self, image_path: str) -> tuple[str, float | None]:
-        import pytesseract
-        from PIL import Image
+        return self._ocr_pil(Image.open(image_path))
 
-        img = Image.open(image_path)
+    def _ocr_pil(self, img: Any) -> tuple[str, float | None]:
+        """OCR an in-memory PIL image."""
         text = pytesseract.image_to_string(img, lang=self._lang)
 
         # Extract word-level confidence from Tesseract OSD data
@@ -100,8 +130,6 @@ class TesseractEngine(DocumentEngine):
     def _get_confidence(self, img: Any) -> float | None:
         """Extract average word-level confidence from Tesseract."""
         try:
-            import pytesseract
-
             data = pytesseract.image_to_data(img, lang=self._lang, output_type="dict")
             confs = [int(c) for c in data["conf"] if int(c) >= 0]
             if confs:
@@ -112,26 +140,23 @@ class TesseractEngine(DocumentEngine):
 
     def _ocr_pdf(self, pdf_path: str) -> tuple[str, float | None]:
         """Convert PDF pages to images then OCR each page."""
-        try:
-            from pdf2image import convert_from_path
-        except ImportError:
-            raise ImportError("pdf2image is required for OCR on PDFs: pip install pdf2image")
-
-        images = convert_from_path(pdf_path)
+        _ensure_pdf2image()
+        # Render pages in parallel; pytesseract takes the PIL images directly,
+        # so nothing is re-encoded to disk.
+        images = convert_from_path(
+            pdf_path,
+            dpi=_PDF_DPI,
+            thread_count=os.cpu_count() or 1,
+            use_pdftocairo=True,
+        )
         texts: list[str] = []
         confidences: list[float] = []
 
         for img in images:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                tmp_path = tmp.name
-            try:
-                img.save(tmp_path)
-                text, conf = self._ocr_image(tmp_path)
-                texts.append(text)
-                if conf is not None:
-                    confidences.append(conf)
-            finally:
-                os.unlink(tmp_path)
+            text, conf = self._ocr_pil(img)
+            texts.append(text)
+            if conf is not None:
+                confidences.append(conf)
 
         full_text = "\n\n".join(texts)
         avg_conf = sum(confidences) / len(confidences) if confidences else None
@@ -5,20 +5,65 @@ Install: ``pip install docfold[textract]``
 Requires AWS credentials configured via environment variables
 (``AWS_ACCESS_KEY_ID``, ``AWS_SECRET_ACCESS_KEY``, ``AWS_DEFAULT_REGION``)
 or a shared credentials file.
+
+Files larger than Textract's 10 MB synchronous limit are uploaded to S3 and
+analyzed with the asynchronous API; set ``TEXTRACT_S3_BUCKET`` (or pass
+``s3_bucket=``) to enable this.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
-from typing import Any
+import uuid
+from html import escape
+from typing import Any, ClassVar
 
+from docfold.engines._json import dumps_json
+from docfold.engines._probe import has_spec
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif"}
+_FEATURE_TYPES = ["TABLES", "FORMS", "LAYOUT"]
+
+# Synchronous AnalyzeDocument rejects documents above this size.
+_MAX_INLINE_BYTES = 10 * 1024 * 1024
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_POLL_INTERVAL_S = 2.0
+_MAX_POLLS = 300
+
+# Lazy-loaded at first use; patchable in tests.
+boto3: Any = None
+
+
+def _ensure_imports() -> None:
+    """Import ``boto3`` on first use."""
+    global boto3
+    if boto3 is not None:
+        return
+    import boto3 as _boto3
+
+    boto3 = _boto3
+
+
+# Set once the credential chain has resolved; a negative result is not kept,
+# so credentials configured later in the process are still picked up.
+_credentials_found = False
+
+
+def _has_aws_credentials() -> bool:
+    """Resolve the boto3 credential chain, remembering only a success."""
+    global _credentials_found
+    if not _credentials_found:
+        try:
+            _ensure_imports()
+            _credentials_found = boto3.Session().get_credentials() is not None
+        except Exception:
+            return False
+    return _credentials_found
 
 
 class TextractEngine(DocumentEngine):
@@ -34,19 +79,25 @@ class TextractEngine(DocumentEngine):
     See https://docs.aws.amazon.com/textract/
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif",
+    })
+
     def __init__(
         self,
         region_name: str | None = None,
+        s3_bucket: str | None = None,
     ) -> None:
         self._region_name = region_name or os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+        self._s3_bucket = s3_bucket or os.getenv("TEXTRACT_S3_BUCKET")
 
     @property
     def name(self) -> str:
         return "textract"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -56,14 +107,7 @@ class TextractEngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import boto3  # noqa: F401
-
-            session = boto3.Session()
-            creds = session.get_credentials()
-            return creds is not None
-        except (ImportError, Exception):
-            return False
+        return has_spec("boto3") and _has_aws_credentials()
 
     async def process(
         self,
@@ -71,8 +115,6 @@ class TextractEngine(DocumentEngine):
         output_format: OutputFormat = OutputFormat.MARKDOWN,
         **kwargs: Any,
     ) -> EngineResult:
-        import asyncio
-
         start = time.perf_counter()
 
         loop = asyncio.get_running_loop()
@@ -98,19 +140,27 @@ class TextractEngine(DocumentEngine):
         file_path: str,
         output_format: OutputFormat,
     ) -> tuple[str, dict, list[dict], float | None, list[dict] | None]:
-        import boto3
-
+        _ensure_imports()
         client = boto3.client("textract", region_name=self._region_name)
 
-        with open(file_path, "rb") as f:
-            doc_bytes = f.read()
-
-        response = client.analyze_document(
-            Document={"Bytes": doc_bytes},
-            FeatureTypes=["TABLES", "FORMS", "LAYOUT"],
-        )
+        if os.path.getsize(file_path) <= _MAX_INLINE_BYTES:
+            with open(file_path, "rb") as f:
+                doc_bytes = f.read()
+            response = client.analyze_document(
+                Document={"Bytes": doc_bytes},
+                FeatureTypes=_FEATURE_TYPES,
+            )
+            blocks = response.get("Blocks", [])
+        elif self._s3_bucket:
+            blocks = self._analyze_via_s3(client, file_path)
+        else:
+            raise ValueError(
+                f"{file_path} exceeds Textract's {_MAX_INLINE_BYTES // (1024 * 1024)} MB "
+                "inline limit; set TEXTRACT_S3_BUCKET or pass s3_bucket= to "
+                "analyze it via S3."
+            )
 
-        blocks = response.get("Blocks", [])
+        block_map = {b["Id"]: b for b in blocks}
 
         # Extract text lines
         lines: list[str] = []
@@ -138,7 +188,7 @@ class TextractEngine(DocumentEngine):
                     })
 
             elif block_type == "TABLE":
-                table_data = self._extract_table(block, blocks)
+                table_data = self._extract_table(block, block_map)
                 if table_data:
                     tables.append(table_data)
 
@@ -146,12 +196,17 @@ class TextractEngine(DocumentEngine):
         avg_conf = sum(confidences) / len(confidences) if confidences else None
 
         if output_format == OutputFormat.JSON:
-            import json
             data = [{"text": line} for line in lines]
-            content = json.dumps(data, ensure_ascii=False)
+            content = dumps_json(data)
         elif output_format == OutputFormat.HTML:
-            html_lines = [f"<p>{line}</p>" for line in lines]
-            content = "<html><body>" + "\n".join(html_lines) + "</body></html>"
+            parts = ["<html><body>"]
+            ap = parts.append
+            for i, line in enumerate(lines):
+                ap("\n<p>" if i else "<p>")
+                ap(escape(line, quote=False))
+                ap("</p>")
+            ap("</body></html>")
+            content = "".join(parts)
         else:
             content = full_text
 
@@ -164,36 +219,80 @@ class TextractEngine(DocumentEngine):
 
         return content, metadata, bounding_boxes, avg_conf, tables or None
 
+    def _analyze_via_s3(self, client: Any, file_path: str) -> list[dict]:
+        """Upload *file_path* to S3 and run asynchronous document analysis.
+
+        The upload streams from disk with multipart transfers, so the file is
+        never held in memory.  The temporary object is deleted afterwards.
+        """
+        from boto3.s3.transfer import TransferConfig
+
+        s3 = boto3.client("s3", region_name=self._region_name)
+        key = f"docfold/{uuid.uuid4().hex}/{os.path.basename(file_path)}"
+        s3.upload_file(
+            file_path, self._s3_bucket, key,
+            Config=TransferConfig(
+                multipart_threshold=_MULTIPART_THRESHOLD, use_threads=True,
+            ),
+        )
+        try:
+            job_id = client.start_document_analysis(
+                DocumentLocation={"S3Object": {"Bucket": self._s3_bucket, "Name": key}},
+                FeatureTypes=_FEATURE_TYPES,
+            )["JobId"]
+
+            for _ in range(_MAX_POLLS):
+                response = client.get_document_analysis(JobId=job_id)
+                status = response.get("JobStatus")
+                if status == "IN_PROGRESS":
+                    time.sleep(_POLL_INTERVAL_S)
+                    continue
+                if status == "FAILED":
+                    raise RuntimeError(
+                        f"Textract analysis failed: {response.get('StatusMessage')}"
+                    )
+                blocks = list(response.get("Blocks", []))
+                next_token = response.get("NextToken")
+                while next_token:
+                    response = client.get_document_analysis(
+                        JobId=job_id, NextToken=next_token,
+                    )
+                    blocks.extend(response.get("Blocks", []))
+                    next_token = response.get("NextToken")
+                return blocks
+        finally:
+            s3.delete_object(Bucket=self._s3_bucket, Key=key)
+
+        raise TimeoutError("Textract analysis did not complete within the polling window.")
+
     def _extract_table(
-        self, table_block: dict, all_blocks: list[dict]
+        self, table_block: dict, block_map: dict[str, dict]
     ) -> dict[str, Any] | None:
-        """Extract table structure from Textract CELL blocks."""
-        relationships = table_block.get("Relationships", [])
-        cell_ids: list[str] = []
-        for rel in relationships:
-            if rel["Type"] == "CHILD":
-                cell_ids.extend(rel["Ids"])
+        """Extract table structure from Textract CELL blocks.
 
-        block_map = {b["Id"]: b for b in all_blocks}
+        Rows and cells keep Textract's sparse layout: only rows and columns
+        that have a CELL block appear, in ``RowIndex`` / ``ColumnIndex`` order.
+        """
         rows: dict[int, dict[int, str]] = {}
-
-        for cell_id in cell_ids:
-            cell = block_map.get(cell_id, {})
-            if cell.get("BlockType") != "CELL":
+        for rel in table_block.get("Relationships", []):
+            if rel["Type"] != "CHILD":
                 continue
-            row_idx = cell.get("RowIndex", 0)
-            col_idx = cell.get("ColumnIndex", 0)
-            # Get cell text from child WORD blocks
-            cell_text = self._get_block_text(cell, block_map)
-            rows.setdefault(row_idx, {})[col_idx] = cell_text
+            for cell_id in rel["Ids"]:
+                cell = block_map.get(cell_id, {})
+                if cell.get("BlockType") != "CELL":
+                    continue
+                row_idx = cell.get("RowIndex", 0)
+                col_idx = cell.get("ColumnIndex", 0)
+                # Get cell text from child WORD blocks
+                rows.setdefault(row_idx, {})[col_idx] = self._get_block_text(cell, block_map)
 
         if not rows:
             return None
 
         return {
             "rows": [
-                {f"col_{c}": rows[r].get(c, "") for c in sorted(rows[r])}
-                for r in sorted(rows)
+                {f"col_{c}": row[c] for c in sorted(row)}
+                for _, row in sorted(rows.items())
             ]
         }
 
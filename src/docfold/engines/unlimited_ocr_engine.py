@@ -28,14 +28,14 @@ from __future__ import annotations
 import logging
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from docfold.engines._probe import can_import
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp"}
-
 # mode -> (base_size, image_size, crop_mode)
 _MODE_PARAMS: dict[str, tuple[int, int, bool]] = {
     "gundam": (1024, 640, True),
@@ -59,6 +59,10 @@ class UnlimitedOCREngine(DocumentEngine):
     See https://github.com/baidu/Unlimited-OCR
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "bmp", "webp",
+    })
+
     def __init__(
         self,
         mode: str = "gundam",
@@ -85,8 +89,8 @@ class UnlimitedOCREngine(DocumentEngine):
         return "unlimited_ocr"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
@@ -97,14 +101,7 @@ class UnlimitedOCREngine(DocumentEngine):
         )
 
     def is_available(self) -> bool:
-        try:
-            import torch  # noqa: F401
-            import transformers  # noqa: F401
-            from PIL import Image  # noqa: F401
-
-            return True
-        except Exception:
-            return False
+        return can_import("torch") and can_import("transformers") and can_import("PIL.Image")
 
     def _mode_params(self) -> tuple[int, int, bool]:
         """Return ``(base_size, image_size, crop_mode)`` for the configured mode."""
@@ -209,7 +206,7 @@ class UnlimitedOCREngine(DocumentEngine):
         :class:`tempfile.TemporaryDirectory`, returned as the second element so
         the caller can clean it up.
         """
-        ext = Path(file_path).suffix.lstrip(".").lower()
+        ext = extension_of(file_path)
         if ext != "pdf":
             return [file_path], None
 
@@ -5,20 +5,39 @@ Install: ``pip install docfold[unstructured]``
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any
+from html import escape
+from typing import Any, ClassVar
 
+from docfold.engines._json import dumps_json
+from docfold.engines._probe import has_spec
 from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.formats import extension_of
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {
-    "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
+# Formats with an embedded text layer: under strategy="auto" these go straight
+# to "fast" so partition() never probes for (or loads) the layout/OCR models.
+_TEXT_NATIVE_EXTENSIONS = frozenset({
+    "docx", "doc", "pptx", "ppt", "xlsx", "xls",
     "html", "htm", "xml", "csv", "tsv", "txt", "rtf",
-    "png", "jpg", "jpeg", "tiff", "tif", "bmp",
     "eml", "msg", "epub", "odt", "rst", "md",
-}
+})
+
+# Lazy-loaded at first use; patchable in tests.
+partition: Any = None
+
+
+def _ensure_imports() -> None:
+    """Import ``unstructured.partition.auto.partition`` on first use."""
+    global partition
+    if partition is not None:
+        return
+    from unstructured.partition.auto import partition as _partition
+
+    partition = _partition
 
 
 class UnstructuredEngine(DocumentEngine):
@@ -31,6 +50,13 @@ class UnstructuredEngine(DocumentEngine):
     See https://github.com/Unstructured-IO/unstructured
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls",
+        "html", "htm", "xml", "csv", "tsv", "txt", "rtf",
+        "png", "jpg", "jpeg", "tiff", "tif", "bmp",
+        "eml", "msg", "epub", "odt", "rst", "md",
+    })
+
     def __init__(self, strategy: str = "auto") -> None:
         self._strategy = strategy
 
@@ -39,20 +65,15 @@ class UnstructuredEngine(DocumentEngine):
         return "unstructured"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     @property
     def capabilities(self) -> EngineCapabilities:
         return EngineCapabilities(table_structure=True, heading_detection=True)
 
     def is_available(self) -> bool:
-        try:
-            import unstructured  # noqa: F401
-
-            return True
-        except ImportError:
-            return False
+        return has_spec("unstructured")
 
     async def process(
         self,
@@ -60,8 +81,6 @@ class UnstructuredEngine(DocumentEngine):
         output_format: OutputFormat = OutputFormat.MARKDOWN,
         **kwargs: Any,
     ) -> EngineResult:
-        import asyncio
-
         start = time.perf_counter()
 
         loop = asyncio.get_running_loop()
@@ -79,22 +98,38 @@ class UnstructuredEngine(DocumentEngine):
             metadata=metadata,
         )
 
+    def _resolve_strategy(self, file_path: str) -> str:
+        """Pick the partition strategy for *file_path*.
+
+        An explicit strategy is always honoured; ``"auto"`` resolves to
+        ``"fast"`` for text-native formats.
+        """
+        if self._strategy != "auto":
+            return self._strategy
+        ext = extension_of(file_path)
+        return "fast" if ext in _TEXT_NATIVE_EXTENSIONS else "auto"
+
     def _extract(self, file_path: str, output_format: OutputFormat) -> tuple[str, dict]:
-        from unstructured.partition.auto import partition
+        _ensure_imports()
 
-        elements = partition(filename=file_path, strategy=self._strategy)
+        strategy = self._resolve_strategy(file_path)
+        elements = partition(filename=file_path, strategy=strategy)
 
         if output_format == OutputFormat.JSON:
-            import json
-
             data = [{"type": el.category, "text": str(el)} for el in elements]
-            content = json.dumps(data, ensure_ascii=False)
+            content = dumps_json(data)
         elif output_format == OutputFormat.HTML:
-            parts = []
-            for el in elements:
-                tag = "h1" if el.category == "Title" else "p"
-                parts.append(f"<{tag}>{el}</{tag}>")
-            content = "<html><body>" + "\n".join(parts) + "</body></html>"
+            parts = ["<html><body>"]
+            ap = parts.append
+            for i, el in enumerate(elements):
+                open_tag, close_tag = (
+                    ("<h1>", "</h1>") if el.category == "Title" else ("<p>", "</p>")
+                )
+                ap("\n" + open_tag if i else open_tag)
+                ap(escape(str(el), quote=False))
+                ap(close_tag)
+            ap("</body></html>")
+            content = "".join(parts)
         elif output_format == OutputFormat.MARKDOWN:
             parts = []
             for el in elements:
@@ -109,7 +144,7 @@ class UnstructuredEngine(DocumentEngine):
             content = "\n\n".join(str(el) for el in elements)
 
         metadata = {
-            "strategy": self._strategy,
+            "strategy": strategy,
             "element_count": len(elements),
         }
         return content, metadata
@@ -13,14 +13,15 @@ from __future__ import annotations
 import logging
 import os
 import time
-from typing import Any
+from html import escape
+from typing import Any, ClassVar
 
+from docfold.engines._json import dumps_json
+from docfold.engines._probe import has_spec
 from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
 
 logger = logging.getLogger(__name__)
 
-_SUPPORTED_EXTENSIONS = {"pdf", "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp"}
-
 
 class ZeroxEngine(DocumentEngine):
     """Adapter for Zerox — model-agnostic Vision LLM OCR.
@@ -32,6 +33,10 @@ class ZeroxEngine(DocumentEngine):
     See https://github.com/getomni-ai/zerox
     """
 
+    SUPPORTED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset({
+        "pdf", "png", "jpg", "jpeg", "tiff", "tif", "webp", "bmp",
+    })
+
     def __init__(
         self,
         model: str = "gpt-4o",
@@ -45,16 +50,13 @@ class ZeroxEngine(DocumentEngine):
         return "zerox"
 
     @property
-    def supported_extensions(self) -> set[str]:
-        return _SUPPORTED_EXTENSIONS
+    def supported_extensions(self) -> frozenset[str]:
+        return self.SUPPORTED_EXTENSIONS
 
     def is_available(self) -> bool:
-        try:
-            import pyzerox  # noqa: F401
-
-            return bool(os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY"))
-        except ImportError:
+        if not has_spec("pyzerox"):
             return False
+        return bool(os.getenv("OPENAI_API_KEY") or os.getenv("ANTHROPIC_API_KEY"))
 
     async def process(
         self,
@@ -90,16 +92,15 @@ class ZeroxEngine(DocumentEngine):
         content = "\n\n".join(pages_md)
 
         if output_format == OutputFormat.JSON:
-            import json
-
             data = [
                 {"page": page.page, "text": page.content}
                 for page in result.pages
             ]
-            content = json.dumps(data, ensure_ascii=False)
+            content = dumps_json(data)
         elif output_format == OutputFormat.HTML:
             html_parts = [
-                f"<div class='page' data-page='{page.page}'><p>{page.content}</p></div>"
+                f"<div class='page' data-page='{page.page}'>"
+                f"<p>{escape(page.content, quote=False)}</p></div>"
                 for page in result.pages
             ]
             content = "<html><body>" + "\n".join(html_parts) + "</body></html>"
@@ -8,34 +8,104 @@ All metric functions follow the convention:
 
 from __future__ import annotations
 
-
-def compute_cer(predicted: str, reference: str) -> float:
+import functools
+import sys
+from collections import Counter
+from collections.abc import Callable, Sequence
+from collections.abc import Set as AbstractSet
+from typing import Any
+
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:  # pragma: no cover - depends on the environment
+    _Levenshtein = None  # type: ignore[assignment]
+
+try:
+    from jiwer import cer as _jiwer_cer
+    from jiwer import wer as _jiwer_wer
+except ImportError:  # pragma: no cover - depends on the environment
+    _jiwer_cer = _jiwer_wer = None
+
+
+def compute_cer(
+    predicted: str, reference: str, *, max_error_rate: float | None = None,
+) -> float:
     """Character Error Rate — Levenshtein distance normalized by reference length.
 
     Returns 0.0 for a perfect match. Can exceed 1.0 if predicted is much longer.
+    Leading and trailing whitespace is ignored on both sides, as jiwer's
+    default CER transform does, so every backend gives the same score.
+
+    With *max_error_rate*, the edit distance is bounded: once the rate is known
+    to exceed the cutoff, computation stops and a value just above it,
+    ``(int(max_error_rate * len(reference)) + 1) / len(reference)``, is
+    returned. Use it when only "is it below X?" matters.
     """
+    predicted = predicted.strip()
+    reference = reference.strip()
     if not reference:
         return 0.0 if not predicted else float(len(predicted))
-    try:
-        from jiwer import cer
-        result = cer(reference, predicted)
+    max_distance = _max_distance(max_error_rate, len(reference))
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(
+            reference, predicted, score_cutoff=max_distance,
+        ) / len(reference)
+    if max_distance is None and _jiwer_cer is not None:
+        result = _jiwer_cer(reference, predicted)
         return result if isinstance(result, float) else 0.0
-    except ImportError:
-        return _levenshtein_ratio(predicted, reference, char_level=True)
+    return _levenshtein_ratio(
+        predicted, reference, char_level=True, max_distance=max_distance,
+    )
 
 
-def compute_wer(predicted: str, reference: str) -> float:
+def compute_wer(
+    predicted: str, reference: str, *, max_error_rate: float | None = None,
+) -> float:
     """Word Error Rate — edit distance at word level normalized by reference word count.
 
-    Returns 0.0 for a perfect match.
+    Returns 0.0 for a perfect match. *max_error_rate* bounds the computation
+    as in :func:`compute_cer`, counted in words.
     """
     if not reference.strip():
         return 0.0 if not predicted.strip() else float(len(predicted.split()))
-    try:
-        from jiwer import wer
-        return wer(reference, predicted)
-    except ImportError:
-        return _levenshtein_ratio(predicted, reference, char_level=False)
+    ref_words = reference.split()
+    max_distance = _max_distance(max_error_rate, len(ref_words))
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(
+            ref_words, predicted.split(), score_cutoff=max_distance,
+        ) / len(ref_words)
+    if max_distance is None and _jiwer_wer is not None:
+        return _jiwer_wer(reference, predicted)
+    return _levenshtein_ratio(
+        predicted, reference, char_level=False, max_distance=max_distance,
+    )
+
+
+def compute_wer_tokens(
+    predicted_tokens: Sequence[str],
+    reference_tokens: Sequence[str],
+    *,
+    max_error_rate: float | None = None,
+) -> float:
+    """:func:`compute_wer` on already-split words.
+
+    Lets callers split (and :func:`sys.intern`) a reference once and score
+    it against many predictions.  Interned tokens make the fallback DP's
+    equality checks identity comparisons.
+    """
+    if not reference_tokens:
+        return 0.0 if not predicted_tokens else float(len(predicted_tokens))
+    max_distance = _max_distance(max_error_rate, len(reference_tokens))
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(
+            reference_tokens, predicted_tokens, score_cutoff=max_distance,
+        ) / len(reference_tokens)
+    return _edit_rate(list(predicted_tokens), list(reference_tokens), max_distance)
+
+
+def intern_tokens(text: str) -> tuple[str, ...]:
+    """Split *text* on whitespace into interned words."""
+    return tuple(map(sys.intern, text.split()))
 
 
 def compute_table_f1(
@@ -45,6 +115,8 @@ def compute_table_f1(
     """Table detection and cell-level F1 score.
 
     Each table is represented as a list of rows, each row is a list of cell strings.
+    Cells are compared as a multiset, so repeated values (blank cells, "—")
+    must be matched as many times as they occur.
     Returns F1 in [0, 1].
     """
     if not reference_tables and not predicted_tables:
@@ -53,22 +125,20 @@ def compute_table_f1(
         return 0.0
 
     # Flatten all cells from all tables for a simple cell-level comparison
-    ref_cells = _flatten_tables(reference_tables)
-    pred_cells = _flatten_tables(predicted_tables)
+    return _multiset_f1(_flatten_tables(predicted_tables), _flatten_tables(reference_tables))
 
-    ref_set = set(ref_cells)
-    pred_set = set(pred_cells)
 
-    if not ref_set and not pred_set:
+def compute_table_f1_from_cells(
+    predicted_tables: list[list[list[str]]],
+    reference_cells: Counter[str],
+) -> float:
+    """:func:`compute_table_f1` against reference cells already normalized
+    with :func:`normalize_table_cells` (reuse one count across engines)."""
+    if not reference_cells and not predicted_tables:
         return 1.0
-
-    tp = len(ref_set & pred_set)
-    precision = tp / len(pred_set) if pred_set else 0.0
-    recall = tp / len(ref_set) if ref_set else 0.0
-
-    if precision + recall == 0:
+    if not reference_cells or not predicted_tables:
         return 0.0
-    return 2 * precision * recall / (precision + recall)
+    return _multiset_f1(_flatten_tables(predicted_tables), reference_cells)
 
 
 def compute_heading_f1(
@@ -84,16 +154,33 @@ def compute_heading_f1(
     if not reference_headings or not predicted_headings:
         return 0.0
 
-    ref_norm = {_normalize(h) for h in reference_headings}
-    pred_norm = {_normalize(h) for h in predicted_headings}
+    return _set_f1(
+        {_normalize(h) for h in predicted_headings},
+        {_normalize(h) for h in reference_headings},
+    )
 
-    tp = len(ref_norm & pred_norm)
-    precision = tp / len(pred_norm) if pred_norm else 0.0
-    recall = tp / len(ref_norm) if ref_norm else 0.0
 
-    if precision + recall == 0:
+def compute_heading_f1_from_sets(
+    predicted_headings: list[str],
+    reference_headings: AbstractSet[str],
+) -> float:
+    """:func:`compute_heading_f1` against reference headings already
+    normalized with :func:`normalize_headings` (reuse one set across engines)."""
+    if not reference_headings and not predicted_headings:
+        return 1.0
+    if not reference_headings or not predicted_headings:
         return 0.0
-    return 2 * precision * recall / (precision + recall)
+    return _set_f1({_normalize(h) for h in predicted_headings}, reference_headings)
+
+
+def normalize_headings(headings: list[str]) -> frozenset[str]:
+    """Normalized heading set for :func:`compute_heading_f1_from_sets`."""
+    return frozenset(_normalize(h) for h in headings)
+
+
+def normalize_table_cells(tables: list[list[list[str]]]) -> Counter[str]:
+    """Normalized cell counts for :func:`compute_table_f1_from_cells`."""
+    return _flatten_tables(tables)
 
 
 def compute_reading_order_score(
@@ -118,15 +205,11 @@ def compute_reading_order_score(
         tau, _ = kendalltau(ref_ranks, pred_ranks)
         return float(tau) if tau == tau else 0.0  # handle NaN
     except ImportError:
-        # Simple concordance-based approximation
+        # Simple concordance-based approximation.  ref_ranks is 0..n-1, so a
+        # pair is concordant exactly when pred_ranks ascends across it.
         n = len(common)
-        concordant = 0
-        total = 0
-        for i in range(n):
-            for j in range(i + 1, n):
-                total += 1
-                if (pred_ranks[i] - pred_ranks[j]) * (ref_ranks[i] - ref_ranks[j]) > 0:
-                    concordant += 1
+        total = n * (n - 1) // 2
+        concordant = _count_ascending_pairs(pred_ranks)
         return (2 * concordant - total) / total if total > 0 else 1.0
 
 
@@ -134,31 +217,130 @@ def compute_reading_order_score(
 # Internal helpers
 # ---------------------------------------------------------------------------
 
+def _set_f1(predicted: AbstractSet[str], reference: AbstractSet[str]) -> float:
+    """F1 between two sets of normalized strings (1.0 if both are empty)."""
+    if not reference and not predicted:
+        return 1.0
+
+    tp = len(reference & predicted)
+    precision = tp / len(predicted) if predicted else 0.0
+    recall = tp / len(reference) if reference else 0.0
+
+    if precision + recall == 0:
+        return 0.0
+    return 2 * precision * recall / (precision + recall)
+
+
+def _multiset_f1(predicted: Counter[str], reference: Counter[str]) -> float:
+    """F1 between two multisets of normalized strings (1.0 if both are empty)."""
+    if not reference and not predicted:
+        return 1.0
+
+    tp = sum((reference & predicted).values())
+    pred_total = sum(predicted.values())
+    ref_total = sum(reference.values())
+    precision = tp / pred_total if pred_total else 0.0
+    recall = tp / ref_total if ref_total else 0.0
+
+    if precision + recall == 0:
+        return 0.0
+    return 2 * precision * recall / (precision + recall)
+
+
 def _normalize(text: str) -> str:
     """Lowercase, strip whitespace, collapse spaces."""
+    # Already-normalized ASCII (no uppercase, no tabs/newlines, no double
+    # spaces) only needs its ends trimmed.
+    if text.isascii() and text.islower() and text.isprintable() and "  " not in text:
+        return text.strip()
     return " ".join(text.lower().split())
 
 
-def _flatten_tables(tables: list[list[list[str]]]) -> list[str]:
-    """Flatten list-of-tables into a list of normalized cell strings."""
-    cells = []
-    for table in tables:
-        for row in table:
-            for cell in row:
-                cells.append(_normalize(cell))
-    return cells
+def _flatten_tables(tables: list[list[list[str]]]) -> Counter[str]:
+    """Flatten list-of-tables into counts of normalized cell strings."""
+    return Counter(_normalize(cell) for table in tables for row in table for cell in row)
+
 
+def _count_ascending_pairs(values: list[int]) -> int:
+    """Count pairs ``i < j`` with ``values[i] < values[j]`` in O(n log n)."""
+    return _sort_and_count(values)[1]
 
-def _levenshtein_ratio(predicted: str, reference: str, char_level: bool) -> float:
-    """Pure-Python Levenshtein-based error rate (fallback when jiwer is not installed)."""
+
+def _sort_and_count(values: list[int]) -> tuple[list[int], int]:
+    """Merge sort *values*, counting ascending pairs across the two halves.
+
+    While merging, each element taken from the right half is credited with
+    the number of strictly smaller left-half elements already emitted.
+    """
+    if len(values) < 2:
+        return list(values), 0
+    mid = len(values) // 2
+    left, count_left = _sort_and_count(values[:mid])
+    right, count_right = _sort_and_count(values[mid:])
+    merged: list[int] = []
+    count = count_left + count_right
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] < right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            count += i
+            merged.append(right[j])
+            j += 1
+    count += i * (len(right) - j)
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged, count
+
+
+def _max_distance(max_error_rate: float | None, reference_len: int) -> int | None:
+    """Convert an error-rate cutoff into an absolute edit-distance bound."""
+    if max_error_rate is None:
+        return None
+    return max(0, int(max_error_rate * reference_len))
+
+
+def _levenshtein_ratio(
+    predicted: str,
+    reference: str,
+    char_level: bool,
+    max_distance: int | None = None,
+) -> float:
+    """Pure-Python Levenshtein-based error rate (fallback when neither rapidfuzz
+    nor jiwer is installed).
+
+    When *max_distance* is given, distances above it are reported as
+    ``max_distance + 1`` (see :func:`_banded_distance`).
+    """
     if char_level:
         a, b = list(predicted), list(reference)
     else:
         a, b = predicted.split(), reference.split()
+    return _edit_rate(a, b, max_distance)
 
+
+def _edit_rate(a: list[str], b: list[str], max_distance: int | None) -> float:
+    """Edit distance from *a* to *b* normalized by ``len(b)`` (local DP)."""
     if not b:
         return 0.0 if not a else float(len(a))
 
+    ref_len = len(b)
+    # Edits only happen between the shared prefix and suffix, and the
+    # distance is symmetric: keep the DP row over the shorter sequence so
+    # memory is O(min(n, m)) of the differing middle only.
+    a, b = _trim_common_affixes(a, b)
+    if len(b) > len(a):
+        a, b = b, a
+    if max_distance is not None:
+        return _banded_distance(a, b, max_distance) / ref_len
+    if not b:
+        return len(a) / ref_len
+
+    kernel = _numba_levenshtein()
+    if kernel is not None:
+        return kernel(*_as_code_arrays(a, b)) / ref_len
+
     n, m = len(a), len(b)
     dp = list(range(m + 1))
     for i in range(1, n + 1):
@@ -170,4 +352,106 @@ def _levenshtein_ratio(predicted: str, reference: str, char_level: bool) -> floa
             dp[j] = min(dp[j] + 1, dp[j - 1] + 1, prev + cost)
             prev = temp
 
-    return dp[m] / m
+    return dp[m] / ref_len
+
+
+def _trim_common_affixes(a: list[str], b: list[str]) -> tuple[list[str], list[str]]:
+    """Drop the longest common prefix and suffix of *a* and *b*."""
+    limit = min(len(a), len(b))
+    start = 0
+    while start < limit and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < limit - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    if start == 0 and end == 0:
+        return a, b
+    return a[start:len(a) - end], b[start:len(b) - end]
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_levenshtein() -> Callable[[Any, Any], int] | None:
+    """Compile the single-row Levenshtein DP with numba, if installed."""
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, nogil=True)
+    def _kernel(a, b):  # pragma: no cover - runs as native code
+        n, m = a.shape[0], b.shape[0]
+        dp = np.arange(m + 1)
+        for i in range(1, n + 1):
+            prev = dp[0]
+            dp[0] = i
+            ai = a[i - 1]
+            for j in range(1, m + 1):
+                temp = dp[j]
+                v = prev if ai == b[j - 1] else prev + 1
+                if temp + 1 < v:
+                    v = temp + 1
+                if dp[j - 1] + 1 < v:
+                    v = dp[j - 1] + 1
+                dp[j] = v
+                prev = temp
+        return dp[m]
+
+    return _kernel
+
+
+def _as_code_arrays(a: list[str], b: list[str]) -> tuple[Any, Any]:
+    """Map two token lists onto int64 arrays of shared token ids."""
+    import numpy as np
+
+    ids: dict[str, int] = {}
+    setdefault = ids.setdefault
+    return (
+        np.fromiter((setdefault(t, len(ids)) for t in a), dtype=np.int64, count=len(a)),
+        np.fromiter((setdefault(t, len(ids)) for t in b), dtype=np.int64, count=len(b)),
+    )
+
+
+def _banded_distance(a: list[str], b: list[str], k: int) -> int:
+    """Levenshtein distance restricted to the diagonal band ``|i - j| <= k``.
+
+    Cells outside the band cannot lie on a path of cost <= *k*, so they are
+    skipped (Ukkonen), giving O(k * n) work.  Returns ``k + 1`` as soon as
+    the distance is known to exceed *k*.
+    """
+    n, m = len(a), len(b)
+    big = k + 1
+    if abs(n - m) > k:
+        return big
+
+    dp = [j if j <= k else big for j in range(m + 1)]
+    for i in range(1, n + 1):
+        lo = i - k
+        if lo <= 1:
+            lo = 1
+            diag = dp[0]
+            dp[0] = i if i <= k else big
+        else:
+            # Column lo - 1 leaves the band on this row.
+            diag = dp[lo - 1]
+            dp[lo - 1] = big
+        hi = min(m, i + k)
+        ai = a[i - 1]
+        left = row_min = dp[lo - 1]
+        for j in range(lo, hi + 1):
+            up = dp[j]
+            v = diag if ai == b[j - 1] else diag + 1
+            if up + 1 < v:
+                v = up + 1
+            if left + 1 < v:
+                v = left + 1
+            if v > big:
+                v = big
+            dp[j] = left = v
+            diag = up
+            if v < row_min:
+                row_min = v
+        if row_min > k:
+            return big
+
+    return dp[m]
@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import os
 import time
-from dataclasses import dataclass, field
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+from docfold.engines._json import dumps_json, loads_json
 from docfold.engines.base import EngineResult, OutputFormat
 from docfold.engines.router import EngineRouter
-from docfold.evaluation.metrics import compute_cer, compute_wer
+from docfold.evaluation.metrics import (
+    compute_cer,
+    compute_wer_tokens,
+    intern_tokens,
+    normalize_headings,
+    normalize_table_cells,
+)
 
 logger = logging.getLogger(__name__)
 
+# Sequential by default so processing times stay comparable across runs.
+_DEFAULT_CONCURRENCY = 1
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentScore:
     """Scores for a single (engine, document) pair."""
 
@@ -32,7 +45,39 @@ class DocumentScore:
     error: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
+class NormalizedGT:
+    """Ground truth for one document, normalized once and shared by every engine."""
+
+    document_id: str
+    category: str
+    full_text: str
+    full_text_tokens: tuple[str, ...] = ()
+    """Interned words of ``full_text``, split once for WER."""
+
+    headings: frozenset[str] | None = None
+    """Normalized reference headings (``None`` if not annotated)."""
+
+    table_cells: Counter[str] | None = None
+    """Normalized reference table cell counts (``None`` if not annotated)."""
+
+    @classmethod
+    def from_ground_truth(cls, ground_truth: dict[str, Any], doc_path: Path) -> NormalizedGT:
+        gt_data = ground_truth.get("ground_truth", {})
+        headings = gt_data.get("headings")
+        tables = gt_data.get("tables")
+        full_text = gt_data.get("full_text", "")
+        return cls(
+            document_id=ground_truth.get("document_id", doc_path.stem),
+            category=ground_truth.get("category", "unknown"),
+            full_text=full_text,
+            full_text_tokens=intern_tokens(full_text),
+            headings=normalize_headings(headings) if headings is not None else None,
+            table_cells=normalize_table_cells(tables) if tables is not None else None,
+        )
+
+
+@dataclass(slots=True)
 class EvaluationReport:
     """Full evaluation report across all engines and documents."""
 
@@ -43,12 +88,12 @@ class EvaluationReport:
     def to_dict(self) -> dict:
         return {
             "timestamp": self.timestamp,
-            "scores": [vars(s) for s in self.scores],
+            "scores": [asdict(s) for s in self.scores],
             "engine_summaries": self.engine_summaries,
         }
 
     def to_json(self, indent: int = 2) -> str:
-        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+        return dumps_json(self.to_dict(), indent=indent)
 
 
 class EvaluationRunner:
@@ -59,40 +104,74 @@ class EvaluationRunner:
         runner = EvaluationRunner(router, dataset_path="tests/evaluation/dataset")
         report = await runner.run(engines=["docling", "mineru"])
         print(report.to_json())
+
+    Instead of a directory, *dataset* may supply the ground truth in memory:
+    dicts in the ``*.ground_truth.json`` schema plus a ``"path"`` key naming
+    the document to process.  ``categories`` then filters on each entry's
+    ``"category"`` value rather than on directory names.
     """
 
-    def __init__(self, router: EngineRouter, dataset_path: str) -> None:
+    def __init__(
+        self,
+        router: EngineRouter,
+        dataset_path: str | None = None,
+        *,
+        dataset: Iterable[dict[str, Any]] | None = None,
+    ) -> None:
+        if (dataset_path is None) == (dataset is None):
+            raise ValueError("Pass exactly one of dataset_path or dataset")
         self.router = router
-        self.dataset_path = Path(dataset_path)
+        self.dataset_path = Path(dataset_path) if dataset_path is not None else None
+        self.dataset = list(dataset) if dataset is not None else None
 
     async def run(
         self,
         engines: list[str] | None = None,
         categories: list[str] | None = None,
+        concurrency: int | None = None,
     ) -> EvaluationReport:
         """Run the full evaluation.
 
         Args:
             engines: Engine names to evaluate (None = all available).
             categories: Document categories to include (None = all).
+            concurrency: Max (document, engine) pairs evaluated at once
+                (None = ``DOCFOLD_EVAL_CONCURRENCY`` or 1, i.e. sequential).
+                Above 1, reported processing times include contention
+                between concurrent pairs.
         """
         report = EvaluationReport(
             timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
         )
 
-        gt_files = self._discover_ground_truth(categories)
-        logger.info("Found %d ground-truth documents", len(gt_files))
+        documents = self._load_documents(categories)
+        logger.info("Found %d ground-truth documents", len(documents))
 
         available_engines = engines or [
             e["name"] for e in self.router.list_engines() if e["available"]
         ]
 
-        for doc_path, gt_path in gt_files:
-            gt = self._load_ground_truth(gt_path)
+        if concurrency is None:
+            concurrency = int(
+                os.environ.get("DOCFOLD_EVAL_CONCURRENCY", _DEFAULT_CONCURRENCY)
+            )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _evaluate_bounded(
+            doc_path: Path, gt: NormalizedGT, engine_name: str,
+        ) -> DocumentScore:
+            async with semaphore:
+                return await self._evaluate_single(doc_path, gt, engine_name)
+
+        tasks = []
+        for doc_path, ground_truth in documents:
+            gt = NormalizedGT.from_ground_truth(ground_truth, doc_path)
 
             for engine_name in available_engines:
-                score = await self._evaluate_single(doc_path, gt, engine_name)
-                report.scores.append(score)
+                tasks.append(_evaluate_bounded(doc_path, gt, engine_name))
+
+        # gather() keeps scores in (document, engine) order.
+        report.scores = list(await asyncio.gather(*tasks))
 
         report.engine_summaries = self._compute_summaries(report.scores)
         return report
@@ -100,11 +179,11 @@ class EvaluationRunner:
     async def _evaluate_single(
         self,
         doc_path: Path,
-        ground_truth: dict[str, Any],
+        ground_truth: NormalizedGT,
         engine_name: str,
     ) -> DocumentScore:
-        doc_id = ground_truth.get("document_id", doc_path.stem)
-        category = ground_truth.get("category", "unknown")
+        doc_id = ground_truth.document_id
+        category = ground_truth.category
 
         try:
             result: EngineResult = await self.router.process(
@@ -120,11 +199,13 @@ class EvaluationRunner:
                 error=str(e),
             )
 
-        gt_data = ground_truth.get("ground_truth", {})
-        ref_text = gt_data.get("full_text", "")
+        ref_text = ground_truth.full_text
 
         cer = compute_cer(result.content, ref_text) if ref_text else None
-        wer = compute_wer(result.content, ref_text) if ref_text else None
+        wer = (
+            compute_wer_tokens(intern_tokens(result.content), ground_truth.full_text_tokens)
+            if ref_text else None
+        )
 
         return DocumentScore(
             document_id=doc_id,
@@ -135,49 +216,96 @@ class EvaluationRunner:
             processing_time_ms=result.processing_time_ms,
         )
 
+    def _load_documents(
+        self, categories: list[str] | None
+    ) -> list[tuple[Path, dict[str, Any]]]:
+        """Return (document path, ground truth) pairs from the configured source."""
+        if self.dataset is not None:
+            return [
+                (Path(entry["path"]), entry)
+                for entry in self.dataset
+                if not categories or entry.get("category", "unknown") in categories
+            ]
+        return [
+            (doc_path, self._load_ground_truth(gt_path))
+            for doc_path, gt_path in self._discover_ground_truth(categories)
+        ]
+
     def _discover_ground_truth(
         self, categories: list[str] | None
     ) -> list[tuple[Path, Path]]:
-        """Find (document, ground_truth.json) pairs in the dataset."""
-        pairs = []
-        for gt_file in self.dataset_path.rglob("*.ground_truth.json"):
-            category = gt_file.parent.name
-            if categories and category not in categories:
+        """Find (document, ground_truth.json) pairs in the dataset.
+
+        One ``os.scandir`` pass per directory indexes documents by stem, so
+        each ground-truth file is paired without rescanning its siblings.
+        Directories are visited in name order; symlinked directories are
+        not followed.
+        """
+        pairs: list[tuple[Path, Path]] = []
+        # Normalized so a dataset root like ``invoices/`` or ``a/..`` has a name.
+        stack = [os.path.normpath(str(self.dataset_path))]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
                 continue
 
-            stem = gt_file.name.replace(".ground_truth.json", "")
-            # Find the matching document file
-            for candidate in gt_file.parent.iterdir():
-                if candidate.stem == stem and ".ground_truth" not in candidate.name:
-                    pairs.append((candidate, gt_file))
-                    break
+            subdirs: list[str] = []
+            docs: dict[str, str] = {}
+            gt_files: list[tuple[str, str]] = []
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif name.endswith(".ground_truth.json"):
+                    gt_files.append((name.replace(".ground_truth.json", ""), entry.path))
+                elif ".ground_truth" not in name:
+                    docs.setdefault(os.path.splitext(name)[0], entry.path)
+
+            category = os.path.basename(directory)
+            if not categories or category in categories:
+                for stem, gt_path in gt_files:
+                    doc_path = docs.get(stem)
+                    if doc_path is not None:
+                        pairs.append((Path(doc_path), Path(gt_path)))
+
+            stack.extend(reversed(subdirs))
 
         return pairs
 
     def _load_ground_truth(self, gt_path: Path) -> dict[str, Any]:
-        return json.loads(gt_path.read_text(encoding="utf-8"))
+        return loads_json(gt_path.read_bytes())
 
     @staticmethod
     def _compute_summaries(scores: list[DocumentScore]) -> dict[str, dict[str, float]]:
-        """Aggregate per-engine averages."""
-        from collections import defaultdict
-
-        engine_scores: dict[str, list[DocumentScore]] = defaultdict(list)
+        """Aggregate per-engine averages in a single pass over *scores*."""
+        # engine → [documents, cer_sum, cer_count, wer_sum, wer_count, time_sum]
+        totals: dict[str, list[float]] = {}
         for s in scores:
-            if s.error is None:
-                engine_scores[s.engine_name].append(s)
+            if s.error is not None:
+                continue
+            t = totals.get(s.engine_name)
+            if t is None:
+                t = totals[s.engine_name] = [0, 0.0, 0, 0.0, 0, 0]
+            t[0] += 1
+            if s.cer is not None:
+                t[1] += s.cer
+                t[2] += 1
+            if s.wer is not None:
+                t[3] += s.wer
+                t[4] += 1
+            t[5] += s.processing_time_ms
 
         summaries = {}
-        for engine, sc_list in engine_scores.items():
-            cers = [s.cer for s in sc_list if s.cer is not None]
-            wers = [s.wer for s in sc_list if s.wer is not None]
-            times = [s.processing_time_ms for s in sc_list]
-
+        for engine, (n, cer_sum, n_cer, wer_sum, n_wer, time_sum) in totals.items():
             summaries[engine] = {
-                "avg_cer": sum(cers) / len(cers) if cers else -1,
-                "avg_wer": sum(wers) / len(wers) if wers else -1,
-                "avg_time_ms": sum(times) / len(times) if times else -1,
-                "documents_evaluated": len(sc_list),
+                "avg_cer": cer_sum / n_cer if n_cer else -1,
+                "avg_wer": wer_sum / n_wer if n_wer else -1,
+                "avg_time_ms": time_sum / n,
+                "documents_evaluated": n,
             }
 
         return summaries
+
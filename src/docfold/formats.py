@@ -0,0 +1,99 @@
+"""Canonical file-extension tables shared across docfold.
+
+Extensions are lowercase and without the leading dot (see
+:func:`extension_of`).  :data:`CATEGORY_MAP`
+holds the coarse file category used by :mod:`docfold.preprocessing` and
+:data:`MIME_MAP` the MIME type; :mod:`docfold.utils.pre_analysis` derives
+its routing categories from the former.
+"""
+
+from __future__ import annotations
+
+import os
+
+# Extension → category mapping
+CATEGORY_MAP: dict[str, str] = {
+    # Documents
+    "pdf": "document",
+    "docx": "document",
+    "doc": "document",
+    "odt": "document",
+    "rtf": "document",
+    # Presentations
+    "pptx": "presentation",
+    "ppt": "presentation",
+    "odp": "presentation",
+    # Spreadsheets
+    "xlsx": "spreadsheet",
+    "xls": "spreadsheet",
+    "csv": "spreadsheet",
+    "ods": "spreadsheet",
+    # Images
+    "png": "image",
+    "jpg": "image",
+    "jpeg": "image",
+    "tiff": "image",
+    "tif": "image",
+    "bmp": "image",
+    "webp": "image",
+    "gif": "image",
+    # Web
+    "html": "web",
+    "htm": "web",
+    # E-books
+    "epub": "ebook",
+    # Audio
+    "wav": "audio",
+    "mp3": "audio",
+    "vtt": "audio",
+}
+
+# Extension → MIME type (subset for common document types)
+MIME_MAP: dict[str, str] = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "doc": "application/msword",
+    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "xls": "application/vnd.ms-excel",
+    "odt": "application/vnd.oasis.opendocument.text",
+    "rtf": "application/rtf",
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "tiff": "image/tiff",
+    "tif": "image/tiff",
+    "bmp": "image/bmp",
+    "webp": "image/webp",
+    "gif": "image/gif",
+    "html": "text/html",
+    "htm": "text/html",
+    "csv": "text/csv",
+    "epub": "application/epub+zip",
+}
+
+
+# Both tables fused so classify() is a single lookup; every MIME_MAP key is
+# also in CATEGORY_MAP.  Built once at import: later edits to the tables
+# above are not seen by classify().
+_CLASSIFICATION: dict[str, tuple[str, str | None]] = {
+    ext: (category, MIME_MAP.get(ext)) for ext, category in CATEGORY_MAP.items()
+}
+_UNKNOWN: tuple[str, None] = ("unknown", None)
+
+
+def classify(ext: str) -> tuple[str, str | None]:
+    """Return ``(category, mime_type)`` for a lowercase extension.
+
+    Unknown extensions give ``("unknown", None)``.
+    """
+    return _CLASSIFICATION.get(ext, _UNKNOWN)
+
+
+def extension_of(file_path: str) -> str:
+    """Return the lowercase extension of *file_path* without the leading dot.
+
+    Equivalent to ``Path(file_path).suffix.lstrip(".").lower()`` for file
+    paths, without constructing a :class:`~pathlib.Path`.
+    """
+    return os.path.splitext(file_path)[1].lstrip(".").lower()
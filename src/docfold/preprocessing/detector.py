@@ -3,61 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from pathlib import Path
 
-# Extension → category mapping
-_CATEGORY_MAP: dict[str, str] = {
-    # Documents
-    "pdf": "document",
-    "docx": "document",
-    "doc": "document",
-    "odt": "document",
-    "rtf": "document",
-    # Presentations
-    "pptx": "presentation",
-    "ppt": "presentation",
-    "odp": "presentation",
-    # Spreadsheets
-    "xlsx": "spreadsheet",
-    "xls": "spreadsheet",
-    "csv": "spreadsheet",
-    "ods": "spreadsheet",
-    # Images
-    "png": "image",
-    "jpg": "image",
-    "jpeg": "image",
-    "tiff": "image",
-    "tif": "image",
-    "bmp": "image",
-    "webp": "image",
-    "gif": "image",
-    # Web
-    "html": "web",
-    "htm": "web",
-    # E-books
-    "epub": "ebook",
-    # Audio
-    "wav": "audio",
-    "mp3": "audio",
-    "vtt": "audio",
-}
+from docfold.formats import CATEGORY_MAP, classify, extension_of
 
-_MIME_MAP: dict[str, str] = {
-    "pdf": "application/pdf",
-    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    "doc": "application/msword",
-    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    "png": "image/png",
-    "jpg": "image/jpeg",
-    "jpeg": "image/jpeg",
-    "tiff": "image/tiff",
-    "html": "text/html",
-    "csv": "text/csv",
-}
 
-
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """Metadata about a file for engine selection."""
 
@@ -81,9 +31,8 @@ class FileInfo:
 
 def detect_file_type(file_path: str) -> FileInfo:
     """Detect file type from extension and optionally from magic bytes."""
-    ext = Path(file_path).suffix.lstrip(".").lower()
-    category = _CATEGORY_MAP.get(ext, "unknown")
-    mime = _MIME_MAP.get(ext)
+    ext = extension_of(file_path)
+    category, mime = classify(ext)
 
     # Try filetype library for magic-byte detection if available
     if mime is None:
@@ -95,7 +44,7 @@ def detect_file_type(file_path: str) -> FileInfo:
                 mime = kind.mime
                 if not ext:
                     ext = kind.extension or ""
-                    category = _CATEGORY_MAP.get(ext, "unknown")
+                    category = CATEGORY_MAP.get(ext, "unknown")
         except (ImportError, Exception):
             pass
 
@@ -1,11 +1,21 @@
 """Optional utility building blocks for consumers who want smart routing."""
 
-from docfold.utils.pre_analysis import FileAnalysis, pre_analyze
+from docfold.utils._pdf_cache import clear_pdf_cache, release_pdf
+from docfold.utils.pre_analysis import (
+    FileAnalysis,
+    pre_analyze,
+    pre_analyze_directory,
+    pre_analyze_many,
+)
 from docfold.utils.quality import QualityThresholds, quality_ok
 
 __all__ = [
     "FileAnalysis",
     "QualityThresholds",
+    "clear_pdf_cache",
     "pre_analyze",
+    "pre_analyze_directory",
+    "pre_analyze_many",
     "quality_ok",
+    "release_pdf",
 ]
@@ -0,0 +1,137 @@
+"""Process-wide cache of opened PyMuPDF documents.
+
+Opening a PDF parses its xref table and catalog.  When ``pre_analyze`` runs
+ahead of ``router.process`` on the same file, both would pay for that work;
+:func:`borrow_pdf` hands out one shared :class:`pymupdf.Document` instead.
+
+Entries are keyed by ``(absolute path, mtime_ns, size)``, so a modified file
+is reopened.  MuPDF documents are not safe for concurrent use, so each
+entry carries its own lock and borrowers of the same document are
+serialized.  Callers must not close a borrowed document.
+
+Up to ``_MAX_OPEN_DOCUMENTS`` documents stay open between calls, and an
+open document keeps its file open (on Windows, locked).  Documents are
+closed when evicted, by :func:`release_pdf` for one file, by
+:func:`clear_pdf_cache`, and at interpreter exit; a document that is still
+borrowed is closed when its last borrow ends.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+_MAX_OPEN_DOCUMENTS = 8
+
+
+class _Entry:
+    __slots__ = ("doc", "lock", "state_lock", "borrowers", "retired", "closed")
+
+    def __init__(self, doc: Any) -> None:
+        self.doc = doc
+        self.lock = threading.Lock()  # serializes use of ``doc``
+        self.state_lock = threading.Lock()  # guards the fields below
+        # Borrows in progress, including ones still waiting for ``lock``.
+        self.borrowers = 0
+        # Evicted or released; closed once ``borrowers`` drops to zero.
+        self.retired = False
+        self.closed = False
+
+
+_cache: OrderedDict[tuple[str, int, int], _Entry] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@contextmanager
+def borrow_pdf(file_path: str) -> Iterator[Any]:
+    """Yield a cached, open ``pymupdf.Document`` for *file_path*.
+
+    Raises ``ImportError`` if PyMuPDF is not installed.
+    """
+    import pymupdf
+
+    while True:
+        st = os.stat(file_path)
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+        with _cache_lock:
+            entry = _cache.get(key)
+            if entry is not None:
+                _cache.move_to_end(key)
+
+        evicted: list[_Entry] = []
+        if entry is None:
+            opened = _Entry(pymupdf.open(file_path))
+            with _cache_lock:
+                # Another thread may have opened it meanwhile; keep the first.
+                entry = _cache.setdefault(key, opened)
+                while len(_cache) > _MAX_OPEN_DOCUMENTS:
+                    evicted.append(_cache.popitem(last=False)[1])
+            if entry is not opened:
+                opened.doc.close()
+        for old in evicted:
+            _retire(old)
+
+        with entry.state_lock:
+            if entry.retired:
+                # Evicted or released between lookup and now; open it again.
+                continue
+            entry.borrowers += 1
+        break
+
+    try:
+        with entry.lock:
+            yield entry.doc
+    finally:
+        with entry.state_lock:
+            entry.borrowers -= 1
+            close = entry.retired and not entry.borrowers
+        if close:
+            _close(entry)
+
+
+def release_pdf(file_path: str) -> None:
+    """Close and forget every cached document for *file_path*.
+
+    A document that is still borrowed, including by the calling thread, is
+    closed when its last borrow ends.
+    """
+    path = os.path.abspath(file_path)
+    with _cache_lock:
+        keys = [key for key in _cache if key[0] == path]
+        entries = [_cache.pop(key) for key in keys]
+    for entry in entries:
+        _retire(entry)
+
+
+def clear_pdf_cache() -> None:
+    """Close and drop all cached documents (borrowed ones once returned)."""
+    with _cache_lock:
+        entries = list(_cache.values())
+        _cache.clear()
+    for entry in entries:
+        _retire(entry)
+
+
+def _retire(entry: _Entry) -> None:
+    with entry.state_lock:
+        entry.retired = True
+        close = not entry.borrowers
+    if close:
+        _close(entry)
+
+
+def _close(entry: _Entry) -> None:
+    with entry.state_lock:
+        if entry.closed:
+            return
+        entry.closed = True
+    entry.doc.close()
+
+
+atexit.register(clear_pdf_cache)
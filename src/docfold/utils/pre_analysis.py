@@ -17,59 +17,25 @@ Example::
 from __future__ import annotations
 
 import asyncio
+import copy
+import functools
 import logging
 import os
 from dataclasses import dataclass
-from pathlib import Path
 
-logger = logging.getLogger(__name__)
+from docfold.formats import classify, extension_of
+from docfold.utils._pdf_cache import borrow_pdf
 
-# Extension-based MIME type lookup (subset for common document types)
-_MIME_MAP: dict[str, str] = {
-    "pdf": "application/pdf",
-    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    "doc": "application/msword",
-    "pptx": "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    "xls": "application/vnd.ms-excel",
-    "odt": "application/vnd.oasis.opendocument.text",
-    "rtf": "application/rtf",
-    "png": "image/png",
-    "jpg": "image/jpeg",
-    "jpeg": "image/jpeg",
-    "tiff": "image/tiff",
-    "tif": "image/tiff",
-    "bmp": "image/bmp",
-    "webp": "image/webp",
-    "gif": "image/gif",
-    "html": "text/html",
-    "htm": "text/html",
-    "csv": "text/csv",
-    "epub": "application/epub+zip",
-}
+logger = logging.getLogger(__name__)
 
-# Extension → category for non-PDF types
-_CATEGORY_MAP: dict[str, str] = {
-    "png": "image",
-    "jpg": "image",
-    "jpeg": "image",
-    "tiff": "image",
-    "tif": "image",
-    "bmp": "image",
-    "webp": "image",
-    "gif": "image",
-    "docx": "office",
-    "doc": "office",
-    "pptx": "office",
-    "ppt": "office",
-    "xlsx": "office",
-    "xls": "office",
-    "odt": "office",
-    "rtf": "office",
-    "csv": "office",
-    "html": "html",
-    "htm": "html",
-    "epub": "ebook",
+# File category (docfold.formats) → routing category for non-PDF types
+_ROUTING_CATEGORY: dict[str, str] = {
+    "image": "image",
+    "document": "office",
+    "presentation": "office",
+    "spreadsheet": "office",
+    "web": "html",
+    "ebook": "ebook",
 }
 
 # Minimum extracted text length (chars) to consider a PDF as text-based
@@ -78,8 +44,16 @@ _TEXT_LAYER_THRESHOLD = 100
 # Max pages to sample for text layer detection
 _SAMPLE_PAGES = 2
 
+# Language detection is skipped below this many sampled chars (too little
+# signal) and only looks at the first _LANGUAGE_SAMPLE_MAX chars
+_LANGUAGE_SAMPLE_MIN = 200
+_LANGUAGE_SAMPLE_MAX = 1000
 
-@dataclass
+# Number of (path, mtime, size) analyses kept by _analyze_sync
+_CACHE_SIZE = 256
+
+
+@dataclass(slots=True)
 class FileAnalysis:
     """Result of file pre-analysis."""
 
@@ -122,17 +96,94 @@ async def pre_analyze(file_path: str) -> FileAnalysis:
     return await loop.run_in_executor(None, _analyze_sync, file_path)
 
 
+async def pre_analyze_many(
+    file_paths: list[str], *, concurrency: int = 16,
+) -> list[FileAnalysis]:
+    """Run :func:`pre_analyze` over many files, overlapping their I/O.
+
+    At most *concurrency* files are analyzed at once in the default thread
+    pool.  Results are returned in input order; the first failure (e.g. a
+    missing file) propagates, as with :func:`pre_analyze`.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _analyze_one(file_path: str) -> FileAnalysis:
+        async with semaphore:
+            return await loop.run_in_executor(None, _analyze_sync, file_path)
+
+    return list(await asyncio.gather(*(_analyze_one(p) for p in file_paths)))
+
+
+async def pre_analyze_directory(dir_path: str) -> dict[str, FileAnalysis]:
+    """Run :func:`pre_analyze` on every file directly inside *dir_path*.
+
+    Returns ``{file path: analysis}`` in file-name order.  Subdirectories
+    are not descended into.  The whole scan runs in one worker thread; use
+    :func:`pre_analyze_many` to analyze files concurrently.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _analyze_directory_sync, dir_path)
+
+
 def _analyze_sync(file_path: str) -> FileAnalysis:
-    """Synchronous implementation of file analysis."""
-    path = Path(file_path)
-    ext = path.suffix.lstrip(".").lower()
-    mime = _MIME_MAP.get(ext, "application/octet-stream")
-    file_size = os.path.getsize(file_path)
+    """Synchronous implementation of file analysis.
+
+    Results are cached by ``(absolute path, mtime_ns, size)``, so repeated
+    queries for an unchanged file only cost a ``stat``.  Each call returns
+    its own copy of the cached :class:`FileAnalysis`.
+    """
+    return _analyze_with_stat(file_path, os.stat(file_path))
+
+
+def _analyze_with_stat(file_path: str, st: os.stat_result) -> FileAnalysis:
+    try:
+        cached = _analyze_stat(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    except _PdfAnalysisError as fallback:
+        return fallback.analysis
+    return copy.copy(cached)
+
+
+def _analyze_directory_sync(dir_path: str) -> dict[str, FileAnalysis]:
+    """Analyze the regular files directly inside *dir_path*, sorted by name.
+
+    ``os.scandir`` reports the entry type with the listing, so only files
+    are ``stat``-ed, once each.
+    """
+    with os.scandir(dir_path) as entries:
+        files = sorted((e for e in entries if e.is_file()), key=lambda e: e.name)
+    return {e.path: _analyze_with_stat(e.path, e.stat()) for e in files}
+
+
+def clear_cache() -> None:
+    """Forget all cached analyses."""
+    _analyze_stat.cache_clear()
+
+
+class _PdfAnalysisError(Exception):
+    """Carries a fallback analysis out of :func:`_analyze_stat` uncached.
+
+    Raised when PDF inspection fails or pymupdf is missing, so the next
+    query retries instead of returning the degraded result until the file
+    changes.
+    """
+
+    def __init__(self, analysis: FileAnalysis) -> None:
+        super().__init__(analysis.extension)
+        self.analysis = analysis
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def _analyze_stat(file_path: str, _mtime_ns: int, file_size: int) -> FileAnalysis:
+    # _mtime_ns is only part of the cache key.
+    ext = extension_of(file_path)
+    file_category, mime = classify(ext)
+    mime = mime or "application/octet-stream"
 
     if ext == "pdf":
-        return _analyze_pdf(file_path, ext, mime, file_size)
+        return _inspect_pdf(file_path, ext, mime, file_size)
 
-    category = _CATEGORY_MAP.get(ext, "unknown")
+    category = _ROUTING_CATEGORY.get(file_category, "unknown")
     return FileAnalysis(
         mime_type=mime,
         extension=ext,
@@ -142,48 +193,71 @@ def _analyze_sync(file_path: str) -> FileAnalysis:
 
 
 def _analyze_pdf(file_path: str, ext: str, mime: str, file_size: int) -> FileAnalysis:
-    """Analyze a PDF: count pages and detect text layer."""
-    page_count: int | None = None
-    has_text_layer: bool | None = None
-    category = "pdf_text"
+    """Analyze a PDF: count pages and detect text layer.
+
+    Falls back to ``category = "pdf_text"`` with unknown page count and
+    text layer if pymupdf is missing or the file cannot be inspected.
+    """
+    try:
+        return _inspect_pdf(file_path, ext, mime, file_size)
+    except _PdfAnalysisError as fallback:
+        return fallback.analysis
+
+
+def _inspect_pdf(file_path: str, ext: str, mime: str, file_size: int) -> FileAnalysis:
+    """:func:`_analyze_pdf`, raising :class:`_PdfAnalysisError` on fallback."""
     detected_language: str | None = None
 
     try:
         import pymupdf
 
-        doc = pymupdf.open(file_path)
-        page_count = len(doc)
+        with borrow_pdf(file_path) as doc:
+            page_count = len(doc)
+
+            # Sample first N pages for text extraction.  Plain "text" mode
+            # without ligature/whitespace preservation is enough to decide
+            # whether a text layer exists, and sampling stops as soon as the
+            # threshold is crossed.
+            sample_text_parts: list[str] = []
+            sample_text = ""
+            pages_to_check = min(_SAMPLE_PAGES, page_count)
+            for i in range(pages_to_check):
+                page = doc[i]
+                sample_text_parts.append(
+                    page.get_text("text", flags=pymupdf.TEXT_MEDIABOX_CLIP)
+                )
+                sample_text = "".join(sample_text_parts).strip()
+                if len(sample_text) > _TEXT_LAYER_THRESHOLD:
+                    break
 
-        # Sample first N pages for text extraction
-        sample_text_parts: list[str] = []
-        pages_to_check = min(_SAMPLE_PAGES, page_count)
-        for i in range(pages_to_check):
-            page = doc[i]
-            sample_text_parts.append(page.get_text())
-        doc.close()
-
-        sample_text = "".join(sample_text_parts).strip()
         has_text_layer = len(sample_text) > _TEXT_LAYER_THRESHOLD
         category = "pdf_text" if has_text_layer else "pdf_scanned"
 
         # Optional language detection
-        if has_text_layer and sample_text:
+        if has_text_layer and len(sample_text) >= _LANGUAGE_SAMPLE_MIN:
             detected_language = _detect_language(sample_text)
 
     except ImportError:
         logger.debug("pymupdf not installed — skipping PDF text layer detection")
     except Exception:
         logger.warning("Failed to analyze PDF %s", file_path, exc_info=True)
-
-    return FileAnalysis(
+    else:
+        return FileAnalysis(
+            mime_type=mime,
+            extension=ext,
+            file_size_bytes=file_size,
+            category=category,
+            page_count=page_count,
+            has_text_layer=has_text_layer,
+            detected_language=detected_language,
+        )
+
+    raise _PdfAnalysisError(FileAnalysis(
         mime_type=mime,
         extension=ext,
         file_size_bytes=file_size,
-        category=category,
-        page_count=page_count,
-        has_text_layer=has_text_layer,
-        detected_language=detected_language,
-    )
+        category="pdf_text",
+    ))
 
 
 def _detect_language(text: str) -> str | None:
@@ -191,8 +265,10 @@ def _detect_language(text: str) -> str | None:
     try:
         from langdetect import detect
 
-        # Use first 1000 chars for speed
-        return detect(text[:1000])
+        # Use a bounded prefix for speed; short samples are passed as-is
+        if len(text) > _LANGUAGE_SAMPLE_MAX:
+            text = text[:_LANGUAGE_SAMPLE_MAX]
+        return detect(text)
     except ImportError:
         return None
     except Exception:
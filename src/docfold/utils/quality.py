@@ -15,14 +15,29 @@ Example::
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import unicodedata
+from collections.abc import Callable
 from dataclasses import dataclass
+from typing import Any
 
 from docfold.engines.base import EngineResult
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None  # type: ignore[assignment]
 
-@dataclass
+_GIBBERISH_CATEGORIES = frozenset({"Cc", "Cs", "Cn", "Co"})
+_WHITESPACE = frozenset("\n\r\t ")
+_ASTRAL_RE = re.compile("[\U00010000-\U0010FFFF]")
+# Below this length the regex scan beats NumPy's fixed per-call overhead.
+_NUMPY_MIN_LENGTH = 512
+
+
+@dataclass(slots=True)
 class QualityThresholds:
     """Configurable thresholds for quality assessment.
 
@@ -44,21 +59,50 @@ class QualityThresholds:
 
     @classmethod
     def from_env(cls) -> QualityThresholds:
-        """Create thresholds from environment variables, falling back to defaults."""
-        defaults = cls()
-        return cls(
-            min_text_length=int(
-                os.environ.get("DOCFOLD_QUALITY_MIN_TEXT_LENGTH", defaults.min_text_length)
-            ),
-            ocr_confidence_min=float(
-                os.environ.get("DOCFOLD_QUALITY_OCR_CONFIDENCE_MIN", defaults.ocr_confidence_min)
-            ),
-            gibberish_ratio_max=float(
-                os.environ.get(
-                    "DOCFOLD_QUALITY_GIBBERISH_RATIO_MAX", defaults.gibberish_ratio_max
-                )
-            ),
-        )
+        """Create thresholds from environment variables, falling back to defaults.
+
+        Parsing is cached per combination of raw values, so repeated calls
+        only read the environment; changed variables are still picked up.
+        """
+        env = os.environ
+        return cls(*_parse_env_thresholds(
+            env.get("DOCFOLD_QUALITY_MIN_TEXT_LENGTH"),
+            env.get("DOCFOLD_QUALITY_OCR_CONFIDENCE_MIN"),
+            env.get("DOCFOLD_QUALITY_GIBBERISH_RATIO_MAX"),
+        ))
+
+    def compile(self) -> Callable[[EngineResult], bool]:
+        """Return a ``quality_ok`` specialized to these thresholds.
+
+        The thresholds are bound as closure constants, so a batch that
+        checks many results against one configuration skips the attribute
+        loads of :func:`quality_ok`.  Later changes to this instance are not
+        seen by the returned function; compile again instead.
+        """
+        min_length = self.min_text_length
+        confidence_min = self.ocr_confidence_min
+        gibberish_max = self.gibberish_ratio_max
+
+        def check(result: EngineResult) -> bool:
+            return _check(
+                result.content, result.confidence, min_length, confidence_min, gibberish_max,
+            )
+
+        return check
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_env_thresholds(
+    min_text_length: str | None,
+    ocr_confidence_min: str | None,
+    gibberish_ratio_max: str | None,
+) -> tuple[int, float, float]:
+    defaults = QualityThresholds()
+    return (
+        defaults.min_text_length if min_text_length is None else int(min_text_length),
+        defaults.ocr_confidence_min if ocr_confidence_min is None else float(ocr_confidence_min),
+        defaults.gibberish_ratio_max if gibberish_ratio_max is None else float(gibberish_ratio_max),
+    )
 
 
 def quality_ok(result: EngineResult, thresholds: QualityThresholds | None = None) -> bool:
@@ -71,24 +115,51 @@ def quality_ok(result: EngineResult, thresholds: QualityThresholds | None = None
     3. ``gibberish_ratio(result.content) <= gibberish_ratio_max``
 
     This is a standalone utility — NOT called automatically by EngineRouter.
-    Consumers decide when and how to use it.
+    Consumers decide when and how to use it.  For many results checked
+    against the same thresholds, use :meth:`QualityThresholds.compile`.
     """
     if thresholds is None:
         thresholds = QualityThresholds()
-
-    # Check 1: minimum text length
-    if not result.content or len(result.content.strip()) < thresholds.min_text_length:
+    return _check(
+        result.content,
+        result.confidence,
+        thresholds.min_text_length,
+        thresholds.ocr_confidence_min,
+        thresholds.gibberish_ratio_max,
+    )
+
+
+def _check(
+    content: str | None,
+    confidence: float | None,
+    min_length: int,
+    confidence_min: float,
+    gibberish_max: float,
+) -> bool:
+    """Shared body of :func:`quality_ok` and :meth:`QualityThresholds.compile`."""
+    # Cheapest checks first; each O(n) scan runs only if everything before passed.
+
+    # Check 1a: raw length bounds the stripped length, so this rejects without a copy
+    if not content or len(content) < min_length:
         return False
 
     # Check 2: OCR confidence (only if engine reported it)
-    if result.confidence is not None and result.confidence < thresholds.ocr_confidence_min:
+    if confidence is not None and confidence < confidence_min:
         return False
 
-    # Check 3: gibberish ratio
-    if gibberish_ratio(result.content) > thresholds.gibberish_ratio_max:
+    # Check 1b: minimum text length excluding surrounding whitespace
+    if _stripped_length(content) < min_length:
         return False
 
-    return True
+    # Check 3: gibberish ratio
+    return gibberish_ratio(content) <= gibberish_max
+
+
+def _stripped_length(text: str) -> int:
+    """Return ``len(text.strip())`` for non-empty *text*, copying only if needed."""
+    if text[0].isspace() or text[-1].isspace():
+        return len(text.strip())
+    return len(text)
 
 
 def gibberish_ratio(text: str) -> float:
@@ -107,29 +178,109 @@ def gibberish_ratio(text: str) -> float:
     """
     if not text:
         return 0.0
-
-    total = len(text)
-    bad = 0
-    whitespace = {"\n", "\r", "\t", " "}
-
-    for ch in text:
-        if ch in whitespace:
-            continue
-        cat = unicodedata.category(ch)
-        # Control chars, surrogates, unassigned, private-use
-        if cat in ("Cc", "Cs", "Cn", "Co"):
-            bad += 1
-        # Box-drawing, block elements, geometric shapes (common OCR garbage)
-        elif _is_box_or_block(ch):
+    if text.isascii():
+        # Deleting every non-gibberish byte leaves exactly the ones to count.
+        return len(text.encode("ascii").translate(None, _ascii_non_gibberish())) / len(text)
+    if np is not None and len(text) >= _NUMPY_MIN_LENGTH:
+        return _gibberish_count_numpy(text) / len(text)
+
+    # BMP code points are classified once into a bitset, compiled into a
+    # regex character class, so counting is a C-level scan; the rare astral
+    # characters are checked individually.
+    bad = len(text) - len(_bmp_gibberish_re().sub("", text))
+    for ch in _ASTRAL_RE.findall(text):
+        if unicodedata.category(ch) in _GIBBERISH_CATEGORIES:
             bad += 1
 
-    return bad / total
+    return bad / len(text)
+
 
+def _gibberish_count_numpy(text: str) -> int:
+    """Count gibberish characters with one lookup-table pass over the code points.
 
-def _is_box_or_block(ch: str) -> bool:
-    """Check if a character is a box-drawing or block element (common OCR artifacts)."""
-    cp = ord(ch)
-    # Box Drawing: U+2500–U+257F
-    # Block Elements: U+2580–U+259F
-    # Geometric Shapes: U+25A0–U+25FF (includes ☐, ▒, ▓, etc.)
-    return 0x2500 <= cp <= 0x25FF
+    The pass is a numba-compiled loop when numba is installed, otherwise a
+    NumPy gather; astral code points are classified individually.
+    """
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    kernel = _numba_gibberish_count()
+    if kernel is not None:
+        bad, astral_count = kernel(codes, _gibberish_lut())
+        if not astral_count:
+            return bad
+        astral = codes > 0xFFFF
+    else:
+        astral = codes > 0xFFFF
+        bad = int(np.count_nonzero(_gibberish_lut()[codes & 0xFFFF] & ~astral))
+        if not astral.any():
+            return bad
+    return bad + sum(
+        unicodedata.category(chr(cp)) in _GIBBERISH_CATEGORIES
+        for cp in codes[astral].tolist()
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _numba_gibberish_count() -> Callable[[Any, Any], tuple[int, int]] | None:
+    """Compile the lookup-table count with numba, if installed."""
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, nogil=True)
+    def _kernel(codes, lut):  # pragma: no cover - runs as native code
+        bad = 0
+        astral = 0
+        for i in range(codes.shape[0]):
+            cp = codes[i]
+            if cp > 0xFFFF:
+                astral += 1
+            elif lut[cp]:
+                bad += 1
+        return bad, astral
+
+    return _kernel
+
+
+@functools.lru_cache(maxsize=1)
+def _ascii_non_gibberish() -> bytes:
+    """Return every byte value that is *not* a gibberish ASCII character."""
+    bits = _gibberish_bitset()
+    return bytes(b for b in range(256) if b > 0x7F or not (bits[b >> 3] >> (b & 7)) & 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _gibberish_lut():
+    """Expand the bitset into a 65536-entry boolean NumPy lookup table."""
+    bits = np.frombuffer(_gibberish_bitset(), dtype=np.uint8)
+    return np.unpackbits(bits, bitorder="little").astype(bool)
+
+
+@functools.lru_cache(maxsize=1)
+def _gibberish_bitset() -> bytes:
+    """Return an 8 KiB bitset; bit *cp* is set iff BMP code point *cp* is gibberish."""
+    bits = bytearray(0x10000 // 8)
+    for cp in range(0x10000):
+        ch = chr(cp)
+        if ch not in _WHITESPACE and unicodedata.category(ch) in _GIBBERISH_CATEGORIES:
+            bits[cp >> 3] |= 1 << (cp & 7)
+    # Box drawing (U+2500–U+257F), block elements (U+2580–U+259F) and
+    # geometric shapes (U+25A0–U+25FF, includes ☐, ▒, ▓): common OCR garbage.
+    bits[0x2500 >> 3 : 0x2600 >> 3] = b"\xff" * ((0x2600 - 0x2500) >> 3)
+    return bytes(bits)
+
+
+@functools.lru_cache(maxsize=1)
+def _bmp_gibberish_re() -> re.Pattern[str]:
+    """Compile a character class matching every code point set in the bitset."""
+    bits = _gibberish_bitset()
+    ranges: list[str] = []
+    start = -1
+    for cp in range(0x10001):
+        if cp < 0x10000 and (bits[cp >> 3] >> (cp & 7)) & 1:
+            if start < 0:
+                start = cp
+        elif start >= 0:
+            ranges.append(f"\\U{start:08x}-\\U{cp - 1:08x}")
+            start = -1
+    return re.compile(f"[{''.join(ranges)}]")
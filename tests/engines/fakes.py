@@ -0,0 +1,41 @@
+"""In-memory engine double shared by the router and batch tests."""
+
+from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
+
+
+class FakeEngine(DocumentEngine):
+    """Returns ``"content of <file>"`` instantly; raises for paths in *fail_on*."""
+
+    def __init__(self, name="fake", extensions=None, available=True, fail_on=None):
+        self._name = name
+        self._extensions = extensions or {"pdf", "docx"}
+        self._available = available
+        self._fail_on = fail_on or set()
+        # Results are deterministic and never mutated by the router, so repeat
+        # calls for the same file and format share one instance.
+        self._results: dict[tuple[str, OutputFormat], EngineResult] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def supported_extensions(self) -> set[str]:
+        return self._extensions
+
+    def is_available(self) -> bool:
+        return self._available
+
+    async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
+        if self._fail_on and file_path in self._fail_on:
+            raise RuntimeError(f"Simulated failure on {file_path}")
+        key = (file_path, output_format)
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = EngineResult(
+                content=f"content of {file_path}",
+                format=output_format,
+                engine_name=self._name,
+                processing_time_ms=10,
+            )
+        return result
@@ -1,96 +1,103 @@
 """Tests for engine adapters — unit tests using mocks, no real dependencies needed."""
 
-from unittest.mock import patch
+import json
+import os
+import tempfile
+import types
+from typing import NamedTuple
+from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 import pytest
 
-from docfold.engines.base import EngineCapabilities
+from docfold.engines import textract_engine, unstructured_engine
+from docfold.engines.azure_docint_engine import AzureDocIntEngine
+from docfold.engines.base import DocumentEngine, EngineCapabilities, EngineResult, OutputFormat
+from docfold.engines.chandra_engine import ChandraEngine
+from docfold.engines.docling_engine import DoclingEngine
+from docfold.engines.docling_serve_engine import DoclingServeEngine
+from docfold.engines.easyocr_engine import EasyOCREngine
+from docfold.engines.firecrawl_engine import FirecrawlEngine
+from docfold.engines.google_docai_engine import GoogleDocAIEngine
+from docfold.engines.llamaparse_engine import LlamaParseEngine
+from docfold.engines.marker_engine import MarkerEngine
+from docfold.engines.marker_local_engine import MarkerLocalEngine
+from docfold.engines.mineru_engine import MinerUEngine
+from docfold.engines.mistral_ocr_engine import MistralOCREngine
+from docfold.engines.nougat_engine import NougatEngine
+from docfold.engines.paddleocr_engine import PaddleOCREngine
+from docfold.engines.pymupdf_engine import PyMuPDFEngine
+from docfold.engines.surya_engine import SuryaEngine
+from docfold.engines.tesseract_engine import TesseractEngine
+from docfold.engines.textract_engine import TextractEngine
+from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
+from docfold.engines.unstructured_engine import UnstructuredEngine
+from docfold.engines.zerox_engine import ZeroxEngine
+
+# Stand-in for an installed ``requests`` in availability tests of HTTP-based engines
+_FAKE_REQUESTS = types.ModuleType("requests")
+
+
+class EngineSpec(NamedTuple):
+    engine_cls: type[DocumentEngine]
+    name: str
+    extensions: set[str]
+    """Extensions the engine must support (the exact set if ``exact_extensions``)."""
+    exact_extensions: bool = False
+
+
+ENGINE_SPECS = [
+    EngineSpec(DoclingEngine, "docling", {"pdf", "docx", "pptx", "xlsx", "html", "png", "jpg"}),
+    EngineSpec(MinerUEngine, "mineru", {"pdf"}, True),
+    EngineSpec(MarkerEngine, "marker", {"pdf", "docx", "png"}),
+    EngineSpec(MarkerLocalEngine, "marker_local", {"pdf", "docx", "png"}),
+    EngineSpec(PyMuPDFEngine, "pymupdf", {"pdf"}, True),
+    EngineSpec(PaddleOCREngine, "paddleocr", {"png", "jpg", "pdf", "tiff"}),
+    EngineSpec(TesseractEngine, "tesseract", {"png", "jpg", "pdf", "tiff"}),
+    EngineSpec(EasyOCREngine, "easyocr", {"png", "jpg", "pdf", "tiff"}),
+    EngineSpec(UnstructuredEngine, "unstructured", {"pdf", "docx", "html", "png", "eml"}),
+    EngineSpec(LlamaParseEngine, "llamaparse", {"pdf", "docx", "pptx"}),
+    EngineSpec(MistralOCREngine, "mistral_ocr", {"pdf", "png", "jpg"}),
+    EngineSpec(ZeroxEngine, "zerox", {"pdf", "png"}),
+    EngineSpec(TextractEngine, "textract", {"pdf", "png", "jpg"}),
+    EngineSpec(GoogleDocAIEngine, "google_docai", {"pdf", "png", "jpg"}),
+    EngineSpec(AzureDocIntEngine, "azure_docint", {"pdf", "docx", "xlsx", "pptx", "png"}),
+    EngineSpec(NougatEngine, "nougat", {"pdf"}, True),
+    EngineSpec(SuryaEngine, "surya", {"pdf", "png", "jpg", "jpeg", "tiff", "webp"}),
+    EngineSpec(DoclingServeEngine, "docling_serve", {"pdf", "docx", "png", "html"}),
+    EngineSpec(FirecrawlEngine, "firecrawl", {"pdf", "html", "htm", "xml", "docx", "png", "jpg"}),
+    EngineSpec(ChandraEngine, "chandra", {"pdf", "png", "jpg", "jpeg", "tiff", "bmp", "webp"}),
+    EngineSpec(
+        UnlimitedOCREngine, "unlimited_ocr",
+        {"pdf", "png", "jpg", "jpeg", "tiff", "bmp", "webp"},
+    ),
+]
 
 
 class TestDoclingEngine:
-    def test_name(self):
-        from docfold.engines.docling_engine import DoclingEngine
-        e = DoclingEngine()
-        assert e.name == "docling"
-
-    def test_supported_extensions(self):
-        from docfold.engines.docling_engine import DoclingEngine
-        e = DoclingEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "pptx" in exts
-        assert "xlsx" in exts
-        assert "html" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.docling_engine import DoclingEngine
-        e = DoclingEngine()
-        with patch.dict("sys.modules", {"docling": None}):
-            # Even with mock, the import check may vary
-            # Just verify is_available returns bool
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.docling_engine import DoclingEngine
         e = DoclingEngine(pipeline="vlm", ocr_enabled=False)
         assert e._pipeline == "vlm"
         assert e._ocr_enabled is False
 
 
 class TestMinerUEngine:
-    def test_name(self):
-        from docfold.engines.mineru_engine import MinerUEngine
-        e = MinerUEngine()
-        assert e.name == "mineru"
-
-    def test_supported_extensions(self):
-        from docfold.engines.mineru_engine import MinerUEngine
-        e = MinerUEngine()
-        assert e.supported_extensions == {"pdf"}
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.mineru_engine import MinerUEngine
-        e = MinerUEngine()
-        with patch.dict("sys.modules", {"mineru": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.mineru_engine import MinerUEngine
         e = MinerUEngine(config_path="/tmp/cfg.yaml", gpu=True)
         assert e._config_path == "/tmp/cfg.yaml"
         assert e._gpu is True
 
     def test_default_backend_is_pipeline(self):
-        from docfold.engines.mineru_engine import MinerUEngine
         e = MinerUEngine()
         assert e._backend == "pipeline"
 
     def test_backend_config_stored(self):
-        from docfold.engines.mineru_engine import MinerUEngine
         e = MinerUEngine(backend="vlm", parse_method="ocr")
         assert e._backend == "vlm"
         assert e._parse_method == "ocr"
 
-    def test_capabilities(self):
-        from docfold.engines.mineru_engine import MinerUEngine
-        e = MinerUEngine()
-        caps = e.capabilities
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-
     def test_is_available_when_installed(self):
         """When mineru is importable, is_available returns True."""
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.mineru_engine import MinerUEngine
         e = MinerUEngine()
         with patch.dict("sys.modules", {"mineru": MagicMock()}):
             result = e.is_available()
@@ -99,12 +106,6 @@ class TestMinerUEngine:
     @pytest.mark.asyncio
     async def test_process_returns_engine_result(self, tmp_path):
         """MinerU 2.x engine processes a PDF via do_parse and returns a result."""
-        import os
-        from unittest.mock import patch
-
-        from docfold.engines.base import EngineResult, OutputFormat
-        from docfold.engines.mineru_engine import MinerUEngine
-
         def fake_do_parse(output_dir, pdf_file_names, *args, **kwargs):
             # Mimic MinerU 2.x pipeline layout: output_dir/<name>/<parse_method>/<name>.md
             name = pdf_file_names[0]
@@ -130,12 +131,6 @@ class TestMinerUEngine:
     @pytest.mark.asyncio
     async def test_process_json_output_format(self, tmp_path):
         """MinerU returns content_list JSON when output_format is JSON."""
-        import os
-        from unittest.mock import patch
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.mineru_engine import MinerUEngine
-
         def fake_do_parse(output_dir, pdf_file_names, *args, **kwargs):
             name = pdf_file_names[0]
             parse_method = kwargs.get("parse_method", "auto")
@@ -157,12 +152,6 @@ class TestMinerUEngine:
     @pytest.mark.asyncio
     async def test_process_forwards_page_range_and_lang(self, tmp_path):
         """MinerU forwards start_page/end_page as start_page_id/end_page_id and lang."""
-        import os
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.mineru_engine import MinerUEngine
-
         def fake_do_parse(output_dir, pdf_file_names, *args, **kwargs):
             name = pdf_file_names[0]
             parse_method = kwargs.get("parse_method", "auto")
@@ -191,12 +180,6 @@ class TestMinerUEngine:
     @pytest.mark.asyncio
     async def test_process_vlm_backend_reads_vlm_subdir(self, tmp_path):
         """With backend='vlm', output is read from the 'vlm' subdirectory."""
-        import os
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.mineru_engine import MinerUEngine
-
         def fake_do_parse(output_dir, pdf_file_names, *args, **kwargs):
             name = pdf_file_names[0]
             md_dir = os.path.join(output_dir, name, "vlm")
@@ -217,37 +200,19 @@ class TestMinerUEngine:
 
 
 class TestMarkerEngine:
-    def test_name(self):
-        from docfold.engines.marker_engine import MarkerEngine
-        e = MarkerEngine()
-        assert e.name == "marker"
-
-    def test_supported_extensions(self):
-        from docfold.engines.marker_engine import MarkerEngine
-        e = MarkerEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "png" in exts
-
-    def test_is_available_without_key(self):
-        from docfold.engines.marker_engine import MarkerEngine
-        with patch.dict("os.environ", {}, clear=True):
-            e = MarkerEngine(api_key=None)
-            # No API key → not available (even if requests is installed)
-            assert e.is_available() is False
+    def test_is_available_without_key(self, monkeypatch):
+        monkeypatch.delenv("MARKER_API_KEY", raising=False)
+        monkeypatch.delenv("DATALAB_API_KEY", raising=False)
+        e = MarkerEngine(api_key=None)
+        # No API key → not available (even if requests is installed)
+        assert e.is_available() is False
 
     def test_is_available_with_key(self):
-        import types
-        from unittest.mock import patch
-
-        from docfold.engines.marker_engine import MarkerEngine
         e = MarkerEngine(api_key="test-key-123")
-        with patch.dict("sys.modules", {"requests": types.ModuleType("requests")}):
+        with patch.dict("sys.modules", {"requests": _FAKE_REQUESTS}):
             assert e.is_available() is True
 
     def test_config_stored(self):
-        from docfold.engines.marker_engine import MarkerEngine
         e = MarkerEngine(api_key="k", mode="fast", paginate=True)
         assert e._api_key == "k"
         assert e._defaults["mode"] == "fast"
@@ -255,50 +220,13 @@ class TestMarkerEngine:
 
 
 class TestMarkerLocalEngine:
-    def test_name(self):
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-        e = MarkerLocalEngine()
-        assert e.name == "marker_local"
-
-    def test_supported_extensions(self):
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-        e = MarkerLocalEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "png" in exts
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-        e = MarkerLocalEngine()
-        with patch.dict("sys.modules", {"marker": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
         e = MarkerLocalEngine(force_ocr=True)
         assert e._force_ocr is True
 
-    def test_capabilities(self):
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-        e = MarkerLocalEngine()
-        caps = e.capabilities
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-
     @pytest.mark.asyncio
     async def test_process_returns_engine_result(self):
         """MarkerLocal engine processes a PDF and returns a valid EngineResult."""
-        import os
-        import tempfile
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import EngineResult, OutputFormat
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-
         mock_rendered = MagicMock()
         mock_converter = MagicMock(return_value=mock_rendered)
 
@@ -324,14 +252,6 @@ class TestMarkerLocalEngine:
     @pytest.mark.asyncio
     async def test_process_json_output(self):
         """MarkerLocal returns JSON wrapping markdown content."""
-        import json
-        import os
-        import tempfile
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.marker_local_engine import MarkerLocalEngine
-
         mock_rendered = MagicMock()
         mock_converter = MagicMock(return_value=mock_rendered)
 
@@ -355,28 +275,6 @@ class TestMarkerLocalEngine:
 
 
 class TestPyMuPDFEngine:
-    def test_name(self):
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        e = PyMuPDFEngine()
-        assert e.name == "pymupdf"
-
-    def test_supported_extensions(self):
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        e = PyMuPDFEngine()
-        assert e.supported_extensions == {"pdf"}
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        e = PyMuPDFEngine()
-        with patch.dict("sys.modules", {"fitz": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
-    def test_capabilities_declare_bounding_boxes(self):
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        e = PyMuPDFEngine()
-        assert e.capabilities.bounding_boxes is True
-
     @pytest.mark.asyncio
     async def test_process_returns_bounding_boxes(self, tmp_path):
         """PyMuPDF should return bounding boxes for a simple PDF."""
@@ -385,9 +283,6 @@ class TestPyMuPDFEngine:
         except ImportError:
             pytest.skip("pymupdf not installed")
 
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-
         # Create a minimal PDF with text
         pdf_path = str(tmp_path / "test.pdf")
         doc = fitz.open()
@@ -421,9 +316,6 @@ class TestPyMuPDFEngine:
         except ImportError:
             pytest.skip("pymupdf not installed")
 
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-
         pdf_path = str(tmp_path / "test.pdf")
         doc = fitz.open()
         # Letter size: 612 x 792 points
@@ -465,9 +357,6 @@ class TestPyMuPDFEngine:
         except ImportError:
             pytest.skip("pymupdf not installed")
 
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-
         pdf_path = str(tmp_path / "test.pdf")
         doc = fitz.open()
         page = doc.new_page(width=595, height=842)  # A4
@@ -499,295 +388,244 @@ class TestPyMuPDFEngine:
 
 
 class TestPaddleOCREngine:
-    def test_name(self):
-        from docfold.engines.paddleocr_engine import PaddleOCREngine
-        e = PaddleOCREngine()
-        assert e.name == "paddleocr"
-
-    def test_supported_extensions(self):
-        from docfold.engines.paddleocr_engine import PaddleOCREngine
-        e = PaddleOCREngine()
-        exts = e.supported_extensions
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "pdf" in exts
-        assert "tiff" in exts
-
     def test_config_stored(self):
-        from docfold.engines.paddleocr_engine import PaddleOCREngine
         e = PaddleOCREngine(lang="ru")
         assert e._lang == "ru"
 
-    def test_is_available_returns_bool(self):
-        from docfold.engines.paddleocr_engine import PaddleOCREngine
-        e = PaddleOCREngine()
-        assert isinstance(e.is_available(), bool)
-
 
 class TestTesseractEngine:
-    def test_name(self):
-        from docfold.engines.tesseract_engine import TesseractEngine
-        e = TesseractEngine()
-        assert e.name == "tesseract"
-
-    def test_supported_extensions(self):
-        from docfold.engines.tesseract_engine import TesseractEngine
-        e = TesseractEngine()
-        exts = e.supported_extensions
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "pdf" in exts
-        assert "tiff" in exts
-
     def test_config_stored(self):
-        from docfold.engines.tesseract_engine import TesseractEngine
         e = TesseractEngine(lang="rus")
         assert e._lang == "rus"
 
-    def test_is_available_returns_bool(self):
-        from docfold.engines.tesseract_engine import TesseractEngine
-        e = TesseractEngine()
-        assert isinstance(e.is_available(), bool)
+    @pytest.mark.asyncio
+    async def test_process_image(self):
+        fake_tess = MagicMock()
+        fake_tess.image_to_string.return_value = "  Hello OCR \n"
+        fake_tess.image_to_data.return_value = {"conf": ["90", "-1", "70"]}
+
+        with patch("docfold.engines.tesseract_engine._ensure_imports"), \
+             patch("docfold.engines.tesseract_engine.pytesseract", fake_tess), \
+             patch("docfold.engines.tesseract_engine.Image", MagicMock()):
+            result = await TesseractEngine(lang="deu").process("scan.png")
+
+        assert result.content == "Hello OCR"
+        assert result.format == OutputFormat.TEXT
+        assert result.confidence == pytest.approx(0.8)
+        assert fake_tess.image_to_string.call_args.kwargs["lang"] == "deu"
+
+    def test_ocr_pdf_passes_pages_in_memory(self):
+        pages = [MagicMock(), MagicMock()]
+        fake_convert = MagicMock(return_value=pages)
+        fake_tess = MagicMock()
+        fake_tess.image_to_string.side_effect = ["page one", "page two"]
+        fake_tess.image_to_data.return_value = {"conf": ["80"]}
+
+        with patch("docfold.engines.tesseract_engine.convert_from_path", fake_convert), \
+             patch("docfold.engines.tesseract_engine.pytesseract", fake_tess):
+            text, conf = TesseractEngine()._ocr_pdf("doc.pdf")
+
+        assert text == "page one\n\npage two"
+        assert conf == pytest.approx(0.8)
+        assert fake_convert.call_args.kwargs["thread_count"] >= 1
+        assert [c.args[0] for c in fake_tess.image_to_string.call_args_list] == pages
+        for page in pages:
+            page.save.assert_not_called()
 
 
 class TestEasyOCREngine:
-    def test_name(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
-        e = EasyOCREngine()
-        assert e.name == "easyocr"
-
-    def test_supported_extensions(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
-        e = EasyOCREngine()
-        exts = e.supported_extensions
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "pdf" in exts
-        assert "tiff" in exts
-
     def test_config_stored(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
         e = EasyOCREngine(lang=["ru", "en"], gpu=False)
         assert e._lang == ["ru", "en"]
         assert e._gpu is False
 
     def test_config_defaults(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
         e = EasyOCREngine()
         assert e._lang == ["en"]
         assert e._gpu is True
 
-    def test_is_available_returns_bool(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
-        e = EasyOCREngine()
-        assert isinstance(e.is_available(), bool)
-
-    def test_capabilities(self):
-        from docfold.engines.easyocr_engine import EasyOCREngine
-        e = EasyOCREngine()
-        caps = e.capabilities
-        assert caps.confidence is True
-
 
 class TestUnstructuredEngine:
-    def test_name(self):
-        from docfold.engines.unstructured_engine import UnstructuredEngine
-        e = UnstructuredEngine()
-        assert e.name == "unstructured"
-
-    def test_supported_extensions(self):
-        from docfold.engines.unstructured_engine import UnstructuredEngine
-        e = UnstructuredEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "html" in exts
-        assert "png" in exts
-        assert "eml" in exts
-
     def test_config_stored(self):
-        from docfold.engines.unstructured_engine import UnstructuredEngine
         e = UnstructuredEngine(strategy="hi_res")
         assert e._strategy == "hi_res"
 
-    def test_is_available_returns_bool(self):
-        from docfold.engines.unstructured_engine import UnstructuredEngine
-        e = UnstructuredEngine()
-        assert isinstance(e.is_available(), bool)
+    def test_extract_html_escapes_text(self):
+        title = MagicMock(category="Title", __str__=lambda self: "Q&A")
+        para = MagicMock(category="NarrativeText", __str__=lambda self: "<script>")
+        partition = MagicMock(return_value=[title, para])
+
+        with patch.object(unstructured_engine, "partition", partition):
+            content, meta = unstructured_engine.UnstructuredEngine()._extract(
+                "a.txt", OutputFormat.HTML,
+            )
+
+        assert content == "<html><body><h1>Q&amp;A</h1>\n<p>&lt;script&gt;</p></body></html>"
+        assert meta["element_count"] == 2
+
+    def test_auto_strategy_resolved_by_extension(self):
+        partition = MagicMock(return_value=[])
+        with patch.object(unstructured_engine, "partition", partition):
+            engine = unstructured_engine.UnstructuredEngine()
+            _, meta = engine._extract("notes.MD", OutputFormat.TEXT)
+            assert meta["strategy"] == "fast"
+            engine._extract("scan.pdf", OutputFormat.TEXT)
+
+        assert [c.kwargs["strategy"] for c in partition.call_args_list] == ["fast", "auto"]
+
+    def test_explicit_strategy_not_overridden(self):
+        e = UnstructuredEngine(strategy="hi_res")
+        assert e._resolve_strategy("page.html") == "hi_res"
 
 
 class TestLlamaParseEngine:
-    def test_name(self):
-        from docfold.engines.llamaparse_engine import LlamaParseEngine
-        e = LlamaParseEngine()
-        assert e.name == "llamaparse"
-
-    def test_supported_extensions(self):
-        from docfold.engines.llamaparse_engine import LlamaParseEngine
-        e = LlamaParseEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "pptx" in exts
-
-    def test_is_available_without_key(self):
-        from docfold.engines.llamaparse_engine import LlamaParseEngine
+    def test_is_available_without_key(self, monkeypatch):
+        monkeypatch.delenv("LLAMA_CLOUD_API_KEY", raising=False)
         e = LlamaParseEngine(api_key=None)
         # Without an API key, even if the library is installed, should not be available
         # (or if library is missing, also not available)
         assert e.is_available() is False
 
     def test_config_stored(self):
-        from docfold.engines.llamaparse_engine import LlamaParseEngine
         e = LlamaParseEngine(api_key="test-key", result_type="html")
         assert e._api_key == "test-key"
         assert e._result_type == "html"
 
 
 class TestMistralOCREngine:
-    def test_name(self):
-        from docfold.engines.mistral_ocr_engine import MistralOCREngine
-        e = MistralOCREngine()
-        assert e.name == "mistral_ocr"
-
-    def test_supported_extensions(self):
-        from docfold.engines.mistral_ocr_engine import MistralOCREngine
-        e = MistralOCREngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-
-    def test_is_available_without_key(self):
-        from docfold.engines.mistral_ocr_engine import MistralOCREngine
+    def test_is_available_without_key(self, monkeypatch):
+        monkeypatch.delenv("MISTRAL_API_KEY", raising=False)
         e = MistralOCREngine(api_key=None)
         assert e.is_available() is False
 
     def test_config_stored(self):
-        from docfold.engines.mistral_ocr_engine import MistralOCREngine
         e = MistralOCREngine(api_key="mk", model="pixtral-large")
         assert e._api_key == "mk"
         assert e._model == "pixtral-large"
 
 
 class TestZeroxEngine:
-    def test_name(self):
-        from docfold.engines.zerox_engine import ZeroxEngine
-        e = ZeroxEngine()
-        assert e.name == "zerox"
-
-    def test_supported_extensions(self):
-        from docfold.engines.zerox_engine import ZeroxEngine
-        e = ZeroxEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-
     def test_config_stored(self):
-        from docfold.engines.zerox_engine import ZeroxEngine
         e = ZeroxEngine(model="claude-3-opus", provider="anthropic")
         assert e._model == "claude-3-opus"
         assert e._provider == "anthropic"
 
-    def test_is_available_returns_bool(self):
-        from docfold.engines.zerox_engine import ZeroxEngine
-        e = ZeroxEngine()
-        assert isinstance(e.is_available(), bool)
+    async def test_html_escapes_page_text(self):
+        async def fake_zerox(file_path, model):
+            return types.SimpleNamespace(pages=[
+                types.SimpleNamespace(page=1, content="a < b & c"),
+            ])
+
+        with patch.dict("sys.modules", {"pyzerox": types.SimpleNamespace(zerox=fake_zerox)}):
+            content, _ = await ZeroxEngine()._run_zerox("a.pdf", OutputFormat.HTML)
+        assert content == (
+            "<html><body><div class='page' data-page='1'>"
+            "<p>a &lt; b &amp; c</p></div></body></html>"
+        )
 
 
 class TestTextractEngine:
-    def test_name(self):
-        from docfold.engines.textract_engine import TextractEngine
-        e = TextractEngine()
-        assert e.name == "textract"
-
-    def test_supported_extensions(self):
-        from docfold.engines.textract_engine import TextractEngine
-        e = TextractEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-
     def test_config_stored(self):
-        from docfold.engines.textract_engine import TextractEngine
         e = TextractEngine(region_name="eu-west-1")
         assert e._region_name == "eu-west-1"
 
-    def test_capabilities(self):
-        from docfold.engines.textract_engine import TextractEngine
-        e = TextractEngine()
-        caps = e.capabilities
-        assert caps.bounding_boxes is True
-        assert caps.confidence is True
-        assert caps.table_structure is True
-        assert caps.reading_order is True
-
-    def test_is_available_returns_bool(self):
-        from docfold.engines.textract_engine import TextractEngine
-        e = TextractEngine()
-        assert isinstance(e.is_available(), bool)
+    def test_missing_credentials_rechecked(self, monkeypatch):
+        """Credentials configured after a failed lookup are picked up."""
+        session = MagicMock()
+        session.return_value.get_credentials.return_value = None
+        monkeypatch.setattr(textract_engine, "boto3", types.SimpleNamespace(Session=session))
+        monkeypatch.setattr(textract_engine, "_credentials_found", False)
+
+        assert textract_engine._has_aws_credentials() is False
+        session.return_value.get_credentials.return_value = object()
+        assert textract_engine._has_aws_credentials() is True
+        assert textract_engine._has_aws_credentials() is True
+        assert session.call_count == 2
+
+    def test_extract_table_keeps_sparse_rows(self):
+        def cell(cid, row, col, word_id):
+            return {
+                "Id": cid, "BlockType": "CELL", "RowIndex": row, "ColumnIndex": col,
+                "Relationships": [{"Type": "CHILD", "Ids": [word_id]}],
+            }
+
+        blocks = [
+            cell("c1", 1, 1, "w1"), cell("c2", 1, 2, "w2"), cell("c3", 2, 2, "w3"),
+            {"Id": "w1", "BlockType": "WORD", "Text": "Name"},
+            {"Id": "w2", "BlockType": "WORD", "Text": "Qty"},
+            {"Id": "w3", "BlockType": "WORD", "Text": "3"},
+        ]
+        table = {"Relationships": [{"Type": "CHILD", "Ids": ["c3", "c1", "c2"]}]}
+        block_map = {b["Id"]: b for b in blocks}
+
+        result = TextractEngine()._extract_table(table, block_map)
+        assert result == {"rows": [
+            {"col_1": "Name", "col_2": "Qty"},
+            {"col_2": "3"},
+        ]}
+
+    def test_extract_table_without_cells(self):
+        assert TextractEngine()._extract_table({"Relationships": []}, {}) is None
+
+    def test_large_file_without_bucket_raises(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("TEXTRACT_S3_BUCKET", raising=False)
+        f = tmp_path / "big.pdf"
+        f.write_bytes(b"%PDF")
+        mock_boto3 = MagicMock()
+        with patch.object(textract_engine, "boto3", mock_boto3), \
+             patch.object(textract_engine, "_MAX_INLINE_BYTES", 1):
+            with pytest.raises(ValueError, match="TEXTRACT_S3_BUCKET"):
+                textract_engine.TextractEngine()._analyze(str(f), OutputFormat.MARKDOWN)
+        mock_boto3.client.return_value.analyze_document.assert_not_called()
+
+    def test_large_file_uses_s3_async_analysis(self, tmp_path):
+        f = tmp_path / "big.pdf"
+        f.write_bytes(b"%PDF")
+        mock_boto3 = MagicMock()
+        client = mock_boto3.client.return_value
+        client.start_document_analysis.return_value = {"JobId": "job-1"}
+        client.get_document_analysis.side_effect = [
+            {"JobStatus": "SUCCEEDED", "NextToken": "t",
+             "Blocks": [{"Id": "1", "BlockType": "LINE", "Text": "Hello"}]},
+            {"Blocks": [{"Id": "2", "BlockType": "LINE", "Text": "World"}]},
+        ]
+        with patch.object(textract_engine, "boto3", mock_boto3), \
+             patch.object(textract_engine, "_MAX_INLINE_BYTES", 1), \
+             patch.dict("sys.modules", {"boto3.s3.transfer": MagicMock()}):
+            engine = textract_engine.TextractEngine(s3_bucket="bucket")
+            content, metadata, *_ = engine._analyze(str(f), OutputFormat.MARKDOWN)
+
+        assert content == "Hello\nWorld"
+        assert metadata["line_count"] == 2
+        client.analyze_document.assert_not_called()
+        client.upload_file.assert_called_once()
+        assert client.upload_file.call_args.args[:2] == (str(f), "bucket")
+        client.delete_object.assert_called_once()
 
 
 class TestGoogleDocAIEngine:
-    def test_name(self):
-        from docfold.engines.google_docai_engine import GoogleDocAIEngine
-        e = GoogleDocAIEngine()
-        assert e.name == "google_docai"
-
-    def test_supported_extensions(self):
-        from docfold.engines.google_docai_engine import GoogleDocAIEngine
-        e = GoogleDocAIEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-
-    def test_is_available_without_config(self):
-        from docfold.engines.google_docai_engine import GoogleDocAIEngine
+    def test_is_available_without_config(self, monkeypatch):
+        monkeypatch.delenv("GOOGLE_DOCAI_PROJECT_ID", raising=False)
+        monkeypatch.delenv("GOOGLE_DOCAI_PROCESSOR_ID", raising=False)
         e = GoogleDocAIEngine(project_id=None, processor_id=None)
         # Without project_id and processor_id → not available
         assert e.is_available() is False
 
     def test_config_stored(self):
-        from docfold.engines.google_docai_engine import GoogleDocAIEngine
         e = GoogleDocAIEngine(project_id="proj", location="eu", processor_id="abc")
         assert e._project_id == "proj"
         assert e._location == "eu"
         assert e._processor_id == "abc"
 
-    def test_capabilities(self):
-        from docfold.engines.google_docai_engine import GoogleDocAIEngine
-        e = GoogleDocAIEngine()
-        caps = e.capabilities
-        assert caps.bounding_boxes is True
-        assert caps.confidence is True
-        assert caps.heading_detection is True
-
 
 class TestAzureDocIntEngine:
-    def test_name(self):
-        from docfold.engines.azure_docint_engine import AzureDocIntEngine
-        e = AzureDocIntEngine()
-        assert e.name == "azure_docint"
-
-    def test_supported_extensions(self):
-        from docfold.engines.azure_docint_engine import AzureDocIntEngine
-        e = AzureDocIntEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "xlsx" in exts
-        assert "pptx" in exts
-        assert "png" in exts
-
-    def test_is_available_without_credentials(self):
-        from docfold.engines.azure_docint_engine import AzureDocIntEngine
+    def test_is_available_without_credentials(self, monkeypatch):
+        monkeypatch.delenv("AZURE_DOCINT_ENDPOINT", raising=False)
+        monkeypatch.delenv("AZURE_DOCINT_KEY", raising=False)
         e = AzureDocIntEngine(endpoint=None, key=None)
         assert e.is_available() is False
 
     def test_config_stored(self):
-        from docfold.engines.azure_docint_engine import AzureDocIntEngine
         e = AzureDocIntEngine(
             endpoint="https://example.cognitiveservices.azure.com/",
             key="test-key",
@@ -797,166 +635,118 @@ class TestAzureDocIntEngine:
         assert e._key == "test-key"
         assert e._model_id == "prebuilt-read"
 
-    def test_capabilities(self):
-        from docfold.engines.azure_docint_engine import AzureDocIntEngine
-        e = AzureDocIntEngine()
-        caps = e.capabilities
-        assert caps.bounding_boxes is True
-        assert caps.confidence is True
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-
 
 class TestNougatEngine:
-    def test_name(self):
-        from docfold.engines.nougat_engine import NougatEngine
-        e = NougatEngine()
-        assert e.name == "nougat"
-
-    def test_supported_extensions(self):
-        from docfold.engines.nougat_engine import NougatEngine
-        e = NougatEngine()
-        assert e.supported_extensions == {"pdf"}
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.nougat_engine import NougatEngine
-        e = NougatEngine()
-        with patch.dict("sys.modules", {"nougat": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.nougat_engine import NougatEngine
         e = NougatEngine(model="facebook/nougat-base", batch_size=4, no_skipping=True)
         assert e._model == "facebook/nougat-base"
         assert e._batch_size == 4
         assert e._no_skipping is True
 
-    def test_capabilities(self):
-        from docfold.engines.nougat_engine import NougatEngine
-        caps = NougatEngine().capabilities
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-
 
 class TestSuryaEngine:
-    def test_name(self):
-        from docfold.engines.surya_engine import SuryaEngine
-        e = SuryaEngine()
-        assert e.name == "surya"
+    def test_config_stored(self):
+        e = SuryaEngine(langs=["en", "ru"])
+        assert e._langs == ["en", "ru"]
+
+    def test_predictors_loaded_once(self):
+        """Predictors (and their model weights) are reused across calls."""
+        line = MagicMock(text="hello", polygon=[[0, 0], [1, 0], [1, 1], [0, 1]], confidence=0.9)
+        det_mod, foundation_mod, rec_mod = MagicMock(), MagicMock(), MagicMock()
+        rec_mod.RecognitionPredictor.return_value.return_value = [MagicMock(text_lines=[line])]
 
-    def test_supported_extensions(self):
-        from docfold.engines.surya_engine import SuryaEngine
         e = SuryaEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "jpeg" in exts
-        assert "tiff" in exts
-        assert "webp" in exts
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.surya_engine import SuryaEngine
+        with patch.dict("sys.modules", {
+            "surya": MagicMock(),
+            "surya.detection": det_mod,
+            "surya.foundation": foundation_mod,
+            "surya.recognition": rec_mod,
+        }), patch.object(e, "_load_images", return_value=[object()]):
+            first = e._do_process("a.png", OutputFormat.MARKDOWN)
+            second = e._do_process("b.png", OutputFormat.MARKDOWN)
+
+        assert first[0] == second[0] == "hello"
+        assert det_mod.DetectionPredictor.call_count == 1
+        assert rec_mod.RecognitionPredictor.call_count == 1
+
+    def test_quantize_int8(self):
+        det_mod, foundation_mod, rec_mod, torch_mod = (
+            MagicMock(), MagicMock(), MagicMock(), MagicMock(),
+        )
+        for mod in (det_mod.DetectionPredictor, foundation_mod.FoundationPredictor):
+            param = MagicMock()
+            param.device.type = "cpu"
+            mod.return_value.model.parameters.return_value = iter([param])
+        quantize = torch_mod.ao.quantization.quantize_dynamic
+
+        e = SuryaEngine(quantize_int8=True)
+        with patch.dict("sys.modules", {
+            "surya": MagicMock(),
+            "surya.detection": det_mod,
+            "surya.foundation": foundation_mod,
+            "surya.recognition": rec_mod,
+            "torch": torch_mod,
+        }):
+            det, _ = e._ensure_predictors()
+
+        assert quantize.call_count == 2
+        assert det.model is quantize.return_value
+        assert rec_mod.RecognitionPredictor.call_args.args[0].model is quantize.return_value
+
+    def test_format_output(self):
+        pages = [
+            {"page": 1, "texts": ["a", "b"], "polygons": [[[0, 0]], [[1, 1]]],
+             "confidences": [0.9, 0.8]},
+            {"page": 2, "texts": ["c"], "polygons": [[[2, 2]]], "confidences": [0.7]},
+        ]
         e = SuryaEngine()
-        with patch.dict("sys.modules", {"surya": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
+        assert e._format_output(pages, OutputFormat.MARKDOWN) == "a\nb\n\nc"
+        data = json.loads(e._format_output(pages, OutputFormat.JSON))
+        assert data["pages"][0]["lines"][1] == {
+            "text": "b", "polygon": [[1, 1]], "confidence": 0.8,
+        }
+        assert data["pages"][1]["page"] == 2
 
-    def test_config_stored(self):
-        from docfold.engines.surya_engine import SuryaEngine
-        e = SuryaEngine(langs=["en", "ru"])
-        assert e._langs == ["en", "ru"]
+    def test_format_output_markdown_keeps_empty_pages(self):
+        def page(n, texts):
+            return {"page": n, "texts": texts, "polygons": [], "confidences": []}
 
-    def test_capabilities(self):
-        from docfold.engines.surya_engine import SuryaEngine
-        caps = SuryaEngine().capabilities
-        assert caps.bounding_boxes is True
-        assert caps.confidence is True
-        assert caps.images is True
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-
-
-class TestEngineCapabilities:
-    """Verify capabilities are declared correctly on engines with non-default values."""
-
-    def test_docling_capabilities(self):
-        from docfold.engines.docling_engine import DoclingEngine
-        caps = DoclingEngine().capabilities
-        assert caps.bounding_boxes is True
-        assert caps.images is True
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-
-    def test_marker_capabilities(self):
-        from docfold.engines.marker_engine import MarkerEngine
-        caps = MarkerEngine(api_key="k").capabilities
-        assert caps.bounding_boxes is True
-        assert caps.images is True
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-
-    def test_paddleocr_capabilities(self):
-        from docfold.engines.paddleocr_engine import PaddleOCREngine
-        caps = PaddleOCREngine().capabilities
-        assert caps.confidence is True
-        assert caps.bounding_boxes is False
-
-    def test_pymupdf_default_capabilities(self):
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        caps = PyMuPDFEngine().capabilities
-        assert caps.bounding_boxes is True
-        assert caps.confidence is False
-        assert caps.table_structure is False
-
-    def test_all_engines_have_capabilities(self):
-        """Every engine must return an EngineCapabilities instance."""
-        from docfold.engines.docling_engine import DoclingEngine
-        from docfold.engines.pymupdf_engine import PyMuPDFEngine
-        from docfold.engines.tesseract_engine import TesseractEngine
-        for cls in [DoclingEngine, PyMuPDFEngine, TesseractEngine]:
-            caps = cls().capabilities
-            assert isinstance(caps, EngineCapabilities)
+        e = SuryaEngine()
+        cases = [
+            [],
+            [page(1, [])],
+            [page(1, []), page(2, ["c"])],
+            [page(1, ["a"]), page(2, []), page(3, ["c", "d"])],
+        ]
+        for pages in cases:
+            expected = "\n\n".join("\n".join(p["texts"]) for p in pages)
+            assert e._format_output(pages, OutputFormat.MARKDOWN) == expected
+
+    def test_format_output_html_escapes_text(self):
+        pages = [
+            {"page": 1, "texts": ["a < b", "x"], "polygons": [None, None],
+             "confidences": [1.0, 1.0]},
+            {"page": 2, "texts": [], "polygons": [], "confidences": []},
+        ]
+        html = SuryaEngine()._format_output(pages, OutputFormat.HTML)
+        assert html == (
+            "<html><body><div class='page' data-page='1'><p>a &lt; b</p><p>x</p></div>\n"
+            "<div class='page' data-page='2'></div></body></html>"
+        )
 
 
 class TestDoclingServeEngine:
-    def test_name(self):
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
-        e = DoclingServeEngine()
-        assert e.name == "docling_serve"
-
-    def test_supported_extensions(self):
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
-        e = DoclingServeEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "docx" in exts
-        assert "png" in exts
-        assert "html" in exts
-
-    def test_is_available_without_url(self):
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
-        with patch.dict("os.environ", {}, clear=True):
-            e = DoclingServeEngine(base_url="")
-            assert e.is_available() is False
+    def test_is_available_without_url(self, monkeypatch):
+        monkeypatch.delenv("DOCLING_SERVE_URL", raising=False)
+        e = DoclingServeEngine(base_url="")
+        assert e.is_available() is False
 
     def test_is_available_with_url(self):
-        import types
-
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
         e = DoclingServeEngine(base_url="https://docling.example.com")
-        with patch.dict("sys.modules", {"requests": types.ModuleType("requests")}):
+        with patch.dict("sys.modules", {"requests": _FAKE_REQUESTS}):
             assert e.is_available() is True
 
     def test_config_stored(self):
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
         e = DoclingServeEngine(
             base_url="https://test.example.com",
             api_key="secret",
@@ -968,22 +758,9 @@ class TestDoclingServeEngine:
         assert e._do_ocr is False
         assert e._timeout == 120
 
-    def test_capabilities(self):
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
-        caps = DoclingServeEngine().capabilities
-        assert isinstance(caps, EngineCapabilities)
-        assert caps.images is True
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-
     @pytest.mark.asyncio
     async def test_process_html(self):
         pytest.importorskip("requests")
-        from unittest.mock import MagicMock
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.docling_serve_engine import DoclingServeEngine
 
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -999,7 +776,6 @@ class TestDoclingServeEngine:
 
         e = DoclingServeEngine(base_url="https://test.example.com")
 
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
             f.write(b"%PDF-1.4 fake")
             tmp_path = f.name
@@ -1017,41 +793,20 @@ class TestDoclingServeEngine:
                 call_args = mock_post.call_args
                 assert "/v1/convert/file" in call_args[0][0]
         finally:
-            import os
             os.unlink(tmp_path)
 
 
 class TestFirecrawlEngine:
-    def test_name(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-        e = FirecrawlEngine()
-        assert e.name == "firecrawl"
-
-    def test_supported_extensions(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-        e = FirecrawlEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "html" in exts
-        assert "htm" in exts
-        assert "xml" in exts
-        assert "docx" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-
-    def test_is_available_without_key(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-        with patch.dict("os.environ", {}, clear=True):
-            e = FirecrawlEngine(api_key=None)
-            assert e.is_available() is False
+    def test_is_available_without_key(self, monkeypatch):
+        monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+        e = FirecrawlEngine(api_key=None)
+        assert e.is_available() is False
 
     def test_is_available_with_key(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
         e = FirecrawlEngine(api_key="fc-test-key")
         assert e.is_available() is True
 
     def test_config_stored(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
         e = FirecrawlEngine(
             api_key="fc-key",
             api_url="https://custom.firecrawl.dev",
@@ -1061,25 +816,9 @@ class TestFirecrawlEngine:
         assert e._api_url == "https://custom.firecrawl.dev"
         assert e._timeout == 60
 
-    def test_capabilities(self):
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-        caps = FirecrawlEngine().capabilities
-        assert isinstance(caps, EngineCapabilities)
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-        assert caps.images is False
-
     @pytest.mark.asyncio
     async def test_process_pdf(self):
         """Firecrawl should handle PDF files via urllib POST."""
-        import json
-        from unittest.mock import MagicMock
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-
         api_response = json.dumps({
             "success": True,
             "data": {
@@ -1095,7 +834,6 @@ class TestFirecrawlEngine:
 
         e = FirecrawlEngine(api_key="fc-test")
 
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
             f.write(b"%PDF-1.4 fake pdf content")
             tmp_path = f.name
@@ -1115,18 +853,11 @@ class TestFirecrawlEngine:
             body = json.loads(req.data)
             assert "rawContent" in body
         finally:
-            import os
             os.unlink(tmp_path)
 
     @pytest.mark.asyncio
     async def test_process_html(self):
         """Firecrawl should handle HTML files via urllib POST."""
-        import json
-        from unittest.mock import MagicMock
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-
         api_response = json.dumps({
             "success": True,
             "data": {
@@ -1142,7 +873,6 @@ class TestFirecrawlEngine:
 
         e = FirecrawlEngine(api_key="fc-test")
 
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix=".html", delete=False, mode="w") as f:
             f.write("<html><body><h1>Page Title</h1><p>Some content</p></body></html>")
             tmp_path = f.name
@@ -1160,20 +890,13 @@ class TestFirecrawlEngine:
             assert "html" in body
             assert "rawContent" not in body
         finally:
-            import os
             os.unlink(tmp_path)
 
     @pytest.mark.asyncio
     async def test_process_api_error(self):
         """Firecrawl should raise on API errors."""
-        from urllib.error import HTTPError
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.firecrawl_engine import FirecrawlEngine
-
         e = FirecrawlEngine(api_key="bad-key")
 
-        import tempfile
         with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
             f.write(b"%PDF-1.4 fake")
             tmp_path = f.name
@@ -1189,37 +912,11 @@ class TestFirecrawlEngine:
                 with pytest.raises(HTTPError):
                     await e.process(tmp_path, output_format=OutputFormat.MARKDOWN)
         finally:
-            import os
             os.unlink(tmp_path)
 
 
 class TestChandraEngine:
-    def test_name(self):
-        from docfold.engines.chandra_engine import ChandraEngine
-        e = ChandraEngine()
-        assert e.name == "chandra"
-
-    def test_supported_extensions(self):
-        from docfold.engines.chandra_engine import ChandraEngine
-        e = ChandraEngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "jpeg" in exts
-        assert "tiff" in exts
-        assert "bmp" in exts
-        assert "webp" in exts
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.chandra_engine import ChandraEngine
-        e = ChandraEngine()
-        with patch.dict("sys.modules", {"chandra": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.chandra_engine import ChandraEngine
         e = ChandraEngine(
             method="hf",
             model="datalab-to/chandra-ocr-2",
@@ -1232,47 +929,12 @@ class TestChandraEngine:
         assert e._vllm_url == "http://localhost:9000"
 
     def test_default_method_is_vllm(self):
-        from docfold.engines.chandra_engine import ChandraEngine
         e = ChandraEngine()
         assert e._method == "vllm"
 
-    def test_capabilities(self):
-        from docfold.engines.chandra_engine import ChandraEngine
-        caps = ChandraEngine().capabilities
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-
 
 class TestUnlimitedOCREngine:
-    def test_name(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-        e = UnlimitedOCREngine()
-        assert e.name == "unlimited_ocr"
-
-    def test_supported_extensions(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-        e = UnlimitedOCREngine()
-        exts = e.supported_extensions
-        assert "pdf" in exts
-        assert "png" in exts
-        assert "jpg" in exts
-        assert "jpeg" in exts
-        assert "tiff" in exts
-        assert "bmp" in exts
-        assert "webp" in exts
-
-    def test_is_available_when_missing(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-        e = UnlimitedOCREngine()
-        with patch.dict("sys.modules", {"torch": None}):
-            result = e.is_available()
-            assert isinstance(result, bool)
-
     def test_config_stored(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
         e = UnlimitedOCREngine(
             mode="base",
             model="baidu/Unlimited-OCR",
@@ -1287,36 +949,18 @@ class TestUnlimitedOCREngine:
         assert e._device == "cpu"
 
     def test_default_mode_is_gundam(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
         e = UnlimitedOCREngine()
         assert e._mode == "gundam"
 
     def test_mode_params(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
         gundam = UnlimitedOCREngine(mode="gundam")._mode_params()
         assert gundam == (1024, 640, True)
         base = UnlimitedOCREngine(mode="base")._mode_params()
         assert base == (1024, 1024, False)
 
-    def test_capabilities(self):
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-        caps = UnlimitedOCREngine().capabilities
-        assert caps.table_structure is True
-        assert caps.heading_detection is True
-        assert caps.reading_order is True
-        assert caps.bounding_boxes is False
-        assert caps.confidence is False
-
     @pytest.mark.asyncio
     async def test_process_returns_engine_result(self):
         """Unlimited-OCR processes an image and returns a valid EngineResult."""
-        import os
-        import tempfile
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import EngineResult, OutputFormat
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-
         mock_model = MagicMock()
         mock_model.infer.return_value = "# Hello\n\nExtracted content"
         mock_tokenizer = MagicMock()
@@ -1344,14 +988,6 @@ class TestUnlimitedOCREngine:
     @pytest.mark.asyncio
     async def test_process_json_output(self):
         """Unlimited-OCR returns per-page JSON when output_format is JSON."""
-        import json
-        import os
-        import tempfile
-        from unittest.mock import MagicMock, patch
-
-        from docfold.engines.base import OutputFormat
-        from docfold.engines.unlimited_ocr_engine import UnlimitedOCREngine
-
         mock_model = MagicMock()
         mock_model.infer.return_value = "page text"
         mock_tokenizer = MagicMock()
@@ -1373,51 +1009,125 @@ class TestUnlimitedOCREngine:
                 os.unlink(f.name)
 
 
-class TestAllEnginesImplementInterface:
-    """Verify every adapter satisfies the DocumentEngine ABC."""
+@pytest.fixture(scope="module", params=ENGINE_SPECS, ids=lambda spec: spec.name)
+def engine_spec(request):
+    """``(spec, engine)`` built once per module; tests using it must not mutate the engine."""
+    spec = request.param
+    return spec, spec.engine_cls()
+
+
+class TestEngineContract:
+    """Read-only checks shared by every adapter, driven by ``ENGINE_SPECS``."""
+
+    def test_name(self, engine_spec):
+        spec, engine = engine_spec
+        assert engine.name == spec.name
 
-    @pytest.mark.parametrize("engine_cls_path", [
-        "docfold.engines.docling_engine.DoclingEngine",
-        "docfold.engines.mineru_engine.MinerUEngine",
-        "docfold.engines.marker_engine.MarkerEngine",
-        "docfold.engines.pymupdf_engine.PyMuPDFEngine",
-        "docfold.engines.paddleocr_engine.PaddleOCREngine",
-        "docfold.engines.tesseract_engine.TesseractEngine",
-        "docfold.engines.easyocr_engine.EasyOCREngine",
-        "docfold.engines.unstructured_engine.UnstructuredEngine",
-        "docfold.engines.llamaparse_engine.LlamaParseEngine",
-        "docfold.engines.mistral_ocr_engine.MistralOCREngine",
-        "docfold.engines.zerox_engine.ZeroxEngine",
-        "docfold.engines.textract_engine.TextractEngine",
-        "docfold.engines.google_docai_engine.GoogleDocAIEngine",
-        "docfold.engines.azure_docint_engine.AzureDocIntEngine",
-        "docfold.engines.nougat_engine.NougatEngine",
-        "docfold.engines.surya_engine.SuryaEngine",
-        "docfold.engines.docling_serve_engine.DoclingServeEngine",
-        "docfold.engines.firecrawl_engine.FirecrawlEngine",
-        "docfold.engines.chandra_engine.ChandraEngine",
-        "docfold.engines.marker_local_engine.MarkerLocalEngine",
-        "docfold.engines.unlimited_ocr_engine.UnlimitedOCREngine",
-    ])
-    def test_has_required_attributes(self, engine_cls_path):
-        module_path, cls_name = engine_cls_path.rsplit(".", 1)
-        import importlib
-        mod = importlib.import_module(module_path)
-        cls = getattr(mod, cls_name)
-        _needs_key = {"MarkerEngine", "LlamaParseEngine", "MistralOCREngine", "FirecrawlEngine"}
-        _needs_url = {"DoclingServeEngine"}
-        if cls_name in _needs_key:
-            engine = cls(api_key="test")
-        elif cls_name in _needs_url:
-            engine = cls(base_url="https://test.example.com")
+    def test_supported_extensions(self, engine_spec):
+        spec, engine = engine_spec
+        assert isinstance(spec.engine_cls.SUPPORTED_EXTENSIONS, frozenset)
+        if spec.exact_extensions:
+            assert engine.supported_extensions == spec.extensions
         else:
-            engine = cls()
+            assert spec.extensions <= engine.supported_extensions
 
-        assert isinstance(engine.name, str)
-        assert len(engine.name) > 0
-        assert isinstance(engine.supported_extensions, set)
-        assert len(engine.supported_extensions) > 0
+    def test_is_available_returns_bool(self, engine_spec):
+        _, engine = engine_spec
         assert isinstance(engine.is_available(), bool)
-        assert hasattr(engine, "process")
-        assert callable(engine.process)
-        assert isinstance(engine.capabilities, EngineCapabilities)
+
+    @pytest.mark.parametrize(("engine_cls", "missing_module"), [
+        (DoclingEngine, "docling"),
+        (MinerUEngine, "mineru"),
+        (MarkerLocalEngine, "marker"),
+        (PyMuPDFEngine, "pymupdf"),
+        (NougatEngine, "nougat"),
+        (SuryaEngine, "surya"),
+        (ChandraEngine, "chandra"),
+        (UnlimitedOCREngine, "torch"),
+        (TextractEngine, "boto3"),
+    ], ids=lambda p: p if isinstance(p, str) else p.__name__)
+    def test_is_available_when_import_missing(self, engine_cls, missing_module):
+        with patch.dict("sys.modules", {missing_module: None}):
+            assert engine_cls().is_available() is False
+
+
+_NEEDS_API_KEY = frozenset({MarkerEngine, LlamaParseEngine, MistralOCREngine, FirecrawlEngine})
+
+
+def _make_engine(engine_cls):
+    """Construct *engine_cls* with the minimum config its constructor checks need."""
+    if engine_cls in _NEEDS_API_KEY:
+        return engine_cls(api_key="test")
+    if engine_cls is DoclingServeEngine:
+        return engine_cls(base_url="https://test.example.com")
+    return engine_cls()
+
+
+_FULL_LAYOUT = {"table_structure": True, "heading_detection": True, "reading_order": True}
+_TEXT_STRUCTURE = {"table_structure": True, "heading_detection": True}
+
+# The complete capabilities matrix; an engine with no enrichments maps to the defaults.
+CAP_EXPECTATIONS: dict[type[DocumentEngine], EngineCapabilities] = {
+    DoclingEngine: EngineCapabilities(bounding_boxes=True, images=True, **_FULL_LAYOUT),
+    MinerUEngine: EngineCapabilities(**_FULL_LAYOUT),
+    MarkerEngine: EngineCapabilities(
+        bounding_boxes=True, confidence=True, images=True, **_TEXT_STRUCTURE,
+    ),
+    MarkerLocalEngine: EngineCapabilities(**_TEXT_STRUCTURE),
+    PyMuPDFEngine: EngineCapabilities(bounding_boxes=True),
+    PaddleOCREngine: EngineCapabilities(confidence=True),
+    TesseractEngine: EngineCapabilities(confidence=True),
+    EasyOCREngine: EngineCapabilities(confidence=True),
+    UnstructuredEngine: EngineCapabilities(**_TEXT_STRUCTURE),
+    LlamaParseEngine: EngineCapabilities(**_TEXT_STRUCTURE),
+    MistralOCREngine: EngineCapabilities(**_TEXT_STRUCTURE),
+    ZeroxEngine: EngineCapabilities(),
+    TextractEngine: EngineCapabilities(
+        bounding_boxes=True, confidence=True, table_structure=True, reading_order=True,
+    ),
+    GoogleDocAIEngine: EngineCapabilities(bounding_boxes=True, confidence=True, **_FULL_LAYOUT),
+    AzureDocIntEngine: EngineCapabilities(bounding_boxes=True, confidence=True, **_FULL_LAYOUT),
+    NougatEngine: EngineCapabilities(**_FULL_LAYOUT),
+    SuryaEngine: EngineCapabilities(
+        bounding_boxes=True, confidence=True, images=True, **_FULL_LAYOUT,
+    ),
+    DoclingServeEngine: EngineCapabilities(images=True, **_FULL_LAYOUT),
+    FirecrawlEngine: EngineCapabilities(**_TEXT_STRUCTURE),
+    ChandraEngine: EngineCapabilities(**_FULL_LAYOUT),
+    UnlimitedOCREngine: EngineCapabilities(**_FULL_LAYOUT),
+}
+
+
+def test_capabilities_matrix_covers_every_engine():
+    assert set(CAP_EXPECTATIONS) == {spec.engine_cls for spec in ENGINE_SPECS}
+
+
+@pytest.mark.parametrize(
+    ("engine_cls", "expected"),
+    [pytest.param(cls, caps, id=cls.__name__) for cls, caps in CAP_EXPECTATIONS.items()],
+)
+def test_capabilities(engine_cls, expected):
+    assert _make_engine(engine_cls).capabilities == expected
+
+
+class TestAllEnginesImplementInterface:
+    """Verify every adapter satisfies the DocumentEngine ABC."""
+
+    @pytest.mark.parametrize(
+        "engine_cls", [spec.engine_cls for spec in ENGINE_SPECS], ids=lambda c: c.__name__,
+    )
+    def test_has_required_attributes(self, engine_cls):
+        engine = _make_engine(engine_cls)
+
+        # One comparison; on failure pytest's dict diff names the broken checks.
+        checks = {
+            "name": isinstance(engine.name, str) and len(engine.name) > 0,
+            "supported_extensions": (
+                engine.supported_extensions is engine_cls.SUPPORTED_EXTENSIONS
+                and len(engine_cls.SUPPORTED_EXTENSIONS) > 0
+            ),
+            "is_available": isinstance(engine.is_available(), bool),
+            "process": callable(getattr(engine, "process", None)),
+            "capabilities": isinstance(engine.capabilities, EngineCapabilities),
+        }
+        assert checks == dict.fromkeys(checks, True)
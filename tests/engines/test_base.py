@@ -49,6 +49,13 @@ class TestEngineResult:
         assert result.confidence == 0.95
         assert "img1.png" in result.images
 
+    def test_slotted(self):
+        result = EngineResult(content="", format=OutputFormat.TEXT, engine_name="test")
+        assert not hasattr(result, "__dict__")
+        result.processing_time_ms = 7  # still mutable
+        with pytest.raises(AttributeError):
+            result.extra = 1
+
 
 class TestDocumentEngineInterface:
     def test_cannot_instantiate_abstract(self):
@@ -1,41 +1,17 @@
 """Tests for batch processing and progress callbacks."""
 
+from collections import Counter
+
 import pytest
 
-from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
+from docfold.engines.base import OutputFormat
 from docfold.engines.router import BatchResult, EngineRouter
+from tests.engines.fakes import FakeEngine
 
 
-class FakeEngine(DocumentEngine):
-    def __init__(self, name="fake", extensions=None, fail_on=None):
-        self._name = name
-        self._extensions = extensions or {"pdf", "docx"}
-        self._fail_on = fail_on or set()
-
-    @property
-    def name(self) -> str:
-        return self._name
-
-    @property
-    def supported_extensions(self) -> set[str]:
-        return self._extensions
-
-    def is_available(self) -> bool:
-        return True
-
-    async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
-        if file_path in self._fail_on:
-            raise RuntimeError(f"Simulated failure on {file_path}")
-        return EngineResult(
-            content=f"content of {file_path}",
-            format=output_format,
-            engine_name=self._name,
-            processing_time_ms=10,
-        )
-
-
-@pytest.fixture
-def router():
+@pytest.fixture(scope="module")
+def default_router():
+    """Failure-free router shared by the module; tests needing ``fail_on`` build their own."""
     return EngineRouter([FakeEngine()])
 
 
@@ -59,48 +35,36 @@ class TestBatchResult:
 
 class TestProcessBatch:
     @pytest.mark.asyncio
-    async def test_all_succeed(self, router):
-        batch = await router.process_batch(["a.pdf", "b.pdf", "c.pdf"])
-        assert batch.total == 3
-        assert batch.succeeded == 3
-        assert batch.failed == 0
-        assert len(batch.results) == 3
-        assert len(batch.errors) == 0
+    @pytest.mark.parametrize(
+        ("files", "fail_on", "expected"),
+        [
+            (["a.pdf", "b.pdf", "c.pdf"], set(), (3, 3, 0)),
+            (["good.pdf", "bad.pdf", "ok.pdf"], {"bad.pdf"}, (3, 2, 1)),
+            (["a.pdf", "b.pdf"], {"a.pdf", "b.pdf"}, (2, 0, 2)),
+            ([], set(), (0, 0, 0)),
+        ],
+        ids=["all_succeed", "partial_failure", "all_fail", "empty_list"],
+    )
+    async def test_batch_outcomes(self, default_router, files, fail_on, expected):
+        router = EngineRouter([FakeEngine(fail_on=fail_on)]) if fail_on else default_router
+        batch = await router.process_batch(files)
+
+        assert (batch.total, batch.succeeded, batch.failed) == expected
         assert batch.total_time_ms >= 0
-        assert "a.pdf" in batch.results
-        assert batch.results["a.pdf"].content == "content of a.pdf"
-
-    @pytest.mark.asyncio
-    async def test_partial_failure(self):
-        engine = FakeEngine(fail_on={"bad.pdf"})
-        router = EngineRouter([engine])
-        batch = await router.process_batch(["good.pdf", "bad.pdf", "ok.pdf"])
-        assert batch.total == 3
-        assert batch.succeeded == 2
-        assert batch.failed == 1
-        assert "good.pdf" in batch.results
-        assert "bad.pdf" in batch.errors
-        assert "Simulated failure" in batch.errors["bad.pdf"]
-
-    @pytest.mark.asyncio
-    async def test_all_fail(self):
-        engine = FakeEngine(fail_on={"a.pdf", "b.pdf"})
-        router = EngineRouter([engine])
-        batch = await router.process_batch(["a.pdf", "b.pdf"])
-        assert batch.succeeded == 0
-        assert batch.failed == 2
-
-    @pytest.mark.asyncio
-    async def test_empty_list(self, router):
-        batch = await router.process_batch([])
-        assert batch.total == 0
-        assert batch.succeeded == 0
+        assert set(batch.errors) == fail_on & set(files)
+        assert set(batch.results) == set(files) - fail_on
+        for fp, result in batch.results.items():
+            assert result.content == f"content of {fp}"
+        for error in batch.errors.values():
+            assert "Simulated failure" in error
 
     @pytest.mark.asyncio
-    async def test_concurrency_respected(self, router):
-        # Just verify it doesn't crash with concurrency=1
-        batch = await router.process_batch(["a.pdf", "b.pdf", "c.pdf"], concurrency=1)
-        assert batch.succeeded == 3
+    @pytest.mark.parametrize("concurrency", [1, 4, 16])
+    async def test_concurrency_respected(self, default_router, concurrency):
+        # Fewer, as many, and more slots than files
+        files = ["a.pdf", "b.pdf", "c.pdf", "d.pdf"]
+        batch = await default_router.process_batch(files, concurrency=concurrency)
+        assert batch.succeeded == 4
 
     @pytest.mark.asyncio
     async def test_engine_hint(self):
@@ -111,35 +75,33 @@ class TestProcessBatch:
         assert batch.results["x.pdf"].engine_name == "beta"
 
     @pytest.mark.asyncio
-    async def test_output_format_passed(self, router):
-        batch = await router.process_batch(["x.pdf"], output_format=OutputFormat.HTML)
+    async def test_output_format_passed(self, default_router):
+        batch = await default_router.process_batch(["x.pdf"], output_format=OutputFormat.HTML)
         assert batch.results["x.pdf"].format == OutputFormat.HTML
 
 
 class TestProgressCallback:
     @pytest.mark.asyncio
-    async def test_callback_called(self, router):
-        events = []
+    async def test_callback_called(self, default_router):
+        counts = Counter()
 
         def on_progress(*, current, total, file_path, engine_name, status, **_):
-            events.append({"current": current, "status": status, "file": file_path})
+            counts[status] += 1
 
-        await router.process_batch(["a.pdf", "b.pdf"], on_progress=on_progress)
+        await default_router.process_batch(["a.pdf", "b.pdf"], on_progress=on_progress)
 
         # Each file gets "processing" + "completed" = 2 events per file
-        statuses = [e["status"] for e in events]
-        assert statuses.count("processing") == 2
-        assert statuses.count("completed") == 2
+        assert counts == {"processing": 2, "completed": 2}
 
     @pytest.mark.asyncio
-    async def test_callback_receives_result_on_complete(self, router):
+    async def test_callback_receives_result_on_complete(self, default_router):
         results_received = []
 
         def on_progress(*, status, result, **_):
             if status == "completed":
                 results_received.append(result)
 
-        await router.process_batch(["a.pdf"], on_progress=on_progress)
+        await default_router.process_batch(["a.pdf"], on_progress=on_progress)
         assert len(results_received) == 1
         assert results_received[0].engine_name == "fake"
 
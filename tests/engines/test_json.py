@@ -0,0 +1,40 @@
+"""Tests for the shared engine JSON serializer."""
+
+import json
+from unittest.mock import patch
+
+from docfold.engines import _json
+from docfold.engines._json import dumps_json, loads_json
+
+
+class TestDumpsJson:
+    def test_round_trip(self):
+        data = {"pages": [{"page": 1, "lines": [{"text": "hi", "confidence": 0.5}]}]}
+        assert json.loads(dumps_json(data)) == data
+
+    def test_non_ascii_not_escaped(self):
+        assert "Привет" in dumps_json([{"text": "Привет"}])
+
+    def test_stdlib_fallback(self):
+        with patch.object(_json, "orjson", None):
+            out = dumps_json({"text": "日本語"})
+        assert out == json.dumps({"text": "日本語"}, ensure_ascii=False)
+
+    def test_falls_back_on_unsupported_input(self):
+        # orjson rejects non-str keys; the stdlib encoder accepts them.
+        assert json.loads(dumps_json({1: "a"})) == {"1": "a"}
+
+    def test_indent_matches_stdlib(self):
+        data = {"a": [1, {"b": "ü"}]}
+        assert dumps_json(data, indent=2) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert dumps_json(data, indent=4) == json.dumps(data, indent=4, ensure_ascii=False)
+
+
+class TestLoadsJson:
+    def test_bytes_and_str(self):
+        raw = '{"text": "Привет"}'
+        assert loads_json(raw.encode()) == loads_json(raw) == {"text": "Привет"}
+
+    def test_stdlib_fallback(self):
+        with patch.object(_json, "orjson", None):
+            assert loads_json(b'{"a": 1}') == {"a": 1}
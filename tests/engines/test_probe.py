@@ -0,0 +1,50 @@
+"""Tests for the cached engine dependency probes."""
+
+import types
+from unittest.mock import patch
+
+import pytest
+
+from docfold.engines import _probe
+from docfold.engines._probe import can_import, has_spec
+
+_MISSING = "docfold_test_no_such_module"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    _probe.clear()
+    yield
+    _probe.clear()
+
+
+class TestCanImport:
+    def test_installed_module(self):
+        assert can_import("json") is True
+
+    def test_failed_import_is_cached(self):
+        with patch.object(_probe.importlib, "import_module", side_effect=ImportError) as imp:
+            assert can_import(_MISSING) is False
+            assert can_import(_MISSING) is False
+        assert imp.call_count == 1
+
+    def test_import_error_of_any_kind_is_unavailable(self):
+        with patch.object(_probe.importlib, "import_module", side_effect=RuntimeError):
+            assert can_import(_MISSING) is False
+
+    def test_sys_modules_takes_precedence_over_cache(self):
+        assert can_import(_MISSING) is False
+        with patch.dict("sys.modules", {_MISSING: types.ModuleType(_MISSING)}):
+            assert can_import(_MISSING) is True
+        with patch.dict("sys.modules", {"json": None}):
+            assert can_import("json") is False
+
+
+class TestHasSpec:
+    def test_found_and_missing(self):
+        assert has_spec("json") is True
+        assert has_spec(_MISSING) is False
+
+    def test_blocked_module(self):
+        with patch.dict("sys.modules", {"json": None}):
+            assert has_spec("json") is False
@@ -1,43 +1,42 @@
 ﻿"""Tests for the EngineRouter."""
 
-import os
-from unittest.mock import patch
+import asyncio
+from unittest.mock import PropertyMock, patch
 
 import pytest
 
-from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
+from docfold.engines.base import OutputFormat
 from docfold.engines.router import EngineRouter
+from tests.engines.fakes import FakeEngine
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-class FakeEngine(DocumentEngine):
-    def __init__(self, name: str, extensions: set[str], available: bool = True):
-        self._name = name
-        self._extensions = extensions
-        self._available = available
+class _SlowEngine(FakeEngine):
+    """Records how many process() calls overlap across all instances."""
 
-    @property
-    def name(self) -> str:
-        return self._name
+    active = 0
+    peak = 0
 
-    @property
-    def supported_extensions(self) -> set[str]:
-        return self._extensions
+    async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
+        cls = type(self)
+        cls.active += 1
+        cls.peak = max(cls.peak, cls.active)
+        await asyncio.sleep(0.001)
+        cls.active -= 1
+        return await super().process(file_path, output_format, **kwargs)
 
-    def is_available(self) -> bool:
-        return self._available
 
-    async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
-        return EngineResult(
-            content=f"processed by {self._name}",
-            format=output_format,
-            engine_name=self._name,
-        )
+@pytest.fixture(autouse=True)
+def _clear_engine_env(monkeypatch):
+    """Keep a developer's ENGINE_DEFAULT from steering selection in these tests."""
+    monkeypatch.delenv("ENGINE_DEFAULT", raising=False)
 
 
-@pytest.fixture
+# Shared by the whole module: tests only read from this router.  Tests that
+# need different engines build their own.
+@pytest.fixture(scope="module")
 def router():
     return EngineRouter([
         FakeEngine("docling", {"pdf", "docx", "png"}, available=True),
@@ -65,26 +64,24 @@ class TestSelect:
         with pytest.raises(RuntimeError, match="not available"):
             r.select("test.pdf", engine_hint="broken")
 
-    def test_env_default(self, router):
-        with patch.dict(os.environ, {"ENGINE_DEFAULT": "marker"}):
-            engine = router.select("test.pdf")
-            assert engine.name == "marker"
+    def test_env_default(self, router, monkeypatch):
+        monkeypatch.setenv("ENGINE_DEFAULT", "marker")
+        engine = router.select("test.pdf")
+        assert engine.name == "marker"
 
-    def test_env_default_skipped_if_unavailable(self):
+    def test_env_default_skipped_if_unavailable(self, monkeypatch):
         r = EngineRouter([
             FakeEngine("broken", {"pdf"}, available=False),
             FakeEngine("fallback", {"pdf"}, available=True),
         ])
-        with patch.dict(os.environ, {"ENGINE_DEFAULT": "broken"}):
-            engine = r.select("test.pdf")
-            assert engine.name == "fallback"
+        monkeypatch.setenv("ENGINE_DEFAULT", "broken")
+        engine = r.select("test.pdf")
+        assert engine.name == "fallback"
 
     def test_fallback_chain(self, router):
         # Without hints, should pick "docling" (first in fallback order)
-        with patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("ENGINE_DEFAULT", None)
-            engine = router.select("test.pdf")
-            assert engine.name == "docling"
+        engine = router.select("test.pdf")
+        assert engine.name == "docling"
 
     def test_extension_filter(self, router):
         # .png is only supported by docling
@@ -102,7 +99,7 @@ class TestProcess:
     async def test_process_delegates(self, router):
         result = await router.process("test.pdf", engine_hint="mineru")
         assert result.engine_name == "mineru"
-        assert "processed by mineru" in result.content
+        assert result.content == "content of test.pdf"
 
 
 class TestCompare:
@@ -119,6 +116,34 @@ class TestCompare:
         results = await router.compare("test.pdf", engines=["docling", "pymupdf"])
         assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_compare_scales_with_bounded_concurrency(self):
+        _SlowEngine.active = _SlowEngine.peak = 0
+        engines = [_SlowEngine(f"e{i}", {"pdf"}) for i in range(100)]
+        r = EngineRouter(engines)
+        results = await r.compare("test.pdf", concurrency=10)
+        assert list(results) == [f"e{i}" for i in range(100)]
+        assert _SlowEngine.peak == 10
+
+    @pytest.mark.asyncio
+    async def test_compare_sequential_by_default(self):
+        _SlowEngine.active = _SlowEngine.peak = 0
+        r = EngineRouter([_SlowEngine(f"e{i}", {"pdf"}) for i in range(5)])
+        assert len(await r.compare("test.pdf")) == 5
+        assert _SlowEngine.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_compare_skips_failed_engines(self):
+        class _Broken(FakeEngine):
+            async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
+                raise RuntimeError("boom")
+
+        r = EngineRouter([
+            FakeEngine("ok", {"pdf"}),
+            _Broken("broken", {"pdf"}),
+        ])
+        assert list(await r.compare("test.pdf")) == ["ok"]
+
 
 class TestExtensionPriority:
     """Test that the router picks the right engine based on file extension."""
@@ -217,3 +242,26 @@ class TestListEngines:
             assert "bounding_boxes" in caps
             assert "confidence" in caps
             assert "table_structure" in caps
+
+    def test_static_metadata_read_once(self):
+        engine = FakeEngine("docling", {"pdf", "docx"})
+        r = EngineRouter([engine])
+        with patch.object(FakeEngine, "capabilities", new_callable=PropertyMock) as caps:
+            first, second = r.list_engines(), r.list_engines()
+        caps.assert_not_called()
+        assert first == second
+        assert first[0]["extensions"] == ["docx", "pdf"]
+
+    def test_list_returns_copies(self, router):
+        listed = router.list_engines()
+        listed[0]["extensions"].append("xyz")
+        listed[0]["capabilities"]["images"] = "mutated"
+        fresh = router.list_engines()[0]
+        assert "xyz" not in fresh["extensions"]
+        assert fresh["capabilities"]["images"] is False
+
+    def test_availability_rechecked(self):
+        engine = FakeEngine("docling", {"pdf"}, available=True)
+        r = EngineRouter([engine])
+        engine._available = False
+        assert r.list_engines()[0]["available"] is False
@@ -1,11 +1,28 @@
 ﻿"""Tests for evaluation metrics."""
 
+import itertools
+from unittest.mock import patch
+
+import pytest
+
 from docfold.evaluation.metrics import (
+    _banded_distance,
+    _count_ascending_pairs,
+    _levenshtein_ratio,
+    _normalize,
+    _numba_levenshtein,
+    _trim_common_affixes,
     compute_cer,
     compute_heading_f1,
+    compute_heading_f1_from_sets,
     compute_reading_order_score,
     compute_table_f1,
+    compute_table_f1_from_cells,
     compute_wer,
+    compute_wer_tokens,
+    intern_tokens,
+    normalize_headings,
+    normalize_table_cells,
 )
 
 
@@ -24,6 +41,98 @@ class TestCER:
     def test_empty_both(self):
         assert compute_cer("", "") == 0.0
 
+    def test_normalized_by_reference_length(self):
+        # 2 insertions over a 4-char reference
+        assert compute_cer("kitxen", "kite") == 0.5
+
+    def test_matches_pure_python_fallback(self):
+        pairs = [("kitten", "sitting"), ("flaw", "lawn"), ("a b c", "a c")]
+        for pred, ref in pairs:
+            assert compute_cer(pred, ref) == _levenshtein_ratio(pred, ref, char_level=True)
+
+    def test_surrounding_whitespace_ignored(self):
+        # jiwer strips both strings before scoring; the other backends match it
+        assert compute_cer("  hello\n", "hello") == 0.0
+        assert compute_cer("kitxen", "\tkite ") == 0.5
+        with patch("docfold.evaluation.metrics._Levenshtein", None), \
+             patch("docfold.evaluation.metrics._jiwer_cer", None):
+            assert compute_cer("kitxen", "\tkite ") == 0.5
+
+    def test_max_error_rate_caps_result(self):
+        # true CER is 1.0; with a 0.25 cutoff over 4 chars the bound is 1 edit
+        assert compute_cer("wxyz", "abcd", max_error_rate=0.25) == 0.5
+        assert compute_cer("abcx", "abcd", max_error_rate=0.25) == 0.25
+
+    def test_max_error_rate_pure_python_fallback(self):
+        with patch("docfold.evaluation.metrics._Levenshtein", None), \
+             patch("docfold.evaluation.metrics._jiwer_cer", None), \
+             patch("docfold.evaluation.metrics._jiwer_wer", None):
+            assert compute_cer("wxyz", "abcd", max_error_rate=0.25) == 0.5
+            assert compute_cer("abcx", "abcd", max_error_rate=0.25) == 0.25
+            assert compute_wer("a b", "a c", max_error_rate=0.5) == 0.5
+
+
+class TestLevenshteinKernels:
+    PAIRS = [("kitten", "sitting"), ("", "abc"), ("a\ud800b", "ab"), ("the cat sat", "a cat sat")]
+
+    def test_numba_matches_pure_python(self):
+        pytest.importorskip("numba")
+        assert _numba_levenshtein() is not None
+        for pred, ref in self.PAIRS:
+            for char_level in (True, False):
+                jit = _levenshtein_ratio(pred, ref, char_level=char_level)
+                with patch("docfold.evaluation.metrics._numba_levenshtein", lambda: None):
+                    pure = _levenshtein_ratio(pred, ref, char_level=char_level)
+                assert jit == pure, (pred, ref, char_level)
+
+    def test_without_numba(self):
+        _numba_levenshtein.cache_clear()
+        try:
+            with patch.dict("sys.modules", {"numba": None}):
+                assert _numba_levenshtein() is None
+        finally:
+            _numba_levenshtein.cache_clear()
+
+
+class TestTrimCommonAffixes:
+    def test_trims_prefix_and_suffix(self):
+        assert _trim_common_affixes(list("xxabcyy"), list("xxbyy")) == (list("abc"), list("b"))
+
+    def test_identical_and_contained(self):
+        assert _trim_common_affixes(list("abc"), list("abc")) == ([], [])
+        assert _trim_common_affixes(list("aaa"), list("aa")) == (["a"], [])
+
+    def test_ratio_unaffected_by_long_shared_context(self):
+        context = "lorem ipsum " * 200
+        pred, ref = context + "kitten" + context, context + "sitting" + context
+        with patch("docfold.evaluation.metrics._numba_levenshtein", lambda: None):
+            assert _levenshtein_ratio(pred, ref, char_level=True) == 3 / len(ref)
+
+
+class TestBandedDistance:
+    @staticmethod
+    def _exact(a, b):
+        return round(_levenshtein_ratio(a, b, char_level=True) * len(b))
+
+    def test_matches_exact_within_band(self):
+        words = ["", "a", "ab", "ba", "abc", "acb", "bca", "aabb", "abab"]
+        for a, b in itertools.product(words, repeat=2):
+            if not b:
+                continue
+            exact = self._exact(a, b)
+            for k in range(4):
+                expected = exact if exact <= k else k + 1
+                assert _banded_distance(list(a), list(b), k) == expected, (a, b, k)
+
+    def test_length_gap_exits_early(self):
+        assert _banded_distance(list("a" * 50), list("a"), 3) == 4
+
+
+    def test_jiwer_used_without_rapidfuzz(self):
+        with patch("docfold.evaluation.metrics._Levenshtein", None), \
+             patch("docfold.evaluation.metrics._jiwer_cer", lambda ref, pred: 0.125):
+            assert compute_cer("abc", "abd") == 0.125
+
 
 class TestWER:
     def test_identical(self):
@@ -37,58 +146,132 @@ class TestWER:
         wer = compute_wer("hello beautiful world", "hello world")
         assert wer > 0
 
+    def test_matches_pure_python_fallback(self):
+        pred, ref = "the quick fox jumps", "the quick brown fox jumped"
+        assert compute_wer(pred, ref) == _levenshtein_ratio(pred, ref, char_level=False)
 
-class TestTableF1:
-    def test_perfect_match(self):
-        tables = [[["a", "b"], ["c", "d"]]]
-        assert compute_table_f1(tables, tables) == 1.0
 
-    def test_no_tables(self):
-        assert compute_table_f1([], []) == 1.0
+class TestWERTokens:
+    CASES = [
+        ("hello world", "hello world"),
+        ("the quick fox jumps", "the quick brown fox jumped"),
+        ("", "some words"),
+        ("extra", "   "),
+    ]
 
-    def test_missing_predicted(self):
-        assert compute_table_f1([], [[["a"]]]) == 0.0
+    def test_matches_compute_wer(self):
+        for pred, ref in self.CASES:
+            assert compute_wer_tokens(intern_tokens(pred), intern_tokens(ref)) == (
+                compute_wer(pred, ref)
+            )
 
-    def test_partial_match(self):
-        predicted = [[["a", "b"], ["c", "x"]]]
-        reference = [[["a", "b"], ["c", "d"]]]
-        f1 = compute_table_f1(predicted, reference)
-        assert 0 < f1 < 1.0
+    def test_matches_compute_wer_without_rapidfuzz(self):
+        with patch("docfold.evaluation.metrics._Levenshtein", None), \
+             patch("docfold.evaluation.metrics._jiwer_wer", None):
+            for pred, ref in self.CASES:
+                assert compute_wer_tokens(pred.split(), ref.split()) == compute_wer(pred, ref)
 
+    def test_intern_tokens(self):
+        a = intern_tokens("".join(["ab", "c"]) + " x")
+        b = intern_tokens("abc y")
+        assert a == ("abc", "x")
+        assert a[0] is b[0]
 
-class TestHeadingF1:
-    def test_perfect(self):
-        h = ["Introduction", "Methods", "Results"]
-        assert compute_heading_f1(h, h) == 1.0
 
-    def test_case_insensitive(self):
-        pred = ["INTRODUCTION", "methods"]
-        ref = ["Introduction", "Methods"]
-        assert compute_heading_f1(pred, ref) == 1.0
+class TestTableF1:
+    @pytest.mark.parametrize(
+        ("predicted", "reference", "check"),
+        [
+            ([[["a", "b"], ["c", "d"]]], [[["a", "b"], ["c", "d"]]], lambda f1: f1 == 1.0),
+            ([], [], lambda f1: f1 == 1.0),
+            ([], [[["a"]]], lambda f1: f1 == 0.0),
+            ([[["a", "b"], ["c", "x"]]], [[["a", "b"], ["c", "d"]]], lambda f1: 0 < f1 < 1.0),
+            # Reference has 4 blank cells; predicting only one matches 1 of them.
+            # tp = 3 (a, b, one blank); precision 3/3, recall 3/6
+            (
+                [[["a", ""], ["b"]]],
+                [[["a", ""], ["", ""], ["", "b"]]],
+                lambda f1: f1 == 2 * 1.0 * 0.5 / 1.5,
+            ),
+        ],
+        ids=["perfect_match", "no_tables", "missing_predicted", "partial_match",
+             "duplicate_cells_counted"],
+    )
+    def test_score(self, predicted, reference, check):
+        assert check(compute_table_f1(predicted, reference))
 
-    def test_empty(self):
-        assert compute_heading_f1([], []) == 1.0
 
-    def test_no_overlap(self):
-        assert compute_heading_f1(["A"], ["B"]) == 0.0
+class TestHeadingF1:
+    @pytest.mark.parametrize(
+        ("pred", "ref", "expected"),
+        [
+            (["Introduction", "Methods", "Results"], ["Introduction", "Methods", "Results"], 1.0),
+            (["INTRODUCTION", "methods"], ["Introduction", "Methods"], 1.0),
+            ([], [], 1.0),
+            (["A"], ["B"], 0.0),
+        ],
+        ids=["perfect", "case_insensitive", "empty", "no_overlap"],
+    )
+    def test_score(self, pred, ref, expected):
+        assert compute_heading_f1(pred, ref) == expected
 
 
 class TestReadingOrder:
-    def test_perfect_order(self):
-        order = ["a", "b", "c", "d"]
-        assert compute_reading_order_score(order, order) == 1.0
-
-    def test_reversed(self):
-        pred = ["d", "c", "b", "a"]
-        ref = ["a", "b", "c", "d"]
-        score = compute_reading_order_score(pred, ref)
-        assert score < 0  # Kendall's tau for reversed = -1
-
-    def test_single_element(self):
-        assert compute_reading_order_score(["a"], ["a"]) == 1.0
-
-    def test_partial_overlap(self):
-        pred = ["a", "c", "b"]
-        ref = ["a", "b", "c"]
-        score = compute_reading_order_score(pred, ref)
-        assert -1 <= score <= 1
+    @pytest.mark.parametrize(
+        ("pred", "ref", "check"),
+        [
+            (["a", "b", "c", "d"], ["a", "b", "c", "d"], lambda s: s == 1.0),
+            # Kendall's tau for reversed = -1
+            (["d", "c", "b", "a"], ["a", "b", "c", "d"], lambda s: s < 0),
+            (["a"], ["a"], lambda s: s == 1.0),
+            (["a", "c", "b"], ["a", "b", "c"], lambda s: -1 <= s <= 1),
+        ],
+        ids=["perfect_order", "reversed", "single_element", "partial_overlap"],
+    )
+    def test_order(self, pred, ref, check):
+        assert check(compute_reading_order_score(pred, ref))
+
+    def test_fallback_matches_pairwise_tau(self):
+        pred = ["b", "a", "d", "c", "e"]
+        ref = ["a", "b", "c", "d", "e"]
+        with patch.dict("sys.modules", {"scipy": None, "scipy.stats": None}):
+            # 10 pairs, 2 discordant: tau = (8 - 2) / 10
+            assert compute_reading_order_score(pred, ref) == 0.6
+
+    def test_count_ascending_pairs(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        expected = sum(
+            1 for i, j in itertools.combinations(range(len(values)), 2)
+            if values[i] < values[j]
+        )
+        assert _count_ascending_pairs(values) == expected
+        assert _count_ascending_pairs([]) == 0
+
+
+class TestNormalize:
+    def test_collapses_and_lowercases(self):
+        assert _normalize("  Total\tAmount \n") == "total amount"
+
+    def test_normalized_ascii_fast_path(self):
+        assert _normalize(" total amount ") == "total amount"
+        assert _normalize("a  b") == "a b"
+        assert _normalize("a\x1fb") == "a b"
+
+    def test_non_ascii(self):
+        assert _normalize("ИТОГО  Сумма") == "итого сумма"
+
+
+class TestPrecomputedReferences:
+    def test_table_f1_from_cells_matches(self):
+        ref = [[["Item", "Qty"], ["Widget", "10"]]]
+        for pred in ([], [[["item", "qty"]]], [[["Item", "Qty"], ["Widget", "10"]]]):
+            assert compute_table_f1_from_cells(pred, normalize_table_cells(ref)) == (
+                compute_table_f1(pred, ref)
+            )
+
+    def test_heading_f1_from_sets_matches(self):
+        ref = ["Introduction", "  Methods "]
+        for pred in ([], ["introduction"], ["Introduction", "Methods", "Extra"]):
+            assert compute_heading_f1_from_sets(pred, normalize_headings(ref)) == (
+                compute_heading_f1(pred, ref)
+            )
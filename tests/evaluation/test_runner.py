@@ -1,15 +1,26 @@
 """Tests for the evaluation runner."""
 
+import asyncio
 import json
 
 import pytest
+import pytest_asyncio
 
 from docfold.engines.base import DocumentEngine, EngineResult, OutputFormat
 from docfold.engines.router import EngineRouter
-from docfold.evaluation.runner import DocumentScore, EvaluationReport, EvaluationRunner
+from docfold.evaluation.runner import (
+    DocumentScore,
+    EvaluationReport,
+    EvaluationRunner,
+    NormalizedGT,
+)
 
 
 class StubEngine(DocumentEngine):
+    def __init__(self) -> None:
+        # The runner only reads results, so one instance per format is reused.
+        self._results: dict[OutputFormat, EngineResult] = {}
+
     @property
     def name(self) -> str:
         return "stub"
@@ -22,12 +33,35 @@ class StubEngine(DocumentEngine):
         return True
 
     async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
-        return EngineResult(
-            content="Hello world extracted text",
-            format=output_format,
-            engine_name=self.name,
-            processing_time_ms=42,
-        )
+        result = self._results.get(output_format)
+        if result is None:
+            result = self._results[output_format] = EngineResult(
+                content="Hello world extracted text",
+                format=output_format,
+                engine_name=self.name,
+                processing_time_ms=42,
+            )
+        return result
+
+
+# Stateless apart from its result cache, so one instance serves every test.
+_STUB = StubEngine()
+
+
+class SlowEngine(StubEngine):
+    """Tracks how many process() calls overlap."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.active = 0
+        self.peak = 0
+
+    async def process(self, file_path, output_format=OutputFormat.MARKDOWN, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return await super().process(file_path, output_format, **kwargs)
 
 
 class TestDocumentScore:
@@ -43,6 +77,24 @@ class TestDocumentScore:
         assert s.cer == 0.05
         assert s.error is None
 
+    def test_slotted(self):
+        s = DocumentScore("doc1", "test", "invoice")
+        assert not hasattr(s, "__dict__")
+        with pytest.raises(AttributeError):
+            s.unknown_metric = 1.0
+
+
+class TestNormalizedGT:
+    def test_from_ground_truth(self, tmp_path):
+        gt = NormalizedGT.from_ground_truth(
+            {"ground_truth": {"full_text": "x", "headings": ["  Bill  To "]}},
+            tmp_path / "inv_9.pdf",
+        )
+        assert gt.document_id == "inv_9"
+        assert gt.category == "unknown"
+        assert gt.headings == frozenset({"bill to"})
+        assert gt.table_cells is None
+
 
 class TestEvaluationReport:
     def test_to_dict(self):
@@ -57,6 +109,9 @@ class TestEvaluationReport:
         parsed = json.loads(j)
         assert parsed["timestamp"] == "2026-01-01"
 
+    def test_slotted(self):
+        assert not hasattr(EvaluationReport(), "__dict__")
+
     def test_with_scores(self):
         report = EvaluationReport(
             scores=[
@@ -66,57 +121,77 @@ class TestEvaluationReport:
         )
         d = report.to_dict()
         assert len(d["scores"]) == 2
+        assert d["scores"][0]["document_id"] == "d1"
+        assert d["scores"][1]["cer"] == 0.03
 
+    def test_compute_summaries(self):
+        summaries = EvaluationRunner._compute_summaries([
+            DocumentScore("d1", "eng1", "invoice", cer=0.1, wer=0.2, processing_time_ms=10),
+            DocumentScore("d2", "eng1", "invoice", cer=0.3, processing_time_ms=30),
+            DocumentScore("d3", "eng1", "invoice", error="boom", processing_time_ms=99),
+            DocumentScore("d1", "eng2", "invoice", processing_time_ms=5),
+            DocumentScore("d2", "eng3", "invoice", error="boom"),
+        ])
+        assert summaries["eng1"] == {
+            "avg_cer": pytest.approx(0.2),
+            "avg_wer": 0.2,
+            "avg_time_ms": 20,
+            "documents_evaluated": 2,
+        }
+        assert summaries["eng2"]["avg_cer"] == -1
+        assert summaries["eng2"]["avg_wer"] == -1
+        assert "eng3" not in summaries
 
-class TestEvaluationRunner:
-    @pytest.fixture
-    def dataset_dir(self, tmp_path):
-        """Create a minimal evaluation dataset."""
-        cat_dir = tmp_path / "invoices"
-        cat_dir.mkdir()
 
-        # Create a dummy document
-        doc = cat_dir / "inv_001.txt"
-        doc.write_text("Hello world extracted text")
+DATASET = [{
+    "path": "invoices/inv_001.txt",
+    "document_id": "inv_001",
+    "category": "invoice",
+    "ground_truth": {
+        "full_text": "Hello world extracted text",
+    },
+}]
 
-        # Create ground truth
-        gt = cat_dir / "inv_001.ground_truth.json"
-        gt.write_text(json.dumps({
-            "document_id": "inv_001",
-            "category": "invoice",
-            "ground_truth": {
-                "full_text": "Hello world extracted text",
-            }
-        }))
 
-        return tmp_path
+# Module-scoped: run() only reads the dataset.
+@pytest.fixture(scope="module")
+def runner():
+    return EvaluationRunner(EngineRouter([_STUB]), dataset=DATASET)
 
-    @pytest.fixture
-    def runner(self, dataset_dir):
-        router = EngineRouter([StubEngine()])
-        return EvaluationRunner(router, dataset_path=str(dataset_dir))
 
-    @pytest.mark.asyncio
-    async def test_run_produces_report(self, runner):
-        report = await runner.run()
-        assert isinstance(report, EvaluationReport)
-        assert len(report.scores) == 1
-        assert report.scores[0].engine_name == "stub"
-        assert report.scores[0].document_id == "inv_001"
+@pytest_asyncio.fixture(scope="module")
+async def base_report(runner):
+    """One unfiltered run of ``runner``, shared by the tests that only inspect it."""
+    return await runner.run()
 
-    @pytest.mark.asyncio
-    async def test_perfect_match_scores(self, runner):
-        report = await runner.run()
-        score = report.scores[0]
+
+def _multi_doc_dataset(n: int = 6) -> list[dict]:
+    return [
+        {
+            "path": f"invoices/inv_{i}.txt",
+            "document_id": f"inv_{i}",
+            "ground_truth": {"full_text": "Hello world extracted text"},
+        }
+        for i in range(n)
+    ]
+
+
+class TestEvaluationRunner:
+    def test_run_produces_report(self, base_report):
+        assert isinstance(base_report, EvaluationReport)
+        assert len(base_report.scores) == 1
+        assert base_report.scores[0].engine_name == "stub"
+        assert base_report.scores[0].document_id == "inv_001"
+
+    def test_perfect_match_scores(self, base_report):
+        score = base_report.scores[0]
         assert score.cer == 0.0
         assert score.wer == 0.0
         assert score.error is None
 
-    @pytest.mark.asyncio
-    async def test_engine_summaries(self, runner):
-        report = await runner.run()
-        assert "stub" in report.engine_summaries
-        summary = report.engine_summaries["stub"]
+    def test_engine_summaries(self, base_report):
+        assert "stub" in base_report.engine_summaries
+        summary = base_report.engine_summaries["stub"]
         assert summary["avg_cer"] == 0.0
         assert summary["documents_evaluated"] == 1
 
@@ -133,9 +208,89 @@ class TestEvaluationRunner:
         assert report.scores[0].error is not None
         assert "nonexistent" in report.scores[0].error
 
+    @pytest.mark.asyncio
+    async def test_run_from_dataset_path(self, tmp_path):
+        cat_dir = tmp_path / "invoices"
+        cat_dir.mkdir()
+        (cat_dir / "inv_001.txt").write_text("Hello world extracted text")
+        (cat_dir / "inv_001.ground_truth.json").write_text(json.dumps(DATASET[0]))
+
+        runner = EvaluationRunner(EngineRouter([_STUB]), dataset_path=str(tmp_path))
+        report = await runner.run(categories=["invoices"])
+        assert [(s.document_id, s.category, s.cer) for s in report.scores] == [
+            ("inv_001", "invoice", 0.0),
+        ]
+
+    def test_requires_exactly_one_source(self, tmp_path):
+        router = EngineRouter([_STUB])
+        with pytest.raises(ValueError, match="exactly one"):
+            EvaluationRunner(router)
+        with pytest.raises(ValueError, match="exactly one"):
+            EvaluationRunner(router, str(tmp_path), dataset=DATASET)
+
+    @pytest.mark.asyncio
+    async def test_dataset_category_filter(self, runner):
+        report = await runner.run(categories=["invoice"])
+        assert len(report.scores) == 1
+
     @pytest.mark.asyncio
     async def test_empty_dataset(self, tmp_path):
-        router = EngineRouter([StubEngine()])
+        router = EngineRouter([_STUB])
         runner = EvaluationRunner(router, dataset_path=str(tmp_path))
         report = await runner.run()
         assert len(report.scores) == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        engine = SlowEngine()
+        runner = EvaluationRunner(EngineRouter([engine]), dataset=_multi_doc_dataset())
+        report = await runner.run(concurrency=2)
+        assert len(report.scores) == 6
+        assert engine.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_by_default(self, monkeypatch):
+        monkeypatch.delenv("DOCFOLD_EVAL_CONCURRENCY", raising=False)
+        engine = SlowEngine()
+        runner = EvaluationRunner(EngineRouter([engine]), dataset=_multi_doc_dataset())
+        await runner.run()
+        assert engine.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_from_env(self, monkeypatch):
+        monkeypatch.setenv("DOCFOLD_EVAL_CONCURRENCY", "3")
+        engine = SlowEngine()
+        runner = EvaluationRunner(EngineRouter([engine]), dataset=_multi_doc_dataset())
+        await runner.run()
+        assert engine.peak == 3
+
+    def test_discover_ground_truth_pairs(self, tmp_path):
+        for category, stems in {"invoices": ["a", "b"], "papers": ["c"]}.items():
+            d = tmp_path / category
+            d.mkdir()
+            for stem in stems:
+                (d / f"{stem}.pdf").write_bytes(b"")
+                (d / f"{stem}.ground_truth.json").write_text("{}")
+        # Orphan ground truth and an unrelated document are ignored
+        (tmp_path / "invoices" / "orphan.ground_truth.json").write_text("{}")
+        (tmp_path / "papers" / "notes.txt").write_text("")
+
+        runner = EvaluationRunner(EngineRouter([_STUB]), dataset_path=str(tmp_path))
+        pairs = runner._discover_ground_truth(None)
+        assert [(d.name, g.name) for d, g in pairs] == [
+            ("a.pdf", "a.ground_truth.json"),
+            ("b.pdf", "b.ground_truth.json"),
+            ("c.pdf", "c.ground_truth.json"),
+        ]
+        assert [d.name for d, _ in runner._discover_ground_truth(["papers"])] == ["c.pdf"]
+
+    @pytest.mark.parametrize("suffix", ["/", "/sub/.."])
+    def test_discover_ground_truth_unnormalized_root(self, tmp_path, suffix):
+        root = tmp_path / "invoices"
+        (root / "sub").mkdir(parents=True)
+        (root / "a.pdf").write_bytes(b"")
+        (root / "a.ground_truth.json").write_text("{}")
+
+        runner = EvaluationRunner(EngineRouter([_STUB]), dataset_path=str(root) + suffix)
+        pairs = runner._discover_ground_truth(["invoices"])
+        assert [d.name for d, _ in pairs] == ["a.pdf"]
@@ -5,26 +5,40 @@ import json
 import pytest
 
 import docfold
-from docfold.cli import _build_router, main
+from docfold import cli
+from docfold.cli import _build_router, _make_parser, main
+
+
+@pytest.fixture(scope="module")
+def shared_router():
+    """One engine-discovery pass for the module.
+
+    Only tests that leave the router untouched may use it; ``convert``
+    narrows ``_allowed_engines`` on the router it gets.
+    """
+    return _build_router()
+
+
+@pytest.fixture(autouse=True)
+def cached_build_router(shared_router, monkeypatch):
+    """Make CLI commands reuse ``shared_router`` instead of rediscovering engines."""
+    monkeypatch.setattr(cli, "_build_router", lambda: shared_router)
 
 
 class TestBuildRouter:
-    def test_returns_router(self):
-        router = _build_router()
+    def test_returns_router(self, shared_router):
         # Should return a router even if no engines are available
         from docfold.engines.router import EngineRouter
-        assert isinstance(router, EngineRouter)
+        assert isinstance(shared_router, EngineRouter)
 
-    def test_engines_list_is_list(self):
-        router = _build_router()
-        engines = router.list_engines()
+    def test_engines_list_is_list(self, shared_router):
+        engines = shared_router.list_engines()
         assert isinstance(engines, list)
 
-    def test_registers_markitdown(self):
+    def test_registers_markitdown(self, shared_router):
         # The adapter lazy-imports markitdown, so registration must succeed
         # even when the dependency is missing; is_available() gates selection.
-        router = _build_router()
-        assert router.get("markitdown") is not None
+        assert shared_router.get("markitdown") is not None
 
 
 class TestMainNoArgs:
@@ -42,9 +56,11 @@ class TestMainEngines:
 
 
 class TestMainConvertArgs:
-    def test_convert_missing_file_arg(self):
-        with pytest.raises(SystemExit):
-            main(["convert"])  # no file arg -> argparse error
+    def test_convert_missing_file_arg(self, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            _make_parser().parse_args(["convert"])  # no file arg -> argparse error
+        assert exc_info.value.code == 2
+        assert "file" in capsys.readouterr().err
 
 
 class TestVersion:
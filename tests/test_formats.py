@@ -0,0 +1,54 @@
+"""Tests for the shared extension tables."""
+
+from pathlib import Path
+
+import pytest
+
+from docfold.formats import CATEGORY_MAP, MIME_MAP, classify, extension_of
+from docfold.preprocessing import detect_file_type
+from docfold.utils.pre_analysis import _analyze_sync
+
+
+class TestClassify:
+    def test_known_extension(self):
+        assert classify("xlsx") == (
+            "spreadsheet",
+            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        )
+
+    def test_category_without_mime(self):
+        assert classify("wav") == ("audio", None)
+
+    def test_unknown_extension(self):
+        assert classify("xyz") == ("unknown", None)
+
+    def test_every_mime_has_category(self):
+        assert set(MIME_MAP) <= set(CATEGORY_MAP)
+
+    def test_agrees_with_tables(self):
+        for ext, category in CATEGORY_MAP.items():
+            assert classify(ext) == (category, MIME_MAP.get(ext))
+
+
+class TestExtensionOf:
+    @pytest.mark.parametrize(
+        "path",
+        ["scan.PDF", "/data/a.tar.gz", ".bashrc", "README", "dir.d/file", "a.", "x/a..pdf"],
+    )
+    def test_matches_pathlib_suffix(self, path):
+        assert extension_of(path) == Path(path).suffix.lstrip(".").lower()
+
+
+class TestSharedTables:
+    def test_detector_and_pre_analysis_agree_on_mime(self, tmp_path):
+        for ext in ("xls", "rtf", "htm", "epub"):
+            f = tmp_path / f"file.{ext}"
+            f.write_bytes(b"")
+            assert detect_file_type(str(f)).mime_type == _analyze_sync(str(f)).mime_type
+
+    def test_pre_analysis_routing_categories(self, tmp_path):
+        expected = {"ods": "office", "odp": "office", "htm": "html", "wav": "unknown"}
+        for ext, category in expected.items():
+            f = tmp_path / f"file.{ext}"
+            f.write_bytes(b"")
+            assert _analyze_sync(str(f)).category == category
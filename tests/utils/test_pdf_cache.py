@@ -0,0 +1,113 @@
+"""Tests for the shared PyMuPDF document cache."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from docfold.utils import _pdf_cache
+from docfold.utils._pdf_cache import borrow_pdf, clear_pdf_cache, release_pdf
+
+pymupdf = pytest.importorskip("pymupdf")
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_pdf_cache()
+    yield
+    clear_pdf_cache()
+
+
+def _make_pdf(path, pages=1):
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"page {i}")
+    doc.save(str(path))
+    doc.close()
+
+
+class TestBorrowPdf:
+    def test_same_document_reused(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        _make_pdf(pdf)
+        with borrow_pdf(str(pdf)) as first:
+            pass
+        with borrow_pdf(str(pdf)) as second:
+            assert second is first
+            assert len(second) == 1
+
+    def test_modified_file_reopened(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        _make_pdf(pdf)
+        with borrow_pdf(str(pdf)) as first:
+            pass
+        _make_pdf(pdf, pages=3)
+        st = os.stat(pdf)
+        os.utime(pdf, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        with borrow_pdf(str(pdf)) as second:
+            assert second is not first
+            assert len(second) == 3
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_pdf_cache, "_MAX_OPEN_DOCUMENTS", 2)
+        for name in ("a", "b", "c"):
+            _make_pdf(tmp_path / f"{name}.pdf")
+            with borrow_pdf(str(tmp_path / f"{name}.pdf")):
+                pass
+        assert len(_pdf_cache._cache) == 2
+
+    def test_evicted_document_closed(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_pdf_cache, "_MAX_OPEN_DOCUMENTS", 1)
+        _make_pdf(tmp_path / "a.pdf")
+        _make_pdf(tmp_path / "b.pdf")
+        with borrow_pdf(str(tmp_path / "a.pdf")) as first:
+            pass
+        with borrow_pdf(str(tmp_path / "b.pdf")):
+            pass
+        assert first.is_closed
+
+    def test_release_closes_document(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        _make_pdf(pdf)
+        with borrow_pdf(str(pdf)) as first:
+            pass
+        release_pdf(str(pdf))
+        assert first.is_closed
+        os.remove(pdf)  # no longer held open
+        assert not _pdf_cache._cache
+
+    def test_clear_closes_documents(self, tmp_path):
+        _make_pdf(tmp_path / "a.pdf")
+        with borrow_pdf(str(tmp_path / "a.pdf")) as doc:
+            pass
+        clear_pdf_cache()
+        assert doc.is_closed
+
+    def test_release_during_borrow_defers_close(self, tmp_path):
+        pdf = tmp_path / "a.pdf"
+        _make_pdf(pdf)
+        with borrow_pdf(str(pdf)) as first:
+            release_pdf(str(pdf))
+            assert not first.is_closed
+            assert len(first[0].get_text()) > 0
+        assert first.is_closed
+
+        with borrow_pdf(str(pdf)) as second:
+            assert second is not first
+            assert not second.is_closed
+
+    def test_eviction_waits_for_other_borrower(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(_pdf_cache, "_MAX_OPEN_DOCUMENTS", 1)
+        _make_pdf(tmp_path / "a.pdf")
+        _make_pdf(tmp_path / "b.pdf")
+        with borrow_pdf(str(tmp_path / "a.pdf")) as first:
+            with borrow_pdf(str(tmp_path / "b.pdf")):
+                assert not first.is_closed
+            assert not first.is_closed
+        assert first.is_closed
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            with borrow_pdf(str(tmp_path / "missing.pdf")):
+                pass
@@ -4,7 +4,23 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
-from docfold.utils.pre_analysis import FileAnalysis, _analyze_sync, pre_analyze
+import pytest
+
+from docfold.utils import pre_analysis
+from docfold.utils.pre_analysis import (
+    FileAnalysis,
+    _analyze_sync,
+    pre_analyze,
+    pre_analyze_directory,
+    pre_analyze_many,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    pre_analysis.clear_cache()
+    yield
+    pre_analysis.clear_cache()
 
 
 class TestFileAnalysis:
@@ -37,6 +53,10 @@ class TestFileAnalysis:
         assert fa.has_text_layer is None
         assert fa.detected_language is None
 
+    def test_slotted(self):
+        fa = FileAnalysis("image/png", "png", 512, "image")
+        assert not hasattr(fa, "__dict__")
+
 
 class TestPreAnalyzeImages:
     def test_png_image(self, tmp_path):
@@ -164,28 +184,50 @@ class TestPreAnalyzeUnknown:
         assert result.extension == ""
 
 
-class TestPreAnalyzePdf:
-    def test_text_pdf(self, tmp_path):
-        """PDF with text layer → pdf_text."""
-        # Create a mock pymupdf module
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "A" * 200  # > 100 chars threshold
+class _FakePage:
+    """Minimal stand-in for ``pymupdf.Page``."""
 
-        mock_doc = MagicMock()
-        mock_doc.__len__ = lambda self: 3
-        mock_doc.__getitem__ = lambda self, i: mock_page
-        mock_doc.close = MagicMock()
+    def __init__(self, text):
+        self._text = text
+        self.calls = 0
 
-        pdf_file = tmp_path / "text.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
+    def get_text(self, *args, **kwargs):
+        self.calls += 1
+        return self._text
+
+
+class _FakeDoc:
+    """Minimal stand-in for ``pymupdf.Document``."""
+
+    def __init__(self, pages):
+        self._pages = pages
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __getitem__(self, i):
+        return self._pages[i]
+
+    def close(self):
+        pass
+
+
+def _analyze_fake_pdf(tmp_path, doc, name="sample.pdf", **modules):
+    """Run ``_analyze_pdf`` with ``pymupdf.open`` returning *doc*."""
+    pdf_file = tmp_path / name
+    pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
 
-        with patch("docfold.utils.pre_analysis.pymupdf", create=True) as mock_pymupdf:
-            # Patch the import inside the function
-            import docfold.utils.pre_analysis as mod
+    pymupdf = MagicMock()
+    pymupdf.open.return_value = doc
+    with patch.dict("sys.modules", {"pymupdf": pymupdf, **modules}):
+        return pre_analysis._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
 
-            with patch.dict("sys.modules", {"pymupdf": mock_pymupdf}):
-                mock_pymupdf.open.return_value = mock_doc
-                result = mod._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
+
+class TestPreAnalyzePdf:
+    def test_text_pdf(self, tmp_path):
+        """PDF with text layer → pdf_text."""
+        page = _FakePage("A" * 200)  # > 100 chars threshold
+        result = _analyze_fake_pdf(tmp_path, _FakeDoc([page] * 3), "text.pdf")
 
         assert result.category == "pdf_text"
         assert result.has_text_layer is True
@@ -193,37 +235,29 @@ class TestPreAnalyzePdf:
 
     def test_scanned_pdf(self, tmp_path):
         """PDF without text layer → pdf_scanned."""
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "ab"  # ≤ 100 chars
-
-        mock_doc = MagicMock()
-        mock_doc.__len__ = lambda self: 1
-        mock_doc.__getitem__ = lambda self, i: mock_page
-        mock_doc.close = MagicMock()
-
-        pdf_file = tmp_path / "scanned.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
-
-        import docfold.utils.pre_analysis as mod
-
-        with patch.dict("sys.modules", {"pymupdf": MagicMock()}) as modules:
-            modules["pymupdf"].open.return_value = mock_doc
-            result = mod._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
+        page = _FakePage("ab")  # ≤ 100 chars
+        result = _analyze_fake_pdf(tmp_path, _FakeDoc([page]), "scanned.pdf")
 
         assert result.category == "pdf_scanned"
         assert result.has_text_layer is False
         assert result.page_count == 1
 
+    def test_sampling_stops_once_threshold_reached(self, tmp_path):
+        """A text-rich first page is enough; later pages are not extracted."""
+        first, second = _FakePage("A" * 200), _FakePage("")
+        result = _analyze_fake_pdf(tmp_path, _FakeDoc([first, second]), "rich.pdf")
+
+        assert result.category == "pdf_text"
+        assert second.calls == 0
+
     def test_pdf_without_pymupdf(self, tmp_path):
         """Without pymupdf installed, falls back to pdf_text category."""
         pdf_file = tmp_path / "fallback.pdf"
         pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
 
-        import docfold.utils.pre_analysis as mod
-
         # Simulate pymupdf not being available by patching the import to raise ImportError
         with patch.dict("sys.modules", {"pymupdf": None}):
-            result = mod._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
+            result = pre_analysis._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
 
         # Without pymupdf, we can't analyze → defaults
         assert result.category == "pdf_text"  # default
@@ -239,50 +273,102 @@ class TestPreAnalyzePdf:
 
     def test_pdf_page_count(self, tmp_path):
         """Page count is correctly extracted from multi-page PDF."""
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "A" * 200
+        page = _FakePage("A" * 200)
+        result = _analyze_fake_pdf(tmp_path, _FakeDoc([page] * 10), "multipage.pdf")
+
+        assert result.page_count == 10
 
-        mock_doc = MagicMock()
-        mock_doc.__len__ = lambda self: 10
-        mock_doc.__getitem__ = lambda self, i: mock_page
-        mock_doc.close = MagicMock()
 
-        pdf_file = tmp_path / "multipage.pdf"
+class TestAnalysisCache:
+    def test_repeat_query_is_cached(self, tmp_path):
+        f = tmp_path / "scan.png"
+        f.write_bytes(b"\x89PNG" + b"\x00" * 10)
+
+        with patch.object(pre_analysis, "classify", wraps=pre_analysis.classify) as classify:
+            first = _analyze_sync(str(f))
+            second = _analyze_sync(str(f))
+
+        assert classify.call_count == 1
+        assert first == second
+
+    def test_modified_file_is_reanalyzed(self, tmp_path):
+        f = tmp_path / "scan.png"
+        f.write_bytes(b"\x89PNG")
+        assert _analyze_sync(str(f)).file_size_bytes == 4
+
+        f.write_bytes(b"\x89PNG" + b"\x00" * 10)
+        assert _analyze_sync(str(f)).file_size_bytes == 14
+
+    def test_results_are_independent_copies(self, tmp_path):
+        f = tmp_path / "scan.png"
+        f.write_bytes(b"\x89PNG")
+
+        first = _analyze_sync(str(f))
+        first.category = "tampered"
+
+        assert _analyze_sync(str(f)).category == "image"
+
+    @pytest.mark.parametrize(
+        "pymupdf", [None, MagicMock(**{"open.side_effect": RuntimeError("boom")})],
+        ids=["pymupdf_missing", "analysis_error"],
+    )
+    def test_fallback_not_cached(self, tmp_path, pymupdf):
+        pdf_file = tmp_path / "a.pdf"
         pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
 
-        import docfold.utils.pre_analysis as mod
+        with patch.dict("sys.modules", {"pymupdf": pymupdf}):
+            assert _analyze_sync(str(pdf_file)).page_count is None
 
-        with patch.dict("sys.modules", {"pymupdf": MagicMock()}) as modules:
-            modules["pymupdf"].open.return_value = mock_doc
-            result = mod._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
+        working = MagicMock()
+        working.open.return_value = _FakeDoc([_FakePage("A" * 200)] * 2)
+        with patch.dict("sys.modules", {"pymupdf": working}):
+            result = _analyze_sync(str(pdf_file))
+        assert result.page_count == 2
+        assert result.category == "pdf_text"
 
-        assert result.page_count == 10
+    def test_clear_cache(self, tmp_path):
+        f = tmp_path / "scan.png"
+        f.write_bytes(b"\x89PNG")
+
+        with patch.object(pre_analysis, "classify", wraps=pre_analysis.classify) as classify:
+            _analyze_sync(str(f))
+            pre_analysis.clear_cache()
+            _analyze_sync(str(f))
+
+        assert classify.call_count == 2
 
 
 class TestPreAnalyzeLanguageDetection:
     def test_without_langdetect(self, tmp_path):
         """Without langdetect installed, detected_language is None."""
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Hello world " * 50
+        doc = _FakeDoc([_FakePage("Hello world " * 50)])
+        result = _analyze_fake_pdf(tmp_path, doc, "english.pdf", langdetect=None)
 
-        mock_doc = MagicMock()
-        mock_doc.__len__ = lambda self: 1
-        mock_doc.__getitem__ = lambda self, i: mock_page
-        mock_doc.close = MagicMock()
-
-        pdf_file = tmp_path / "english.pdf"
-        pdf_file.write_bytes(b"%PDF-1.4" + b"\x00" * 100)
+        # langdetect not available → None
+        assert result.detected_language is None
 
-        import docfold.utils.pre_analysis as mod
+    def _analyze_with_langdetect(self, tmp_path, page_text):
+        langdetect = MagicMock()
+        langdetect.detect.return_value = "en"
+        doc = _FakeDoc([_FakePage(page_text)])
+        result = _analyze_fake_pdf(tmp_path, doc, langdetect=langdetect)
+        return result, langdetect.detect
 
-        with (
-            patch.dict("sys.modules", {"pymupdf": MagicMock(), "langdetect": None}) as modules,
-        ):
-            modules["pymupdf"].open.return_value = mock_doc
-            result = mod._analyze_pdf(str(pdf_file), "pdf", "application/pdf", 108)
+    def test_short_sample_skips_detection(self, tmp_path):
+        """Text layers under 200 chars are too short to classify."""
+        result, detect = self._analyze_with_langdetect(tmp_path, "A" * 150)
 
-        # langdetect not available → None
+        assert result.has_text_layer is True
         assert result.detected_language is None
+        detect.assert_not_called()
+
+    def test_long_sample_truncated(self, tmp_path):
+        """Only the first 1000 chars are handed to langdetect."""
+        result, detect = self._analyze_with_langdetect(tmp_path, "Hello world " * 500)
+
+        assert result.detected_language == "en"
+        (sample,), _ = detect.call_args
+        assert len(sample) == 1000
 
 
 class TestPreAnalyzeAsync:
@@ -295,3 +381,41 @@ class TestPreAnalyzeAsync:
         assert result.category == "image"
         assert result.extension == "png"
         assert isinstance(result, FileAnalysis)
+
+    async def test_many_preserves_order(self, tmp_path):
+        names = ["a.png", "b.html", "c.csv", "d.xyz"]
+        for name in names:
+            (tmp_path / name).write_bytes(b"\x00" * 10)
+
+        results = await pre_analyze_many(
+            [str(tmp_path / n) for n in names], concurrency=2,
+        )
+        assert [r.extension for r in results] == ["png", "html", "csv", "xyz"]
+
+    async def test_many_empty(self):
+        assert await pre_analyze_many([]) == []
+
+    async def test_many_propagates_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await pre_analyze_many([str(tmp_path / "missing.pdf")])
+
+    async def test_directory(self, tmp_path):
+        (tmp_path / "b.html").write_bytes(b"<html></html>")
+        (tmp_path / "a.png").write_bytes(b"\x89PNG")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "c.csv").write_bytes(b"x,y")
+
+        results = await pre_analyze_directory(str(tmp_path))
+
+        assert list(results) == [str(tmp_path / "a.png"), str(tmp_path / "b.html")]
+        assert results[str(tmp_path / "a.png")].category == "image"
+        assert results[str(tmp_path / "b.html")].file_size_bytes == 13
+
+    async def test_directory_shares_cache(self, tmp_path):
+        f = tmp_path / "a.png"
+        f.write_bytes(b"\x89PNG")
+        await pre_analyze_directory(str(tmp_path))
+
+        with patch.object(pre_analysis, "classify") as classify:
+            assert _analyze_sync(str(f)).category == "image"
+        classify.assert_not_called()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from docfold.engines.base import EngineResult, OutputFormat
 from docfold.utils.quality import QualityThresholds, gibberish_ratio, quality_ok
 
@@ -81,6 +83,30 @@ class TestQualityOk:
         result = _make_result(content=text)
         assert quality_ok(result) is True
 
+    @pytest.mark.parametrize(
+        ("content", "confidence"),
+        [("short", None), ("   " + "A" * 10 + " " * 60, None), ("A" * 100, 0.1)],
+        ids=["too_short", "short_after_strip", "low_confidence"],
+    )
+    def test_rejection_skips_gibberish_scan(self, monkeypatch, content, confidence):
+        from docfold.utils import quality
+
+        def _fail(text):
+            raise AssertionError("gibberish_ratio should not run")
+
+        monkeypatch.setattr(quality, "gibberish_ratio", _fail)
+        assert quality_ok(_make_result(content=content, confidence=confidence)) is False
+
+    @pytest.mark.parametrize(
+        "text",
+        ["abc", " abc", "abc\n", "\u3000abc\u2029", "a b", "\x1cabc"],
+        ids=["bare", "leading", "trailing", "unicode_space", "inner_space", "separator"],
+    )
+    def test_stripped_length_matches_strip(self, text):
+        from docfold.utils.quality import _stripped_length
+
+        assert _stripped_length(text) == len(text.strip())
+
 
 class TestQualityOkCustomThresholds:
     def test_custom_min_text_length(self):
@@ -114,6 +140,47 @@ class TestQualityOkCustomThresholds:
         assert quality_ok(result, thresholds) is False  # Too short
 
 
+class TestCompiledThresholds:
+    @pytest.mark.parametrize(
+        "thresholds",
+        [
+            QualityThresholds(),
+            QualityThresholds(min_text_length=10, ocr_confidence_min=0.5),
+            QualityThresholds(min_text_length=200, gibberish_ratio_max=0.01),
+        ],
+        ids=["default", "lenient", "strict"],
+    )
+    def test_matches_quality_ok(self, thresholds):
+        check = thresholds.compile()
+        results = [
+            _make_result(content=""),
+            _make_result(content="Hello world!"),
+            _make_result(content="   " + "A" * 20 + " " * 60),
+            _make_result(content="A" * 100, confidence=0.6),
+            _make_result(content="A" * 100, confidence=0.9),
+            _make_result(content="A" * 100 + "\u2500" * 50 + "B" * 50),
+            _make_result(content="The quick brown fox. " * 20),
+        ]
+        for result in results:
+            assert check(result) is quality_ok(result, thresholds)
+
+    def test_snapshot_of_thresholds(self):
+        thresholds = QualityThresholds(min_text_length=10)
+        check = thresholds.compile()
+        thresholds.min_text_length = 1000
+
+        assert check(_make_result(content="Hello world!")) is True
+
+    def test_rejection_skips_gibberish_scan(self, monkeypatch):
+        from docfold.utils import quality
+
+        def _fail(text):
+            raise AssertionError("gibberish_ratio should not run")
+
+        monkeypatch.setattr(quality, "gibberish_ratio", _fail)
+        assert QualityThresholds().compile()(_make_result(content="short")) is False
+
+
 class TestQualityThresholdsFromEnv:
     def test_env_vars_read(self, monkeypatch):
         monkeypatch.setenv("DOCFOLD_QUALITY_MIN_TEXT_LENGTH", "100")
@@ -147,6 +214,17 @@ class TestQualityThresholdsFromEnv:
         assert t.ocr_confidence_min == 0.8  # default
         assert t.gibberish_ratio_max == 0.3  # default
 
+    def test_cached_parse_tracks_env_changes(self, monkeypatch):
+        monkeypatch.setenv("DOCFOLD_QUALITY_MIN_TEXT_LENGTH", "10")
+        first = QualityThresholds.from_env()
+        monkeypatch.setenv("DOCFOLD_QUALITY_MIN_TEXT_LENGTH", "20")
+        assert QualityThresholds.from_env().min_text_length == 20
+        monkeypatch.setenv("DOCFOLD_QUALITY_MIN_TEXT_LENGTH", "10")
+        again = QualityThresholds.from_env()
+        # Same values, but callers still get their own (mutable) instance.
+        assert again == first
+        assert again is not first
+
 
 class TestGibberishRatio:
     def test_empty_string(self):
@@ -191,3 +269,59 @@ class TestGibberishRatio:
         bad = "\x00" * 20  # 20 control chars
         ratio = gibberish_ratio(normal + bad)
         assert abs(ratio - 0.2) < 0.01
+
+    def test_private_use_and_surrogates(self):
+        """BMP private-use and lone surrogates count as gibberish."""
+        assert gibberish_ratio("ab\ue000\ud800") == 0.5
+
+    def test_astral_characters(self):
+        """Astral private-use counts; astral letters and emoji do not."""
+        assert gibberish_ratio("\U000f0000x") == 0.5
+        assert gibberish_ratio("\U0001d400\U0001f600") == 0.0
+
+    def test_bitset_matches_per_char_classification(self):
+        """Every BMP code point is counted exactly when the bitset marks it."""
+        import unicodedata
+
+        from docfold.utils.quality import _gibberish_bitset
+
+        bits = _gibberish_bitset()
+        for cp in range(0, 0x10000, 7):
+            ch = chr(cp)
+            expected = ch not in "\n\r\t " and (
+                unicodedata.category(ch) in {"Cc", "Cs", "Cn", "Co"} or 0x2500 <= cp <= 0x25FF
+            )
+            assert bool((bits[cp >> 3] >> (cp & 7)) & 1) is expected
+            assert gibberish_ratio(ch) == float(expected)
+
+    def test_numpy_path_matches_regex_path(self, monkeypatch):
+        """Long texts take the NumPy path; counts agree with the regex scan."""
+        pytest.importorskip("numpy")
+        from docfold.utils import quality
+
+        text = ("Invoice № 42 ▒▓ total\x01\t€ 中文 \ud800 \U000f0000\U0001f600 ") * 40
+        assert len(text) >= quality._NUMPY_MIN_LENGTH
+        fast = gibberish_ratio(text)
+        monkeypatch.setattr(quality, "np", None)
+        assert gibberish_ratio(text) == fast > 0.0
+
+    def test_numba_kernel_matches_numpy_gather(self, monkeypatch):
+        """The numba loop and the NumPy gather count the same characters."""
+        pytest.importorskip("numba")
+        from docfold.utils import quality
+
+        text = ("Invoice № 42 ▒▓ total\x01\t€ 中文 \ud800 \U000f0000\U0001f600 ") * 40
+        bmp_only = text.replace("\U000f0000", "").replace("\U0001f600", "")
+        compiled = [quality._gibberish_count_numpy(t) for t in (text, bmp_only)]
+        monkeypatch.setattr(quality, "_numba_gibberish_count", lambda: None)
+        assert [quality._gibberish_count_numpy(t) for t in (text, bmp_only)] == compiled
+
+    def test_ascii_fast_path_matches_bitset(self):
+        """The ASCII shortcut counts exactly the bitset's gibberish bytes."""
+        from docfold.utils.quality import _gibberish_bitset
+
+        bits = _gibberish_bitset()
+        text = "".join(map(chr, range(128)))
+        expected = sum((bits[b >> 3] >> (b & 7)) & 1 for b in range(128))
+        assert gibberish_ratio(text) == expected / 128
+        assert gibberish_ratio("\x0b\x0c\x7f plain") == 3 / 9